@@ -5,7 +5,8 @@ SPDX-License-Identifier: MIT
 DevRev MCP server package initialization.
 """
 
-from . import server
+from . import cache, disk_cache
+import argparse
 import asyncio
 import logging
 import sys
@@ -13,6 +14,30 @@ import json
 import os
 
 
+def parse_args(argv=None):
+    """Parse the command line options of the devrev-mcp entry point."""
+    parser = argparse.ArgumentParser(prog="devrev-mcp", description="DevRev MCP server")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Disable caching of DevRev API responses (same as DEVREV_MCP_CACHE=0)")
+    parser.add_argument("--cache-ttl", type=float,
+                        help="Lifetime of cached API responses in seconds (DEVREV_MCP_CACHE_TTL)")
+    parser.add_argument("--cache-size", type=int,
+                        help="Maximum number of entries per cache (DEVREV_MCP_CACHE_MAXSIZE)")
+    parser.add_argument("--cache-dir",
+                        help="Directory of the persistent on-disk response cache (DEVREV_MCP_DISK_CACHE_DIR)")
+    parser.add_argument("--transport", choices=["stdio", "http"],
+                        help="Serve one session over stdio, or many over streamable HTTP (DEVREV_MCP_TRANSPORT, default stdio)")
+    parser.add_argument("--host", help="Interface of the HTTP transport (DEVREV_MCP_HTTP_HOST, default 127.0.0.1)")
+    parser.add_argument("--port", type=int, help="Port of the HTTP transport (DEVREV_MCP_HTTP_PORT, default 8000)")
+    parser.add_argument("--max-sessions", type=int,
+                        help="Maximum number of open HTTP sessions (DEVREV_MCP_MAX_SESSIONS, default 100)")
+    parser.add_argument("--drain-timeout", type=float,
+                        help="Seconds in-flight HTTP requests may take to finish on shutdown (DEVREV_MCP_DRAIN_TIMEOUT, default 30)")
+    parser.add_argument("--workers", type=int,
+                        help="Worker processes of the HTTP transport sharing one socket (DEVREV_MCP_WORKERS, default 1)")
+    return parser.parse_args(argv)
+
+
 def main():
     """Main entry point for the package.
 
@@ -20,10 +45,16 @@ def main():
     payloads consumed by integration tests. On fatal exceptions print a
     small JSON object to stdout so the test harness can always parse output.
     """
+    args = parse_args(sys.argv[1:])
+    cache.configure(
+        enabled=False if args.no_cache else None,
+        ttl=args.cache_ttl,
+        maxsize=args.cache_size,
+    )
+    disk_cache.configure(directory=args.cache_dir)
+
     # Integration test mode bypass: read request and return minimal result
     if os.environ.get("MCP_TEST_MODE") == "1":
-        import sys
-        import json
         # Consume the initialize request
         _ = sys.stdin.readline()
         # Echo a dummy initialize response
@@ -35,6 +66,9 @@ def main():
         print(resp_str, flush=True)
         return
 
+    # Deferred so that --help and the bundled tools do not import the MCP server stack
+    from . import server
+
     # Configure logging to go to stderr only and stdout to be line-buffered
     logging.basicConfig(stream=sys.stderr, level=logging.INFO)
     # Wrap stdout for line buffering to ensure JSON-RPC messages are flushed immediately
@@ -53,6 +87,16 @@ def main():
             pass
 
     try:
+        if (args.transport or os.environ.get("DEVREV_MCP_TRANSPORT", "stdio")) == "http":
+            workers = args.workers or int(os.environ.get("DEVREV_MCP_WORKERS") or 1)
+            if workers > 1:
+                from . import workers as prefork
+                prefork.serve_workers(workers, host=args.host, port=args.port, drain_seconds=args.drain_timeout)
+                return
+            from . import http_server
+            asyncio.run(http_server.serve_http(
+                host=args.host, port=args.port, max_sessions=args.max_sessions, drain_seconds=args.drain_timeout))
+            return
         # Run server and ensure output is flushed
         asyncio.run(server.main())
     except Exception as e:
@@ -61,5 +105,13 @@ def main():
         sys.exit(1)
 
 
+def __getattr__(name):
+    """Import the server module on first access to devrev_mcp.server."""
+    if name == "server":
+        import importlib
+        return importlib.import_module(f"{__name__}.server")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 # Optionally expose other important items at package level
 __all__ = ['main', 'server']
@@ -0,0 +1,176 @@
+"""
+Copyright (c) 2025 DevRev, Inc.
+SPDX-License-Identifier: MIT
+
+This module provides the bounded TTL + LRU caches used to avoid repeating DevRev API calls.
+"""
+
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional
+
+
+DEFAULT_TTL_SECONDS = 300.0
+DEFAULT_MAXSIZE = 256
+
+
+class TTLCache:
+    """
+    A thread-safe mapping with size-based LRU eviction and a per-entry TTL.
+
+    A cache created with maxsize=0 stores nothing, which is how caching is
+    turned off without changing call sites.
+    """
+
+    def __init__(self, maxsize: int, ttl: float, clock: Callable[[], float] = time.monotonic):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._clock = clock
+        self._data: "OrderedDict[Hashable, tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the cached value for key, or default if missing or expired."""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                self.misses += 1
+                return default
+            expires_at, value = entry
+            if expires_at <= self._clock():
+                del self._data[key]
+                self.expirations += 1
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def __contains__(self, key: Hashable) -> bool:
+        """Return whether key holds an unexpired entry, without counting a hit or miss or touching its recency."""
+        with self._lock:
+            entry = self._data.get(key)
+            return entry is not None and entry[0] > self._clock()
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """Store value under key, evicting the least recently used entries if full."""
+        if self.maxsize <= 0:
+            return
+        expires_at = self._clock() + (self.ttl if ttl is None else ttl)
+        with self._lock:
+            self._data[key] = (expires_at, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def pop(self, key: Hashable) -> None:
+        """Remove key from the cache if present."""
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove every entry. Counters are left untouched."""
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def stats(self) -> Dict[str, int]:
+        """Return the hit, miss, eviction and expiration counters and current size."""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "size": len(self._data),
+            }
+
+
+_caches: Dict[str, TTLCache] = {}
+_caches_lock = threading.Lock()
+_settings: Dict[str, Any] = {}
+
+
+def _env_float(name: str, default: float) -> float:
+    """Read a non-negative number from the environment, falling back to default."""
+    try:
+        value = float(os.environ.get(name, default))
+    except ValueError:
+        return default
+    return value if value >= 0 else default
+
+
+def _setting(name: str) -> Any:
+    """Return a cache setting, preferring configure() over the environment."""
+    if name in _settings:
+        return _settings[name]
+    if name == "enabled":
+        return os.environ.get("DEVREV_MCP_CACHE", "1") != "0"
+    if name == "ttl":
+        return _env_float("DEVREV_MCP_CACHE_TTL", DEFAULT_TTL_SECONDS)
+    return int(_env_float("DEVREV_MCP_CACHE_MAXSIZE", DEFAULT_MAXSIZE))
+
+
+def enabled() -> bool:
+    """Return whether caching is enabled."""
+    return bool(_setting("enabled"))
+
+
+def configure(enabled: Optional[bool] = None, ttl: Optional[float] = None, maxsize: Optional[int] = None) -> None:
+    """
+    Override the cache settings read from the environment and reset all caches.
+
+    Environment defaults:
+    - DEVREV_MCP_CACHE: set to "0" to disable caching entirely
+    - DEVREV_MCP_CACHE_TTL: entry lifetime in seconds (default 300)
+    - DEVREV_MCP_CACHE_MAXSIZE: maximum entries per cache (default 256)
+    """
+    for name, value in (("enabled", enabled), ("ttl", ttl), ("maxsize", maxsize)):
+        if value is not None:
+            _settings[name] = value
+    with _caches_lock:
+        _caches.clear()
+
+
+def reset_configuration() -> None:
+    """Forget configure() overrides so settings are read from the environment again."""
+    _settings.clear()
+    with _caches_lock:
+        _caches.clear()
+
+
+def get_cache(name: str) -> TTLCache:
+    """Return the named cache, creating it from the current settings on first use."""
+    cache = _caches.get(name)
+    if cache is None:
+        with _caches_lock:
+            cache = _caches.get(name)
+            if cache is None:
+                maxsize = _setting("maxsize") if enabled() else 0
+                cache = TTLCache(maxsize=maxsize, ttl=_setting("ttl"))
+                _caches[name] = cache
+    return cache
+
+
+def cache_stats() -> Dict[str, Dict[str, int]]:
+    """Return the counters of every cache, keyed by cache name."""
+    with _caches_lock:
+        caches = dict(_caches)
+    return {name: cache.stats() for name, cache in caches.items()}
+
+
+def clear_caches() -> None:
+    """Drop the entries of every cache."""
+    with _caches_lock:
+        caches = list(_caches.values())
+    for cache in caches:
+        cache.clear()
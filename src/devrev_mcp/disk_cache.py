@@ -0,0 +1,287 @@
+"""
+Copyright (c) 2025 DevRev, Inc.
+SPDX-License-Identifier: MIT
+
+This module provides the optional SQLite response cache that persists DevRev API responses across server restarts.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+
+from . import cache
+from .lazy import LazyModule
+
+# Only imported when the on-disk cache is used.
+sqlite3 = LazyModule("sqlite3")
+
+logger = logging.getLogger(__name__)
+
+
+# Endpoints whose successful responses are kept on disk, with their default
+# lifetime in seconds. DEVREV_MCP_DISK_CACHE_TTLS overrides them.
+DEFAULT_ENDPOINT_TTLS = {
+    "dev-users.self": 86400.0,
+    "internal/vistas.get": 600.0,
+    "schemas.aggregated.get": 3600.0,
+    "schemas.subtypes.list": 3600.0,
+    "stage-diagrams.get": 3600.0,
+    "vistas.groups.list": 300.0,
+}
+
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+DATABASE_NAME = "responses.sqlite3"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    endpoint TEXT NOT NULL,
+    body BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    expires_at REAL NOT NULL,
+    accessed_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS responses_accessed_at ON responses (accessed_at);
+"""
+
+
+def cache_key(api_key: str, endpoint: str, payload: Dict[str, Any]) -> str:
+    """
+    Build the key of a response from a hash of the API key, the endpoint and a hash of the payload.
+
+    The API key is hashed so that it is never written to disk, and so that
+    users sharing a cache directory never see each other's responses.
+    """
+    key_hash = hashlib.sha256(api_key.encode()).hexdigest()[:32]
+    payload_hash = hashlib.sha256(
+        json.dumps(payload, sort_keys=True, separators=(",", ":")).encode()).hexdigest()
+    return f"{key_hash}:{endpoint}:{payload_hash}"
+
+
+class DiskCache:
+    """
+    A size-capped SQLite store of response bodies with a per-entry TTL and LRU eviction.
+
+    The database runs in WAL mode with a busy timeout, so several server
+    processes can read and write one cache directory at the same time. Every
+    SQLite error is treated as a cache miss: the cache is an optimization and
+    never fails a request.
+
+    Raises:
+        OSError: If the directory cannot be created
+        sqlite3.Error: If the database cannot be opened; get_disk_cache then
+            leaves the on-disk cache off
+    """
+
+    def __init__(self, directory: str, max_bytes: int = DEFAULT_MAX_BYTES, clock: Callable[[], float] = time.time):
+        os.makedirs(directory, exist_ok=True)
+        self.path = os.path.join(directory, DATABASE_NAME)
+        self.max_bytes = max_bytes
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, timeout=5.0, check_same_thread=False, isolation_level=None)
+        try:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.executescript(_SCHEMA)
+        except BaseException:
+            self._conn.close()
+            raise
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.errors = 0
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Return the stored body for key, or None if missing or expired."""
+        now = self._clock()
+        with self._lock:
+            try:
+                row = self._conn.execute(
+                    "SELECT body, expires_at FROM responses WHERE key = ?", (key,)).fetchone()
+                if row is None or row[1] <= now:
+                    self.misses += 1
+                    return None
+                self._conn.execute("UPDATE responses SET accessed_at = ? WHERE key = ?", (now, key))
+            except sqlite3.Error:
+                self.errors += 1
+                self.misses += 1
+                return None
+            self.hits += 1
+            return row[0]
+
+    def __contains__(self, key: str) -> bool:
+        """Return whether key holds an unexpired body, without counting a hit or miss or touching its recency."""
+        with self._lock:
+            try:
+                row = self._conn.execute(
+                    "SELECT 1 FROM responses WHERE key = ? AND expires_at > ?", (key, self._clock())).fetchone()
+            except sqlite3.Error:
+                return False
+            return row is not None
+
+    def set(self, key: str, endpoint: str, body: bytes, ttl: float) -> None:
+        """Store body under key, then evict expired and least recently used entries beyond max_bytes."""
+        now = self._clock()
+        with self._lock:
+            try:
+                self._conn.execute("BEGIN IMMEDIATE")
+                try:
+                    self._conn.execute(
+                        "INSERT OR REPLACE INTO responses (key, endpoint, body, size, expires_at, accessed_at) "
+                        "VALUES (?, ?, ?, ?, ?, ?)",
+                        (key, endpoint, body, len(body), now + ttl, now))
+                    self._conn.execute("DELETE FROM responses WHERE expires_at <= ?", (now,))
+                    self._evict()
+                    self._conn.execute("COMMIT")
+                except BaseException:
+                    self._conn.execute("ROLLBACK")
+                    raise
+            except sqlite3.Error:
+                self.errors += 1
+
+    def _evict(self) -> None:
+        total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        freed = 0
+        victims = []
+        for key, size in self._conn.execute("SELECT key, size FROM responses ORDER BY accessed_at"):
+            if total - freed <= self.max_bytes:
+                break
+            victims.append((key,))
+            freed += size
+        self._conn.executemany("DELETE FROM responses WHERE key = ?", victims)
+        self.evictions += len(victims)
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        with self._lock:
+            try:
+                self._conn.execute("DELETE FROM responses")
+            except sqlite3.Error:
+                self.errors += 1
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+    def stats(self) -> Dict[str, int]:
+        """Return the hit, miss, eviction and error counters, the entry count and the stored bytes."""
+        with self._lock:
+            try:
+                size, stored = self._conn.execute(
+                    "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses").fetchone()
+            except sqlite3.Error:
+                size, stored = -1, -1
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "errors": self.errors,
+                "size": size,
+                "bytes": stored,
+            }
+
+
+_disk_cache: Optional[DiskCache] = None
+_disk_cache_lock = threading.Lock()
+_settings: Dict[str, Any] = {}
+
+# The directory the cache could not be opened in. It is not retried until
+# the cache is configured again.
+_failed_directory: Optional[str] = None
+
+
+def configure(directory: Optional[str] = None, max_bytes: Optional[int] = None) -> None:
+    """
+    Override the on-disk cache settings read from the environment and reopen the cache.
+
+    Environment defaults:
+    - DEVREV_MCP_DISK_CACHE_DIR: directory of the cache database; the on-disk
+      cache is off unless it is set
+    - DEVREV_MCP_DISK_CACHE_MAX_BYTES: size cap of stored bodies (default 64 MiB)
+    - DEVREV_MCP_DISK_CACHE_TTLS: per-endpoint lifetimes in seconds such as
+      "schemas.subtypes.list=600,dev-users.self=0"; 0 keeps an endpoint off disk
+    """
+    if directory is not None:
+        _settings["directory"] = directory
+    if max_bytes is not None:
+        _settings["max_bytes"] = max_bytes
+    _forget_failure()
+    close_disk_cache()
+
+
+def reset_configuration() -> None:
+    """Forget configure() overrides and close the cache so it is reopened from the environment."""
+    _settings.clear()
+    _forget_failure()
+    close_disk_cache()
+
+
+def _forget_failure() -> None:
+    global _failed_directory
+    _failed_directory = None
+
+
+def get_disk_cache() -> Optional[DiskCache]:
+    """
+    Return the on-disk cache, opening it on first use.
+
+    Returns None if the cache is not configured, caching is off, or the cache
+    could not be opened; the failure is logged once and requests go to the API.
+    """
+    global _disk_cache, _failed_directory
+    if not cache.enabled():
+        return None
+    disk_cache = _disk_cache
+    if disk_cache is None:
+        directory = _settings.get("directory", os.environ.get("DEVREV_MCP_DISK_CACHE_DIR"))
+        if not directory or directory == _failed_directory:
+            return None
+        with _disk_cache_lock:
+            if _disk_cache is None and directory != _failed_directory:
+                try:
+                    max_bytes = int(os.environ.get("DEVREV_MCP_DISK_CACHE_MAX_BYTES", DEFAULT_MAX_BYTES))
+                except ValueError:
+                    max_bytes = DEFAULT_MAX_BYTES
+                try:
+                    _disk_cache = DiskCache(os.path.expanduser(directory), _settings.get("max_bytes", max_bytes))
+                except (OSError, sqlite3.Error) as e:
+                    logger.warning("Could not open the on-disk cache in %s, leaving it off: %s", directory, e)
+                    _failed_directory = directory
+            disk_cache = _disk_cache
+    return disk_cache
+
+
+def close_disk_cache() -> None:
+    """Close the on-disk cache if it is open."""
+    global _disk_cache
+    with _disk_cache_lock:
+        if _disk_cache is not None:
+            _disk_cache.close()
+            _disk_cache = None
+
+
+def endpoint_ttl(endpoint: str) -> float:
+    """Return how long responses of endpoint are kept on disk, 0 if they are not stored."""
+    spec = os.environ.get("DEVREV_MCP_DISK_CACHE_TTLS", "")
+    for item in spec.split(","):
+        name, _, ttl = item.strip().partition("=")
+        if name == endpoint:
+            try:
+                return max(float(ttl), 0.0)
+            except ValueError:
+                break
+    return DEFAULT_ENDPOINT_TTLS.get(endpoint, 0.0)
+
+
+def disk_cache_stats() -> Optional[Dict[str, int]]:
+    """Return the counters of the on-disk cache, or None if it is not open."""
+    disk_cache = _disk_cache
+    return disk_cache.stats() if disk_cache is not None else None
@@ -0,0 +1,546 @@
+"""
+Copyright (c) 2025 DevRev, Inc.
+SPDX-License-Identifier: MIT
+
+This module provides a local stand-in for the DevRev API, serving a synthetic
+dataset for benchmarks and integration tests.
+
+Run it with `devrev-mcp-fake-api --port 8765` (or `python -m devrev_mcp.fake_api`)
+and point the server at it with DEVREV_API_BASE_URL=http://127.0.0.1:8765.
+Any non-empty API key is accepted.
+"""
+
+import argparse
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+
+DON = "don:core:dvrv-us-1:devo/fake"
+STAGES = ["triage", "queued", "in_development", "completed"]
+SUBTYPES = ["bug", "task", "feature"]
+WORDS = ["login", "export", "billing", "search", "sync", "dashboard", "upload", "report", "cache", "webhook"]
+
+Result = Tuple[int, Dict[str, Any]]
+
+
+def _now() -> str:
+    return time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
+
+
+class FakeDataset:
+    """
+    A synthetic DevRev org: users, parts, work items, sprints and meetings.
+
+    The dataset is generated from a seed, so the same arguments always give
+    the same objects. Objects are kept in memory and changed by the create
+    and update endpoints.
+    """
+
+    def __init__(self, works: int = 1000, parts: int = 50, users: int = 20, meetings: int = 50,
+                 body_size: int = 200, seed: int = 0):
+        rng = random.Random(seed)
+        self.lock = threading.Lock()
+        self.users = [
+            {"id": f"{DON}:devu/{i}", "display_name": f"user{i}", "email": f"user{i}@example.com"}
+            for i in range(1, max(users, 1) + 1)
+        ]
+        self.stages = [
+            {"stage": {"id": f"{DON}:custom_stage/{i}"}, "name": name,
+             "transitions": [{"target_stage": {"id": f"{DON}:custom_stage/{j}"}, "name": STAGES[j - 1]}
+                             for j in range(i + 1, len(STAGES) + 1)]}
+            for i, name in enumerate(STAGES, 1)
+        ]
+        self.sprints = [
+            {"id": f"{DON}:vista_group_item/{i}", "name": f"Sprint {i}",
+             "state": "active" if i == 1 else "planned", "ancestor_part": f"{DON}:product/1"}
+            for i in range(1, 4)
+        ]
+        self.parts: Dict[str, Dict[str, Any]] = {}
+        self.works: Dict[str, Dict[str, Any]] = {}
+        self._aliases: Dict[str, str] = {}
+        self.meetings = [
+            {"id": f"{DON}:meeting/{i}", "title": f"Meeting {i}", "channel": rng.choice(["zoom", "teams", "google_meet"]),
+             "created_by": self.user_summary(rng.choice(self.users)), "state": "scheduled"}
+            for i in range(1, meetings + 1)
+        ]
+
+        self.add(self.parts, {"id": f"{DON}:product/1", "display_id": "PROD-1", "type": "product",
+                               "name": "Fake product", "owned_by": [self.user_summary(self.users[0])]})
+        for i in range(1, parts + 1):
+            self.add(self.parts, self._make_part(i, rng))
+        self._next_part = parts + 1
+
+        part_ids = list(self.parts)
+        for i in range(1, works + 1):
+            self.add(self.works, self._make_work(i, rng.choice(["issue", "ticket"]), rng, part_ids, body_size))
+        self._next_work = works + 1
+        self._next_entry = 1
+
+    @staticmethod
+    def user_summary(user: Dict[str, Any]) -> Dict[str, Any]:
+        """Return the summary of a user embedded in other objects."""
+        return {"id": user["id"], "display_name": user["display_name"]}
+
+    def stage_index(self, ref: Any) -> Optional[int]:
+        """Return the index of the stage with the given name or ID, or None if there is none."""
+        for i, stage in enumerate(self.stages):
+            if ref in (stage["name"], stage["stage"]["id"]):
+                return i
+        return None
+
+    def stage(self, index: int) -> Dict[str, Any]:
+        """Return the stage field of an object in the stage at index."""
+        stage = self.stages[index]
+        return {"name": stage["name"], "stage": {"id": stage["stage"]["id"]}}
+
+    def _make_part(self, i: int, rng: random.Random) -> Dict[str, Any]:
+        owner = self.user_summary(rng.choice(self.users))
+        return {
+            "id": f"{DON}:enhancement/{i}", "display_id": f"ENH-{i}", "type": "enhancement",
+            "name": f"{rng.choice(WORDS).title()} improvements {i}", "description": "Synthetic enhancement",
+            "owned_by": [owner], "created_by": owner, "parent_part": [{"id": f"{DON}:product/1"}],
+            "stage_v2": self.stage(rng.randrange(len(STAGES))), "created_date": _now(), "modified_date": _now(),
+        }
+
+    def _make_work(self, i: int, type: str, rng: random.Random, part_ids: List[str], body_size: int) -> Dict[str, Any]:
+        owner = self.user_summary(rng.choice(self.users))
+        part = self.parts[rng.choice(part_ids)]
+        prefix = "ISS" if type == "issue" else "TKT"
+        words = " ".join(rng.choice(WORDS) for _ in range(max(body_size // 8, 1)))
+        return {
+            "id": f"{DON}:{type}/{i}", "display_id": f"{prefix}-{i}", "type": type,
+            "title": f"{rng.choice(WORDS).title()} {rng.choice(['fails', 'is slow', 'needs work'])} ({i})",
+            "body": words[:body_size], "owned_by": [owner], "created_by": owner,
+            "applies_to_part": {"id": part["id"], "display_id": part["display_id"], "name": part["name"]},
+            "stage": self.stage(rng.randrange(len(STAGES))), "subtype": rng.choice(SUBTYPES),
+            "sprint": rng.choice(self.sprints)["id"] if type == "issue" else None,
+            "created_date": _now(), "modified_date": _now(),
+        }
+
+    def add(self, table: Dict[str, Dict[str, Any]], item: Dict[str, Any]) -> None:
+        """Store an object so it can be found by id and display_id."""
+        table[item["id"]] = item
+        self._aliases[item["display_id"]] = item["id"]
+
+    def find(self, table: Dict[str, Dict[str, Any]], ref: Any) -> Optional[Dict[str, Any]]:
+        """Return the object with the given id or display_id."""
+        if not isinstance(ref, str):
+            return None
+        return table.get(self._aliases.get(ref, ref))
+
+    def new_work_id(self) -> int:
+        """Return the number of the next created work item."""
+        self._next_work += 1
+        return self._next_work - 1
+
+    def new_part_id(self) -> int:
+        """Return the number of the next created part."""
+        self._next_part += 1
+        return self._next_part - 1
+
+    def new_entry_id(self) -> int:
+        """Return the number of the next created timeline entry."""
+        self._next_entry += 1
+        return self._next_entry - 1
+
+
+def _not_found(kind: str, ref: Any) -> Result:
+    return 404, {"type": "not_found", "message": f"{kind} {ref} not found"}
+
+
+def _ids(values: Any) -> set:
+    """Collect the IDs from a list of IDs or user summaries."""
+    if not isinstance(values, list):
+        values = [values]
+    return {value["id"] if isinstance(value, dict) else value for value in values}
+
+
+def _encode(status: int, body: Dict[str, Any]) -> Tuple[int, bytes]:
+    return status, json.dumps(body).encode()
+
+
+def _page(items: List[Dict[str, Any]], payload: Dict[str, Any], root: str) -> Result:
+    """Return one page of items, following DevRev's cursor, mode and limit arguments."""
+    try:
+        limit = max(min(int(payload.get("limit", 50)), 100), 1)
+    except (TypeError, ValueError):
+        limit = 50
+    cursor = payload.get("cursor")
+    offset = 0
+    if isinstance(cursor, str) and cursor.startswith("offset:"):
+        try:
+            offset = int(cursor.split(":", 1)[1])
+        except ValueError:
+            return 400, {"type": "bad_request", "message": f"Invalid cursor {cursor}"}
+    if payload.get("mode") == "before":
+        offset = max(offset - 2 * limit, 0)
+
+    body: Dict[str, Any] = {root: items[offset:offset + limit]}
+    if offset + limit < len(items):
+        body["next_cursor"] = f"offset:{offset + limit}"
+    if offset > 0:
+        body["prev_cursor"] = f"offset:{offset}"
+    return 200, body
+
+
+class FakeDevRevAPI:
+    """
+    A threaded HTTP server answering DevRev API requests from a FakeDataset.
+
+    Args:
+        dataset: The data to serve; a default-sized dataset when omitted
+        host: Interface to listen on
+        port: Port to listen on; 0 picks a free port
+        latency: Seconds added to every response
+        jitter: Up to this many seconds of extra random latency per response
+        error_rate: Probability that a request fails with error_status
+        error_status: HTTP status of injected failures
+        seed: Seed of the latency and error injection
+    """
+
+    def __init__(self, dataset: Optional[FakeDataset] = None, host: str = "127.0.0.1", port: int = 0,
+                 latency: float = 0.0, jitter: float = 0.0, error_rate: float = 0.0,
+                 error_status: int = 503, seed: int = 0):
+        self.dataset = dataset if dataset is not None else FakeDataset()
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self._rng = random.Random(seed)
+        self._rng_lock = threading.Lock()
+        self._count_lock = threading.Lock()
+        self.requests: Dict[str, int] = {}
+        self.api_keys: Dict[str, int] = {}
+        self.endpoints: Dict[str, Callable[[Dict[str, Any]], Result]] = {
+            "dev-users.self": self.dev_users_self,
+            "works.get": self.works_get,
+            "works.list": self.works_list,
+            "works.create": self.works_create,
+            "works.update": self.works_update,
+            "parts.get": self.parts_get,
+            "parts.list": self.parts_list,
+            "parts.create": self.parts_create,
+            "parts.update": self.parts_update,
+            "search.hybrid": self.search_hybrid,
+            "schemas.aggregated.get": self.schemas_aggregated_get,
+            "schemas.subtypes.list": self.schemas_subtypes_list,
+            "stage-diagrams.get": self.stage_diagrams_get,
+            "internal/vistas.get": self.vistas_get,
+            "vistas.get": self.vistas_get,
+            "vistas.groups.list": self.vistas_groups_list,
+            "meetings.list": self.meetings_list,
+            "timeline-entries.create": self.timeline_entries_create,
+        }
+        self._httpd = ThreadingHTTPServer((host, port), _FakeHandler)
+        self._httpd.daemon_threads = True
+        self._httpd.api = self
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "FakeDevRevAPI":
+        """Serve requests on a background thread."""
+        self._thread = threading.Thread(
+            target=self._httpd.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True)
+        self._thread.start()
+        return self
+
+    def serve_forever(self) -> None:
+        """Serve requests on the calling thread until interrupted."""
+        self._httpd.serve_forever()
+
+    def stop(self) -> None:
+        """Stop serving and close the listening socket."""
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def __enter__(self) -> "FakeDevRevAPI":
+        return self.start()
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.stop()
+
+    def handle(self, endpoint: str, payload: Dict[str, Any], api_key: Optional[str]) -> Result:
+        """Answer one request, applying the injected latency and errors. Any non-empty API key is accepted."""
+        status, data = self.respond(endpoint, payload, api_key)
+        return status, json.loads(data)
+
+    def respond(self, endpoint: str, payload: Dict[str, Any], api_key: Optional[str]) -> Tuple[int, bytes]:
+        """
+        Answer one request like handle, with the body encoded as JSON.
+
+        Handlers return live dataset objects, so the body is encoded while the
+        dataset lock is held and concurrent updates cannot change it midway.
+        """
+        with self._count_lock:
+            self.requests[endpoint] = self.requests.get(endpoint, 0) + 1
+            if api_key:
+                self.api_keys[api_key] = self.api_keys.get(api_key, 0) + 1
+        with self._rng_lock:
+            delay = self.latency + (self._rng.uniform(0, self.jitter) if self.jitter else 0.0)
+            failed = self.error_rate > 0 and self._rng.random() < self.error_rate
+        if delay:
+            time.sleep(delay)
+        if not api_key:
+            return _encode(401, {"type": "unauthenticated", "message": "Missing Authorization header"})
+        if failed:
+            return _encode(self.error_status, {"type": "service_unavailable", "message": "Injected failure"})
+        handler = self.endpoints.get(endpoint)
+        if handler is None:
+            return _encode(404, {"type": "not_found", "message": f"Unknown endpoint {endpoint}"})
+        with self.dataset.lock:
+            return _encode(*handler(payload))
+
+    # Users, schemas and vistas
+
+    def dev_users_self(self, payload: Dict[str, Any]) -> Result:
+        return 200, {"dev_user": self.dataset.users[0]}
+
+    def schemas_aggregated_get(self, payload: Dict[str, Any]) -> Result:
+        leaf_type = payload.get("leaf_type", "issue")
+        return 200, {"schema": {"leaf_type": leaf_type, "stage_diagram_id": {"id": f"{DON}:stage_diagram/1"},
+                                "fields": [{"name": "title", "field_type": "text"}]}}
+
+    def schemas_subtypes_list(self, payload: Dict[str, Any]) -> Result:
+        leaf_type = payload.get("leaf_type", "issue")
+        return 200, {"subtypes": [{"value": value, "display_name": value.title(), "leaf_type": leaf_type}
+                                  for value in SUBTYPES]}
+
+    def stage_diagrams_get(self, payload: Dict[str, Any]) -> Result:
+        if payload.get("id") != f"{DON}:stage_diagram/1":
+            return _not_found("Stage diagram", payload.get("id"))
+        return 200, {"stage_diagram": {"id": payload["id"], "stages": self.dataset.stages}}
+
+    def vistas_get(self, payload: Dict[str, Any]) -> Result:
+        return 200, {"vista": {"id": payload.get("id"), "name": "Fake sprint board", "type": "grouped",
+                               "vista_group": self.dataset.sprints}}
+
+    def vistas_groups_list(self, payload: Dict[str, Any]) -> Result:
+        states = payload.get("state")
+        sprints = [sprint for sprint in self.dataset.sprints if not states or sprint["state"] in states]
+        return 200, {"vista_group": sprints}
+
+    def meetings_list(self, payload: Dict[str, Any]) -> Result:
+        meetings = self.dataset.meetings
+        if payload.get("channel"):
+            meetings = [meeting for meeting in meetings if meeting["channel"] in payload["channel"]]
+        if payload.get("created_by"):
+            wanted = _ids(payload["created_by"])
+            meetings = [meeting for meeting in meetings if meeting["created_by"]["id"] in wanted]
+        return _page(meetings, payload, "meetings")
+
+    # Works
+
+    def works_get(self, payload: Dict[str, Any]) -> Result:
+        work = self.dataset.find(self.dataset.works, payload.get("id"))
+        if work is None:
+            return _not_found("Work", payload.get("id"))
+        return 200, {"work": work}
+
+    def works_list(self, payload: Dict[str, Any]) -> Result:
+        works: List[Dict[str, Any]] = list(self.dataset.works.values())
+        if payload.get("type"):
+            works = [work for work in works if work["type"] in payload["type"]]
+        for name in ("owned_by", "created_by"):
+            if payload.get(name):
+                wanted = _ids(payload[name])
+                works = [work for work in works if _ids(work[name]) & wanted]
+        if payload.get("applies_to_part"):
+            wanted = set(payload["applies_to_part"])
+            works = [work for work in works
+                     if {work["applies_to_part"]["id"], work["applies_to_part"]["display_id"]} & wanted]
+        subtypes = set(payload.get("issue", {}).get("subtype", [])) | set(payload.get("ticket", {}).get("subtype", []))
+        if subtypes:
+            works = [work for work in works if work["subtype"] in subtypes]
+        return _page(works, payload, "works")
+
+    def works_create(self, payload: Dict[str, Any]) -> Result:
+        type = payload.get("type")
+        if type not in ("issue", "ticket") or not payload.get("title"):
+            return 400, {"type": "bad_request", "message": "type and title are required"}
+        applies_to_part = payload.get("applies_to_part")
+        if isinstance(applies_to_part, list):
+            applies_to_part = applies_to_part[0] if applies_to_part else None
+        part = self.dataset.find(self.dataset.parts, applies_to_part)
+        if part is None:
+            return 400, {"type": "bad_request", "message": f"Unknown part {applies_to_part}"}
+        i = self.dataset.new_work_id()
+        prefix = "ISS" if type == "issue" else "TKT"
+        owner = self.dataset.user_summary(self.dataset.users[0])
+        work = {
+            "id": f"{DON}:{type}/{i}", "display_id": f"{prefix}-{i}", "type": type,
+            "title": payload["title"], "body": payload.get("body", ""),
+            "owned_by": [{"id": id} for id in payload.get("owned_by") or []] or [owner], "created_by": owner,
+            "applies_to_part": {"id": part["id"], "display_id": part["display_id"], "name": part["name"]},
+            "stage": self.dataset.stage(0), "subtype": None, "sprint": None,
+            "created_date": _now(), "modified_date": _now(),
+        }
+        self.dataset.add(self.dataset.works, work)
+        return 201, {"work": work}
+
+    def works_update(self, payload: Dict[str, Any]) -> Result:
+        work = self.dataset.find(self.dataset.works, payload.get("id"))
+        if work is None:
+            return _not_found("Work", payload.get("id"))
+        for name in ("title", "body", "sprint"):
+            if name in payload:
+                work[name] = payload[name]
+        if "owned_by" in payload:
+            work["owned_by"] = [{"id": id} for id in payload["owned_by"]]
+        if "stage" in payload:
+            name = payload["stage"].get("name")
+            index = self.dataset.stage_index(name)
+            if index is None:
+                return 400, {"type": "bad_request", "message": f"Unknown stage {name}"}
+            work["stage"] = self.dataset.stage(index)
+        subtype = payload.get("custom_schema_spec", {}).get("subtype")
+        if subtype:
+            work["subtype"] = subtype
+        work["modified_date"] = _now()
+        return 200, {"work": work}
+
+    # Parts
+
+    def parts_get(self, payload: Dict[str, Any]) -> Result:
+        part = self.dataset.find(self.dataset.parts, payload.get("id"))
+        if part is None:
+            return _not_found("Part", payload.get("id"))
+        return 200, {"part": part}
+
+    def parts_list(self, payload: Dict[str, Any]) -> Result:
+        parts: List[Dict[str, Any]] = list(self.dataset.parts.values())
+        if payload.get("type"):
+            types = payload["type"] if isinstance(payload["type"], list) else [payload["type"]]
+            parts = [part for part in parts if part["type"] in types]
+        for name in ("owned_by", "created_by"):
+            if payload.get(name):
+                wanted = _ids(payload[name])
+                parts = [part for part in parts if _ids(part.get(name, [])) & wanted]
+        parents = payload.get("parent_part", {}).get("parts")
+        if parents:
+            parts = [part for part in parts if _ids(part.get("parent_part", [])) & set(parents)]
+        return _page(parts, payload, "parts")
+
+    def parts_create(self, payload: Dict[str, Any]) -> Result:
+        if payload.get("type") != "enhancement" or not payload.get("name"):
+            return 400, {"type": "bad_request", "message": "type enhancement and name are required"}
+        i = self.dataset.new_part_id()
+        owner = self.dataset.user_summary(self.dataset.users[0])
+        part = {
+            "id": f"{DON}:enhancement/{i}", "display_id": f"ENH-{i}", "type": "enhancement",
+            "name": payload["name"], "description": payload.get("description", ""),
+            "owned_by": [{"id": id} for id in payload.get("owned_by") or []] or [owner], "created_by": owner,
+            "parent_part": [{"id": id} for id in payload.get("parent_part") or []],
+            "stage_v2": self.dataset.stage(0), "created_date": _now(), "modified_date": _now(),
+        }
+        self.dataset.add(self.dataset.parts, part)
+        return 201, {"part": part}
+
+    def parts_update(self, payload: Dict[str, Any]) -> Result:
+        part = self.dataset.find(self.dataset.parts, payload.get("id"))
+        if part is None:
+            return _not_found("Part", payload.get("id"))
+        for name in ("name", "description"):
+            if name in payload:
+                part[name] = payload[name]
+        if "owned_by" in payload:
+            part["owned_by"] = [{"id": id} for id in payload["owned_by"]]
+        if "stage_v2" in payload:
+            # The server sends a stage ID; a name or a stage object is accepted too
+            ref = payload["stage_v2"]
+            if isinstance(ref, dict):
+                ref = ref.get("name") or (ref.get("stage") or {}).get("id")
+            index = self.dataset.stage_index(ref)
+            if index is None:
+                return 400, {"type": "bad_request", "message": f"Unknown stage {ref}"}
+            part["stage_v2"] = self.dataset.stage(index)
+        part["modified_date"] = _now()
+        return 200, {"part": part}
+
+    # Search and timeline
+
+    def search_hybrid(self, payload: Dict[str, Any]) -> Result:
+        query = str(payload.get("query", "")).lower()
+        terms = query.split()
+        results = []
+        for work in self.dataset.works.values():
+            if all(term in work["title"].lower() for term in terms):
+                results.append({"type": "work", "work": work})
+                if len(results) >= 10:
+                    break
+        return 200, {"results": results}
+
+    def timeline_entries_create(self, payload: Dict[str, Any]) -> Result:
+        object_id = payload.get("object")
+        item = self.dataset.find(self.dataset.works, object_id) or self.dataset.find(self.dataset.parts, object_id)
+        if item is None:
+            return _not_found("Object", object_id)
+        item["modified_date"] = _now()
+        i = self.dataset.new_entry_id()
+        return 201, {"timeline_entry": {"id": f"{DON}:timeline_event/{i}", "object": item["id"],
+                                        "type": payload.get("type", "timeline_comment"),
+                                        "body": payload.get("body", ""), "created_date": _now()}}
+
+
+class _FakeHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        raw = self.rfile.read(length) if length else b""
+        try:
+            payload = json.loads(raw) if raw else {}
+        except ValueError:
+            status, data = _encode(400, {"type": "bad_request", "message": "Malformed JSON body"})
+        else:
+            status, data = self.server.api.respond(
+                self.path.lstrip("/"), payload, self.headers.get("Authorization"))
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Run the fake DevRev API from the command line."""
+    parser = argparse.ArgumentParser(prog="devrev-mcp-fake-api", description="Local fake DevRev API")
+    parser.add_argument("--host", default="127.0.0.1", help="Interface to listen on (default 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=8765, help="Port to listen on; 0 picks a free port (default 8765)")
+    parser.add_argument("--works", type=int, default=1000, help="Number of synthetic work items (default 1000)")
+    parser.add_argument("--parts", type=int, default=50, help="Number of synthetic enhancements (default 50)")
+    parser.add_argument("--users", type=int, default=20, help="Number of synthetic users (default 20)")
+    parser.add_argument("--body-size", type=int, default=200, help="Characters in each work item body (default 200)")
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds added to every response")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Up to this many seconds of extra random latency")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Probability of an injected failure")
+    parser.add_argument("--error-status", type=int, default=503, help="HTTP status of injected failures (default 503)")
+    parser.add_argument("--seed", type=int, default=0, help="Seed of the dataset and of the injected latency and failures")
+    args = parser.parse_args(argv)
+
+    dataset = FakeDataset(works=args.works, parts=args.parts, users=args.users,
+                          body_size=args.body_size, seed=args.seed)
+    api = FakeDevRevAPI(dataset, host=args.host, port=args.port, latency=args.latency, jitter=args.jitter,
+                        error_rate=args.error_rate, error_status=args.error_status, seed=args.seed)
+    print(f"Fake DevRev API listening on {api.url}", flush=True)
+    try:
+        api.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        api._httpd.server_close()
+
+
+if __name__ == "__main__":
+    main()
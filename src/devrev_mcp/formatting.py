@@ -0,0 +1,134 @@
+"""
+Copyright (c) 2025 DevRev, Inc.
+SPDX-License-Identifier: MIT
+
+This module turns DevRev API responses into the text returned by MCP tools.
+"""
+
+import json
+import os
+from functools import lru_cache
+from typing import Any, Dict, Iterable, Optional
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an optional speedup
+    orjson = None
+
+
+OUTPUT_MODES = ("raw", "json", "repr")
+
+
+def json_backend() -> str:
+    """
+    Return the JSON backend in use.
+
+    DEVREV_MCP_JSON_BACKEND selects "orjson" or "json"; by default orjson is
+    used when it is installed and the standard library otherwise.
+    """
+    backend = os.environ.get("DEVREV_MCP_JSON_BACKEND", "auto")
+    if backend == "json" or orjson is None:
+        return "json"
+    return "orjson"
+
+
+def output_mode() -> str:
+    """
+    Return the tool output mode selected by DEVREV_MCP_OUTPUT.
+
+    - raw (default): forward response bodies as received, re-serializing
+      compactly only when a tool returns part of a response
+    - json: always decode and re-serialize compactly
+    - repr: the Python repr of the decoded response
+    """
+    mode = os.environ.get("DEVREV_MCP_OUTPUT", "raw")
+    return mode if mode in OUTPUT_MODES else "raw"
+
+
+def dumps(value: Any) -> str:
+    """Serialize value to compact JSON with the active backend."""
+    if json_backend() == "orjson":
+        return orjson.dumps(value).decode()
+    return json.dumps(value, separators=(",", ":"), ensure_ascii=False)
+
+
+def loads(data: str | bytes) -> Any:
+    """Parse JSON with the active backend."""
+    if json_backend() == "orjson":
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def decode_response(response: Any) -> Any:
+    """Decode the JSON body of a response with the active backend."""
+    content = getattr(response, "content", None)
+    if content is None:
+        return response.json()
+    return loads(content)
+
+
+def format_value(value: Any) -> str:
+    """Format a decoded value for tool output."""
+    if output_mode() == "repr":
+        return f"{value}"
+    return dumps(value)
+
+
+@lru_cache(maxsize=128)
+def compile_fields(paths: tuple[str, ...]) -> Dict[str, Any]:
+    """
+    Compile dotted field paths into a projection tree.
+
+    Each path segment becomes a nested key; None marks a selected value that
+    is kept whole. A "[]" suffix such as "owned_by[].display_name" is
+    accepted for readability, since lists are always projected item by item.
+    """
+    tree: Dict[str, Any] = {}
+    for path in paths:
+        node = tree
+        segments = [segment.removesuffix("[]") for segment in path.split(".")]
+        for index, segment in enumerate(segments):
+            if not segment:
+                break
+            if index == len(segments) - 1:
+                node[segment] = None
+                break
+            child = node.get(segment, {})
+            if child is None:
+                break
+            node[segment] = child
+            node = child
+    return tree
+
+
+def project(value: Any, tree: Optional[Dict[str, Any]]) -> Any:
+    """Keep only the parts of value selected by a compiled projection tree."""
+    if tree is None:
+        return value
+    if isinstance(value, dict):
+        return {key: project(value[key], subtree) for key, subtree in tree.items() if key in value}
+    if isinstance(value, list):
+        return [project(item, tree) for item in value]
+    return value
+
+
+def format_response(response: Any, fields: Optional[Iterable[str]] = None, root: Optional[str] = None) -> str:
+    """
+    Format a whole response body for tool output.
+
+    When fields are given, the object (or list of objects) under the root key
+    is projected to those dotted paths and the other top-level keys, such as
+    pagination cursors, are kept as they are.
+    """
+    if fields:
+        data = decode_response(response)
+        if isinstance(data, dict) and root in data:
+            data[root] = project(data[root], compile_fields(tuple(fields)))
+        return format_value(data)
+
+    mode = output_mode()
+    if mode == "raw":
+        return response.text
+    if mode == "repr":
+        return f"{response.json()}"
+    return dumps(decode_response(response))
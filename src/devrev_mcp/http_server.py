@@ -0,0 +1,232 @@
+"""
+Copyright (c) 2025 DevRev, Inc.
+SPDX-License-Identifier: MIT
+
+This module provides the streamable HTTP transport, which serves many MCP sessions from one long-lived process.
+
+Every session shares the process's HTTP connection pool, caches, rate limiter
+and circuit breakers. A session authenticates with its own DevRev API key sent
+as "Authorization: Bearer <key>"; sessions without one use DEVREV_API_KEY. Tool and endpoint metrics are served
+in the Prometheus text format on METRICS_PATH.
+"""
+
+import contextlib
+import hashlib
+import os
+import socket
+import time
+from types import FrameType
+from typing import AsyncIterator, List, Optional
+
+import uvicorn
+from mcp.server.auth.middleware.bearer_auth import BearerAuthBackend
+from mcp.server.auth.provider import AccessToken
+from mcp.server.streamable_http_manager import StreamableHTTPSessionManager
+from mcp.server.transport_security import TransportSecuritySettings
+from starlette.applications import Starlette
+from starlette.middleware.authentication import AuthenticationMiddleware
+from starlette.requests import Request
+from starlette.responses import JSONResponse, Response
+from starlette.routing import Route
+from starlette.types import Receive, Scope, Send
+
+from . import disk_cache, metrics, server, workers
+from .utils import close_session
+
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8000
+DEFAULT_MAX_SESSIONS = 100
+DEFAULT_DRAIN_SECONDS = 30.0
+MCP_PATH = "/mcp"
+METRICS_PATH = "/metrics"
+
+# How long open GET event streams may linger once the drain has finished.
+STREAM_CLOSE_SECONDS = 1.0
+
+# Seconds between the counter snapshots a pre-fork worker writes.
+SNAPSHOT_SECONDS = 1.0
+
+LOOPBACK_HOSTS = ("127.0.0.1", "localhost", "[::1]")
+
+
+class APIKeyVerifier:
+    """
+    Accept any bearer token as the session's DevRev API key.
+
+    The key is checked by the DevRev API on first use. Its hash identifies the
+    session owner, so a session can only be used with the key that opened it.
+    """
+
+    async def verify_token(self, token: str) -> Optional[AccessToken]:
+        if not token:
+            return None
+        return AccessToken(token=token, client_id=hashlib.sha256(token.encode()).hexdigest()[:32], scopes=[])
+
+
+def _error(status: int, message: str, **headers: str) -> JSONResponse:
+    """Build a JSON-RPC error response sent outside of any session."""
+    return JSONResponse({"jsonrpc": "2.0", "id": None, "error": {"code": -32000, "message": message}},
+                        status_code=status, headers=headers or None)
+
+
+class HTTPServer(uvicorn.Server):
+    """
+    Serve MCP sessions over streamable HTTP on MCP_PATH.
+
+    On SIGINT or SIGTERM the server drains: new requests are answered with
+    503, requests in flight run to completion for up to drain_seconds, and
+    then the server exits. A second signal exits immediately.
+
+    Args:
+        host: Interface to listen on
+        port: Port to listen on; 0 picks a free port
+        max_sessions: Number of open sessions beyond which new ones are refused with 503
+        drain_seconds: How long in-flight requests may take to finish on shutdown
+        stateless: Serve every request on its own, without sessions, as pre-fork workers do
+        worker_id: The number of this pre-fork worker, which writes snapshots of its counters
+    """
+
+    def __init__(self, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT,
+                 max_sessions: int = DEFAULT_MAX_SESSIONS, drain_seconds: float = DEFAULT_DRAIN_SECONDS,
+                 stateless: bool = False, worker_id: Optional[int] = None):
+        self.draining = False
+        self.inflight = 0
+        self.requests = 0
+        self.drain_seconds = drain_seconds
+        self.worker_id = worker_id
+        self._drain_deadline = 0.0
+        self._snapshot_at = 0.0
+
+        allowed_hosts = {*LOOPBACK_HOSTS, host if ":" not in host else f"[{host}]"}
+        self.session_manager = StreamableHTTPSessionManager(
+            app=server.server,
+            max_sessions=max_sessions,
+            stateless=stateless,
+            security_settings=TransportSecuritySettings(
+                allowed_hosts=[f"{name}:*" for name in allowed_hosts],
+                allowed_origins=[f"http://{name}:*" for name in allowed_hosts],
+            ),
+        )
+        endpoint = AuthenticationMiddleware(self._handle, backend=BearerAuthBackend(APIKeyVerifier()))
+        app = Starlette(routes=[
+            Route(MCP_PATH, endpoint=endpoint),
+            Route(METRICS_PATH, endpoint=self._metrics, methods=["GET"]),
+        ], lifespan=self._lifespan)
+        super().__init__(uvicorn.Config(
+            app, host=host, port=port, lifespan="on", log_level="warning",
+            timeout_graceful_shutdown=STREAM_CLOSE_SECONDS))
+
+    @contextlib.asynccontextmanager
+    async def _lifespan(self, app: Starlette) -> AsyncIterator[None]:
+        async with self.session_manager.run():
+            try:
+                yield
+            finally:
+                self.write_snapshot()
+
+    @property
+    def port(self) -> int:
+        """Return the port the server listens on, once started."""
+        return self.servers[0].sockets[0].getsockname()[1]
+
+    async def _handle(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if self.draining and scope["method"] != "DELETE":
+            await _error(503, "Server is shutting down", Connection="close")(scope, receive, send)
+            return
+        if not getattr(scope.get("user"), "is_authenticated", False) and not os.environ.get("DEVREV_API_KEY"):
+            await _error(401, "Missing DevRev API key: send Authorization: Bearer <key>")(scope, receive, send)
+            return
+        if scope["method"] == "GET":
+            # Event streams stay open for the whole session and are not waited for
+            await self.session_manager.handle_request(scope, receive, send)
+            return
+        self.inflight += 1
+        self.requests += 1
+        try:
+            await self.session_manager.handle_request(scope, receive, send)
+        finally:
+            self.inflight -= 1
+
+    async def _metrics(self, request: Request) -> Response:
+        """Serve the metrics of this process, or of all workers in pre-fork mode."""
+        snapshot = metrics.get_metrics().snapshot()
+        if self.worker_id is not None:
+            # Other workers' counters are as of their latest snapshot
+            snapshots = {name: s.get("metrics", {}) for name, s in workers.read_snapshots().items()}
+            snapshots[f"{workers.SNAPSHOT_PREFIX}{self.worker_id}"] = snapshot
+            snapshot = workers.aggregate(snapshots.values())
+        return Response(metrics.render(snapshot), media_type=metrics.CONTENT_TYPE)
+
+    def drain(self) -> None:
+        """Refuse new requests and exit once the requests in flight finish or drain_seconds pass."""
+        if not self.draining:
+            self.draining = True
+            self._drain_deadline = time.monotonic() + self.drain_seconds
+
+    def handle_exit(self, sig: int, frame: Optional[FrameType]) -> None:
+        if self.draining:
+            self.should_exit = True
+            self.force_exit = True
+        else:
+            self.drain()
+
+    async def on_tick(self, counter: int) -> bool:
+        now = time.monotonic()
+        if self.draining and (self.inflight == 0 or now >= self._drain_deadline):
+            self.should_exit = True
+        if now >= self._snapshot_at:
+            self._snapshot_at = now + SNAPSHOT_SECONDS
+            self.write_snapshot()
+        return await super().on_tick(counter)
+
+    def write_snapshot(self) -> None:
+        """Publish this worker's counters to the other workers, in pre-fork mode."""
+        if self.worker_id is None:
+            return
+        workers.write_snapshot(self.worker_id, {
+            "pid": os.getpid(),
+            "updated": time.time(),
+            "http": {"requests": self.requests, "inflight": self.inflight},
+            **server.get_diagnostics(),
+            "metrics": metrics.get_metrics().snapshot(),
+        })
+
+
+def _env_number(name: str, default: float) -> float:
+    try:
+        return float(os.environ.get(name, default))
+    except ValueError:
+        return default
+
+
+async def serve_http(host: Optional[str] = None, port: Optional[int] = None,
+                     max_sessions: Optional[int] = None, drain_seconds: Optional[float] = None,
+                     sockets: Optional[List[socket.socket]] = None, stateless: bool = False,
+                     worker_id: Optional[int] = None) -> None:
+    """
+    Run the streamable HTTP transport until it is shut down.
+
+    Pre-fork workers pass the listening socket they share as sockets, which
+    takes the place of host and port. Arguments left as None are read from
+    the environment:
+    - DEVREV_MCP_HTTP_HOST: interface to listen on (default 127.0.0.1)
+    - DEVREV_MCP_HTTP_PORT: port to listen on (default 8000)
+    - DEVREV_MCP_MAX_SESSIONS: maximum number of open sessions (default 100)
+    - DEVREV_MCP_DRAIN_TIMEOUT: seconds in-flight requests may take to finish on shutdown (default 30)
+    """
+    http_server = HTTPServer(
+        host=host or os.environ.get("DEVREV_MCP_HTTP_HOST", DEFAULT_HOST),
+        port=port if port is not None else int(_env_number("DEVREV_MCP_HTTP_PORT", DEFAULT_PORT)),
+        max_sessions=max_sessions or int(_env_number("DEVREV_MCP_MAX_SESSIONS", DEFAULT_MAX_SESSIONS)),
+        drain_seconds=drain_seconds if drain_seconds is not None else _env_number(
+            "DEVREV_MCP_DRAIN_TIMEOUT", DEFAULT_DRAIN_SECONDS),
+        stateless=stateless,
+        worker_id=worker_id,
+    )
+    try:
+        await http_server.serve(sockets=sockets)
+    finally:
+        # Release pooled HTTP connections and the on-disk cache on shutdown
+        close_session()
+        disk_cache.close_disk_cache()
@@ -0,0 +1,35 @@
+"""
+Copyright (c) 2025 DevRev, Inc.
+SPDX-License-Identifier: MIT
+
+This module provides deferred imports of modules that are not needed to answer the MCP initialize request.
+"""
+
+import importlib
+from types import ModuleType
+from typing import Any, Optional
+
+
+class LazyModule:
+    """
+    A stand-in for a module that imports it on first attribute access.
+
+    The HTTP client and the on-disk cache are only needed once a tool is
+    called, so importing them lazily keeps them off the startup path of every
+    new server process. The import goes through the regular import system and
+    its lock, so concurrent first uses from worker threads are safe.
+    """
+
+    def __init__(self, name: str):
+        self._name = name
+        self._module: Optional[ModuleType] = None
+
+    def __getattr__(self, attr: str) -> Any:
+        module = self._module
+        if module is None:
+            module = self._module = importlib.import_module(self._name)
+        return getattr(module, attr)
+
+    def __repr__(self) -> str:
+        state = "loaded" if self._module is not None else "not loaded"
+        return f"<lazy module {self._name!r} ({state})>"
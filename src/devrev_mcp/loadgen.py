@@ -0,0 +1,538 @@
+"""
+Copyright (c) 2025 DevRev, Inc.
+SPDX-License-Identifier: MIT
+
+This module provides an end-to-end load generator: it launches devrev-mcp over
+stdio against the bundled fake DevRev API and drives it with JSON-RPC
+tools/call requests.
+
+Run it with `devrev-mcp-loadgen --concurrency 16 --duration 30 --output results.json`
+(or `python -m devrev_mcp.loadgen`); `--transport http --workers N` drives the
+HTTP transport with N pre-forked workers instead. Requests are sent either by a fixed number
+of concurrent clients (--concurrency) or at a fixed arrival rate (--rate); in
+rate mode latency is measured from each request's scheduled start, so a
+server that falls behind is not hidden by the load generator slowing down.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import random
+import resource
+import shlex
+import signal
+import socket
+import subprocess
+import sys
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+import httpx
+
+from .fake_api import FakeDataset, FakeDevRevAPI
+
+
+DEFAULT_COMMAND = [sys.executable, "-c", "import devrev_mcp; devrev_mcp.main()"]
+DEFAULT_MIX = "get_work=4,list_works=2,search=1,valid_stage_transition=1,list_subtypes=1,get_current_user=1"
+PROTOCOL_VERSION = "2024-11-05"
+
+# Readline limit of the server's stdout; all_pages listings return large lines.
+STDOUT_LIMIT = 64 * 1024 * 1024
+
+
+def _random_work(rng: random.Random, dataset: FakeDataset) -> Dict[str, Any]:
+    return rng.choice(list(dataset.works.values()))
+
+
+# Argument generators of the tools a mix can contain.
+SCENARIOS: Dict[str, Callable[[random.Random, FakeDataset], Dict[str, Any]]] = {
+    "get_current_user": lambda rng, dataset: {},
+    "get_work": lambda rng, dataset: {"id": _random_work(rng, dataset)["display_id"]},
+    "get_works": lambda rng, dataset: {"ids": [_random_work(rng, dataset)["display_id"] for _ in range(5)]},
+    "list_works": lambda rng, dataset: {"type": ["issue", "ticket"], "owned_by": [rng.choice(dataset.users)["id"]]},
+    "list_works_all_pages": lambda rng, dataset: {
+        "type": ["issue", "ticket"], "all_pages": True, "max_items": 300, "fields": ["display_id", "title", "stage.name"]},
+    "search": lambda rng, dataset: {"query": rng.choice(["login", "export", "billing", "sync"]), "namespace": "issue"},
+    "get_part": lambda rng, dataset: {"id": rng.choice(list(dataset.parts.values()))["display_id"]},
+    "list_parts": lambda rng, dataset: {"type": "enhancement"},
+    "valid_stage_transition": lambda rng, dataset: (
+        lambda work: {"type": work["type"], "id": work["display_id"]})(_random_work(rng, dataset)),
+    "update_work": lambda rng, dataset: (
+        lambda work: {"id": work["display_id"], "type": work["type"], "title": f"Load test {rng.randrange(10 ** 6)}"})(
+        _random_work(rng, dataset)),
+    "list_subtypes": lambda rng, dataset: {"leaf_type": rng.choice(["issue", "ticket"])},
+    "get_sprints": lambda rng, dataset: {"ancestor_part_id": "PROD-1"},
+    "list_meetings": lambda rng, dataset: {"channel": ["zoom"]},
+}
+
+# Scenarios that call a differently named tool.
+SCENARIO_TOOLS = {"list_works_all_pages": "list_works"}
+
+
+def parse_mix(spec: str) -> Dict[str, float]:
+    """
+    Parse a request mix such as "get_work=4,search=1" into scenario weights.
+
+    Raises:
+        ValueError: If the mix names an unknown scenario or has no positive weight
+    """
+    mix = {}
+    for item in spec.split(","):
+        name, _, weight = item.strip().partition("=")
+        if not name:
+            continue
+        if name not in SCENARIOS:
+            raise ValueError(f"Unknown scenario {name}; choose from {', '.join(sorted(SCENARIOS))}")
+        mix[name] = float(weight) if weight else 1.0
+    if not any(weight > 0 for weight in mix.values()):
+        raise ValueError("The request mix needs at least one scenario with a positive weight")
+    return mix
+
+
+def percentile(samples: List[float], q: float) -> float:
+    """Return the q-th percentile (0-100) of sorted samples using the nearest-rank method."""
+    if not samples:
+        return 0.0
+    rank = max(int(round(q / 100 * len(samples) + 0.5)) - 1, 0)
+    return samples[min(rank, len(samples) - 1)]
+
+
+def summarize(latencies: List[float]) -> Dict[str, float]:
+    """Return latency percentiles, mean and maximum in milliseconds."""
+    samples = sorted(latency * 1000 for latency in latencies)
+    return {
+        "p50": percentile(samples, 50),
+        "p95": percentile(samples, 95),
+        "p99": percentile(samples, 99),
+        "mean": sum(samples) / len(samples) if samples else 0.0,
+        "max": samples[-1] if samples else 0.0,
+    }
+
+
+class StdioClient:
+    """A minimal MCP client speaking newline-delimited JSON-RPC to a server's stdin and stdout."""
+
+    def __init__(self, command: List[str], env: Dict[str, str]):
+        self.command = command
+        self.env = env
+        self.proc: Optional[asyncio.subprocess.Process] = None
+        self._next_id = 0
+        self._pending: Dict[int, asyncio.Future] = {}
+        self._reader: Optional[asyncio.Task] = None
+
+    async def start(self) -> float:
+        """Launch the server and complete the initialize handshake. Returns the time to the initialize response."""
+        start = time.perf_counter()
+        self.proc = await asyncio.create_subprocess_exec(
+            *self.command, stdin=asyncio.subprocess.PIPE, stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL, env=self.env, limit=STDOUT_LIMIT)
+        self._reader = asyncio.create_task(self._read())
+        await self.request("initialize", {
+            "protocolVersion": PROTOCOL_VERSION, "capabilities": {},
+            "clientInfo": {"name": "devrev-mcp-loadgen", "version": "1.0"}})
+        elapsed = time.perf_counter() - start
+        self._write({"jsonrpc": "2.0", "method": "notifications/initialized"})
+        return elapsed
+
+    def _write(self, message: Dict[str, Any]) -> None:
+        self.proc.stdin.write(json.dumps(message).encode() + b"\n")
+
+    async def _read(self) -> None:
+        while True:
+            line = await self.proc.stdout.readline()
+            if not line:
+                break
+            message = json.loads(line)
+            future = self._pending.pop(message.get("id"), None)
+            if future is not None and not future.done():
+                future.set_result(message)
+        for future in self._pending.values():
+            if not future.done():
+                future.set_exception(ConnectionError("The server closed its output"))
+
+    async def request(self, method: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Send a request and wait for its response message."""
+        self._next_id += 1
+        future = asyncio.get_running_loop().create_future()
+        self._pending[self._next_id] = future
+        self._write({"jsonrpc": "2.0", "id": self._next_id, "method": method, "params": params})
+        await self.proc.stdin.drain()
+        return await future
+
+    async def stop(self) -> None:
+        """Close the server's input and wait for it to exit."""
+        if self.proc is None:
+            return
+        self.proc.stdin.close()
+        try:
+            await asyncio.wait_for(self.proc.wait(), 10)
+        except asyncio.TimeoutError:
+            self.proc.kill()
+            await self.proc.wait()
+        if self._reader is not None:
+            await self._reader
+
+
+def _free_port() -> int:
+    """Return a local TCP port that is currently free."""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+class HTTPClient:
+    """
+    A minimal MCP client of the streamable HTTP transport.
+
+    It launches the server with --transport http on a free local port and
+    sends every JSON-RPC request as its own POST, over a pool of keep-alive
+    connections.
+    """
+
+    def __init__(self, command: List[str], env: Dict[str, str], workers: int = 1, connections: int = 64):
+        self.command = command
+        self.env = env
+        self.workers = workers
+        self.url = ""
+        self.proc: Optional[asyncio.subprocess.Process] = None
+        self._next_id = 0
+        self._session_id: Optional[str] = None
+        self._http = httpx.AsyncClient(timeout=120, limits=httpx.Limits(
+            max_connections=connections, max_keepalive_connections=connections))
+
+    async def start(self) -> float:
+        """Launch the server and wait until it answers initialize. Returns the time to the initialize response."""
+        port = _free_port()
+        self.url = f"http://127.0.0.1:{port}/mcp"
+        start = time.perf_counter()
+        self.proc = await asyncio.create_subprocess_exec(
+            *self.command, "--transport", "http", "--port", str(port), "--workers", str(self.workers),
+            stdin=asyncio.subprocess.DEVNULL, stdout=asyncio.subprocess.DEVNULL,
+            stderr=asyncio.subprocess.DEVNULL, env=self.env)
+        while True:
+            if self.proc.returncode is not None:
+                raise ConnectionError(f"The server exited with status {self.proc.returncode} during startup")
+            try:
+                await self.request("initialize", {
+                    "protocolVersion": PROTOCOL_VERSION, "capabilities": {},
+                    "clientInfo": {"name": "devrev-mcp-loadgen", "version": "1.0"}})
+                break
+            except httpx.TransportError:
+                await asyncio.sleep(0.05)
+        elapsed = time.perf_counter() - start
+        await self._post({"jsonrpc": "2.0", "method": "notifications/initialized"})
+        return elapsed
+
+    def _headers(self) -> Dict[str, str]:
+        headers = {"Accept": "application/json, text/event-stream"}
+        if self._session_id:
+            headers["Mcp-Session-Id"] = self._session_id
+        return headers
+
+    async def _post(self, message: Dict[str, Any]) -> httpx.Response:
+        response = await self._http.post(self.url, json=message, headers=self._headers())
+        self._session_id = response.headers.get("mcp-session-id", self._session_id)
+        return response
+
+    async def request(self, method: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Send a request and return its response message, read from a JSON or event stream body."""
+        self._next_id += 1
+        request_id = self._next_id
+        response = await self._post({"jsonrpc": "2.0", "id": request_id, "method": method, "params": params})
+        if response.status_code != 200:
+            return {"error": {"code": response.status_code, "message": response.text}}
+        if response.headers.get("content-type", "").startswith("application/json"):
+            return response.json()
+        for line in response.text.splitlines():
+            if line.startswith("data:"):
+                message = json.loads(line[len("data:"):])
+                if message.get("id") == request_id:
+                    return message
+        return {"error": {"code": response.status_code, "message": "No response in the event stream"}}
+
+    async def stop(self) -> None:
+        """Shut the server down with SIGTERM and wait for it to exit."""
+        await self._http.aclose()
+        if self.proc is None or self.proc.returncode is not None:
+            return
+        self.proc.send_signal(signal.SIGTERM)
+        try:
+            await asyncio.wait_for(self.proc.wait(), 30)
+        except asyncio.TimeoutError:
+            self.proc.kill()
+            await self.proc.wait()
+
+
+def _is_error(message: Dict[str, Any]) -> bool:
+    """Return whether a tools/call response reports a failure."""
+    if "error" in message:
+        return True
+    result = message.get("result", {})
+    if result.get("isError"):
+        return True
+    return any(" failed with status " in content.get("text", "") for content in result.get("content", []))
+
+
+async def run_load(command: Optional[List[str]] = None, api_url: Optional[str] = None,
+                   dataset: Optional[FakeDataset] = None, mix: str = DEFAULT_MIX,
+                   concurrency: int = 8, rate: Optional[float] = None, duration: float = 10.0,
+                   requests: Optional[int] = None, seed: int = 0,
+                   env: Optional[Dict[str, str]] = None, transport: str = "stdio",
+                   workers: int = 1) -> Dict[str, Any]:
+    """
+    Drive one devrev-mcp process with tools/call requests and return the measured results.
+
+    Args:
+        command: The server command line; runs this package's entry point by default
+        api_url: Base URL of the API the server talks to; the caller runs it
+        dataset: The dataset served at api_url, used to pick existing IDs
+        mix: Scenario weights such as "get_work=4,search=1"
+        concurrency: Number of concurrent clients, when rate is not given
+        rate: Requests started per second, instead of a fixed concurrency
+        duration: Seconds to send requests for, unless requests is given
+        requests: Total number of requests to send
+        seed: Seed of the scenario and argument choices
+        env: Extra environment variables of the server
+        transport: "stdio", or "http" to drive the HTTP transport
+        workers: Worker processes of the HTTP transport
+
+    Returns:
+        A JSON-serializable dict with latency percentiles, throughput, errors,
+        per-tool results and the server's CPU time and peak RSS
+    """
+    weights = parse_mix(mix)
+    names = list(weights)
+    rng = random.Random(seed)
+    dataset = dataset if dataset is not None else FakeDataset()
+    server_env = dict(os.environ, DEVREV_API_KEY=os.environ.get("DEVREV_API_KEY") or "loadgen")
+    server_env.pop("MCP_TEST_MODE", None)
+    if api_url:
+        server_env["DEVREV_API_BASE_URL"] = api_url
+    server_env.update(env or {})
+
+    samples: List[tuple] = []
+
+    async def call(name: str, scheduled: float) -> None:
+        arguments = SCENARIOS[name](rng, dataset)
+        try:
+            message = await client.request(
+                "tools/call", {"name": SCENARIO_TOOLS.get(name, name), "arguments": arguments})
+            failed = _is_error(message)
+        except (ConnectionError, httpx.HTTPError):
+            failed = True
+        samples.append((name, time.perf_counter() - scheduled, failed))
+
+    def next_name() -> str:
+        return rng.choices(names, [weights[name] for name in names])[0]
+
+    usage_before = resource.getrusage(resource.RUSAGE_CHILDREN)
+    if transport == "http":
+        client = HTTPClient(command or DEFAULT_COMMAND, server_env, workers=workers,
+                            connections=max(concurrency, 64))
+    else:
+        client = StdioClient(command or DEFAULT_COMMAND, server_env)
+    time_to_initialize = await client.start()
+    worker_requests = None
+    start = time.perf_counter()
+    deadline = start + duration
+    try:
+        if rate:
+            interval = 1.0 / rate
+            tasks = []
+            sent = 0
+            while (requests is None and time.perf_counter() < deadline) or (requests is not None and sent < requests):
+                scheduled = start + sent * interval
+                delay = scheduled - time.perf_counter()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                tasks.append(asyncio.create_task(call(next_name(), scheduled)))
+                sent += 1
+            await asyncio.gather(*tasks)
+        else:
+            remaining = [requests]
+
+            async def worker() -> None:
+                while True:
+                    if remaining[0] is not None:
+                        if remaining[0] <= 0:
+                            return
+                        remaining[0] -= 1
+                    elif time.perf_counter() >= deadline:
+                        return
+                    await call(next_name(), time.perf_counter())
+
+            await asyncio.gather(*(worker() for _ in range(max(concurrency, 1))))
+        elapsed = time.perf_counter() - start
+        if transport == "http" and workers > 1:
+            worker_requests = await _worker_requests(client)
+    finally:
+        max_rss_kb = _peak_rss_kb(client.proc.pid) if client.proc is not None else None
+        await client.stop()
+    usage_after = resource.getrusage(resource.RUSAGE_CHILDREN)
+
+    per_tool = {}
+    for name in names:
+        latencies = [latency for tool, latency, _ in samples if tool == name]
+        if latencies:
+            per_tool[name] = {
+                "requests": len(latencies),
+                "errors": sum(1 for tool, _, failed in samples if tool == name and failed),
+                "latency_ms": summarize(latencies),
+            }
+
+    return {
+        "config": {
+            "transport": transport, "workers": workers if transport == "http" else 1,
+            "mode": "rate" if rate else "concurrency", "concurrency": None if rate else concurrency,
+            "rate": rate, "duration": duration, "requests": requests, "mix": weights, "seed": seed,
+            "works": len(dataset.works),
+        },
+        "requests": len(samples),
+        "errors": sum(1 for _, _, failed in samples if failed),
+        "elapsed_s": elapsed,
+        "throughput_rps": len(samples) / elapsed if elapsed else 0.0,
+        "latency_ms": summarize([latency for _, latency, _ in samples]),
+        "per_tool": per_tool,
+        "server": {
+            "time_to_initialize_ms": time_to_initialize * 1000,
+            "cpu_user_s": usage_after.ru_utime - usage_before.ru_utime,
+            "cpu_system_s": usage_after.ru_stime - usage_before.ru_stime,
+            "max_rss_kb": max_rss_kb,
+            "worker_requests": worker_requests,
+        },
+        "environment": {
+            "python": platform.python_version(), "platform": platform.platform(),
+            "cpus": os.cpu_count(), "commit": _git_commit(), "timestamp": time.time(),
+        },
+    }
+
+
+def _peak_rss_kb(pid: int) -> Optional[int]:
+    """
+    Return the peak resident set size of a process, summed with that of its descendants, in KiB.
+
+    The peaks are read from /proc while the processes are alive, so they
+    cover this run's server (and its pre-fork workers) only. Returns None
+    where /proc is not available.
+    """
+    children: Dict[int, List[int]] = {}
+    try:
+        entries = [name for name in os.listdir("/proc") if name.isdigit()]
+    except OSError:
+        return None
+    for name in entries:
+        try:
+            with open(f"/proc/{name}/stat") as f:
+                # The parent PID follows the parenthesized command name.
+                ppid = int(f.read().rsplit(")", 1)[1].split()[1])
+        except (OSError, IndexError, ValueError):
+            continue
+        children.setdefault(ppid, []).append(int(name))
+
+    total = 0
+    found = False
+    pending = [pid]
+    while pending:
+        current = pending.pop()
+        pending.extend(children.get(current, []))
+        try:
+            with open(f"/proc/{current}/status") as f:
+                for line in f:
+                    if line.startswith("VmHWM:"):
+                        total += int(line.split()[1])
+                        found = True
+                        break
+        except (OSError, ValueError):
+            continue
+    return total if found else None
+
+
+async def _worker_requests(client: HTTPClient) -> Optional[Dict[str, int]]:
+    """Return how many HTTP requests each pre-fork worker served, from get_diagnostics."""
+    # Workers publish their counters about once a second
+    await asyncio.sleep(1.5)
+    message = await client.request("tools/call", {"name": "get_diagnostics", "arguments": {}})
+    try:
+        text = message["result"]["content"][0]["text"]
+        per_worker = json.loads(text.split("\n", 1)[1])["workers"]["per_worker"]
+    except (KeyError, IndexError, ValueError):
+        return None
+    return {name: snapshot["http"]["requests"] for name, snapshot in per_worker.items()}
+
+
+def _git_commit() -> Optional[str]:
+    """Return the current git commit, if the working directory is a git checkout."""
+    try:
+        return subprocess.run(["git", "rev-parse", "HEAD"], capture_output=True, text=True,
+                              timeout=5, check=True).stdout.strip()
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+def format_summary(results: Dict[str, Any]) -> str:
+    """Format results as a short human-readable report."""
+    latency = results["latency_ms"]
+    server = results["server"]
+    lines = [
+        f"{results['requests']} requests, {results['errors']} errors in {results['elapsed_s']:.2f}s "
+        f"({results['throughput_rps']:.1f} req/s)",
+        f"latency ms: p50 {latency['p50']:.2f}  p95 {latency['p95']:.2f}  p99 {latency['p99']:.2f}  max {latency['max']:.2f}",
+        f"server: cpu {server['cpu_user_s'] + server['cpu_system_s']:.2f}s, max rss "
+        f"{'n/a' if server['max_rss_kb'] is None else format(server['max_rss_kb'] / 1024, '.1f') + ' MiB'}, "
+        f"initialize {server['time_to_initialize_ms']:.0f} ms",
+    ]
+    if server.get("worker_requests"):
+        lines.append("workers: " + ", ".join(f"{name} {count}" for name, count in server["worker_requests"].items()))
+    for name, tool in results["per_tool"].items():
+        lines.append(f"  {name}: {tool['requests']} requests, {tool['errors']} errors, "
+                     f"p50 {tool['latency_ms']['p50']:.2f} ms, p99 {tool['latency_ms']['p99']:.2f} ms")
+    return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Run the load generator from the command line."""
+    parser = argparse.ArgumentParser(prog="devrev-mcp-loadgen", description="End-to-end devrev-mcp load generator")
+    parser.add_argument("--command", help="Server command line (default: this package's devrev-mcp entry point)")
+    parser.add_argument("--transport", choices=["stdio", "http"], default="stdio",
+                        help="Drive the server over stdio (default) or over its HTTP transport")
+    parser.add_argument("--workers", type=int, default=1, help="Worker processes of the HTTP transport (default 1)")
+    parser.add_argument("--mix", default=DEFAULT_MIX,
+                        help=f"Scenario weights (default {DEFAULT_MIX}); scenarios: {', '.join(sorted(SCENARIOS))}")
+    parser.add_argument("--concurrency", type=int, default=8, help="Concurrent clients (default 8)")
+    parser.add_argument("--rate", type=float, help="Requests started per second, instead of a fixed concurrency")
+    parser.add_argument("--duration", type=float, default=10.0, help="Seconds to run for (default 10)")
+    parser.add_argument("--requests", type=int, help="Total requests to send, instead of a duration")
+    parser.add_argument("--seed", type=int, default=0, help="Seed of the dataset and request choices")
+    parser.add_argument("--works", type=int, default=1000, help="Work items in the fake API's dataset (default 1000)")
+    parser.add_argument("--api-latency", type=float, default=0.0, help="Seconds the fake API adds to every response")
+    parser.add_argument("--api-jitter", type=float, default=0.0, help="Extra random latency of the fake API in seconds")
+    parser.add_argument("--api-error-rate", type=float, default=0.0, help="Failure rate injected by the fake API")
+    parser.add_argument("--env", action="append", default=[], metavar="NAME=VALUE",
+                        help="Environment variable of the server; may be repeated")
+    parser.add_argument("--output", help="Write the results as JSON to this file")
+    args = parser.parse_args(argv)
+
+    dataset = FakeDataset(works=args.works, seed=args.seed)
+    api = FakeDevRevAPI(dataset, latency=args.api_latency, jitter=args.api_jitter,
+                        error_rate=args.api_error_rate, seed=args.seed).start()
+    try:
+        results = asyncio.run(run_load(
+            command=shlex.split(args.command) if args.command else None, api_url=api.url, dataset=dataset,
+            mix=args.mix, concurrency=args.concurrency, rate=args.rate, duration=args.duration,
+            requests=args.requests, seed=args.seed, env=dict(item.split("=", 1) for item in args.env),
+            transport=args.transport, workers=args.workers))
+    finally:
+        api.stop()
+
+    print(format_summary(results), file=sys.stderr)
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+    else:
+        print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
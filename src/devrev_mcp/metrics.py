@@ -0,0 +1,268 @@
+"""
+Copyright (c) 2025 DevRev, Inc.
+SPDX-License-Identifier: MIT
+
+This module provides per-tool and per-endpoint metrics and their Prometheus text exposition.
+"""
+
+import logging
+import sys
+import threading
+from bisect import bisect_left
+from typing import Any, Dict, List, Optional, Tuple
+
+
+logger = logging.getLogger(__name__)
+
+# Upper bounds of the latency histogram buckets, in seconds.
+BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+PREFIX = "devrev_mcp"
+
+
+class Histogram:
+    """Counts of observations per latency bucket, with their sum."""
+
+    __slots__ = ("counts", "sum")
+
+    def __init__(self):
+        self.counts = [0] * (len(BUCKETS) + 1)
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(BUCKETS, value)] += 1
+        self.sum += value
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Return the cumulative bucket counts keyed by upper bound, as Prometheus reports them."""
+        buckets = {}
+        total = 0
+        for bound, count in zip((*map(_format_number, BUCKETS), "+Inf"), self.counts):
+            total += count
+            buckets[bound] = total
+        return {"buckets": buckets, "sum": self.sum, "count": total}
+
+
+class _ToolStats:
+    __slots__ = ("calls", "errors", "response_bytes", "duration")
+
+    def __init__(self):
+        self.calls = 0
+        self.errors = 0
+        self.response_bytes = 0
+        self.duration = Histogram()
+
+
+class _EndpointStats:
+    __slots__ = ("requests", "errors", "cache_hits", "retries", "request_bytes", "response_bytes", "duration")
+
+    def __init__(self):
+        self.requests = 0
+        self.errors = 0
+        self.cache_hits = 0
+        self.retries = 0
+        self.request_bytes = 0
+        self.response_bytes = 0
+        self.duration = Histogram()
+
+
+class Metrics:
+    """
+    Thread-safe counters and latency histograms per tool and per DevRev API endpoint.
+
+    Recording an observation takes one uncontended lock and a few integer
+    updates, so it can stay on the hot path of every tool call and request.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._tools: Dict[str, _ToolStats] = {}
+        self._endpoints: Dict[str, _EndpointStats] = {}
+
+    def _tool(self, name: str) -> _ToolStats:
+        stats = self._tools.get(name)
+        if stats is None:
+            stats = self._tools[name] = _ToolStats()
+        return stats
+
+    def _endpoint(self, path: str) -> _EndpointStats:
+        stats = self._endpoints.get(path)
+        if stats is None:
+            stats = self._endpoints[path] = _EndpointStats()
+        return stats
+
+    def observe_tool(self, name: str, seconds: float, error: bool, response_bytes: int = 0) -> None:
+        """Record a tool call, its latency, whether it failed and the size of its result."""
+        with self._lock:
+            stats = self._tool(name)
+            stats.calls += 1
+            stats.errors += error
+            stats.response_bytes += response_bytes
+            stats.duration.observe(seconds)
+
+    def observe_request(self, path: str, seconds: float, error: bool) -> None:
+        """Record a DevRev API request as the tools see it, whether or not it reached the API."""
+        with self._lock:
+            stats = self._endpoint(path)
+            stats.requests += 1
+            stats.errors += error
+            stats.duration.observe(seconds)
+
+    def observe_upstream(self, path: str, request_bytes: int, response_bytes: int) -> None:
+        """Record the bytes sent and received by one HTTP call to the DevRev API."""
+        with self._lock:
+            stats = self._endpoint(path)
+            stats.request_bytes += request_bytes
+            stats.response_bytes += response_bytes
+
+    def count_cache_hit(self, path: str) -> None:
+        """Record a request answered from one of the caches."""
+        with self._lock:
+            self._endpoint(path).cache_hits += 1
+
+    def observe_cache_hit(self, path: str) -> None:
+        """Record a request the server answered from its own caches, without calling the request helpers."""
+        with self._lock:
+            stats = self._endpoint(path)
+            stats.requests += 1
+            stats.cache_hits += 1
+            stats.duration.observe(0.0)
+
+    def count_retries(self, path: str, retries: int) -> None:
+        """Record the retries a request needed."""
+        with self._lock:
+            self._endpoint(path).retries += retries
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Return all metrics as plain data.
+
+        Every leaf is a number, so snapshots of several worker processes can
+        be added up with workers.aggregate.
+        """
+        with self._lock:
+            return {
+                "tools": {name: {
+                    "calls": stats.calls,
+                    "errors": stats.errors,
+                    "response_bytes": stats.response_bytes,
+                    "duration_seconds": stats.duration.snapshot(),
+                } for name, stats in self._tools.items()},
+                "endpoints": {path: {
+                    "requests": stats.requests,
+                    "errors": stats.errors,
+                    "cache_hits": stats.cache_hits,
+                    "retries": stats.retries,
+                    "request_bytes": stats.request_bytes,
+                    "response_bytes": stats.response_bytes,
+                    "duration_seconds": stats.duration.snapshot(),
+                } for path, stats in self._endpoints.items()},
+            }
+
+    def reset(self) -> None:
+        """Forget every observation."""
+        with self._lock:
+            self._tools.clear()
+            self._endpoints.clear()
+
+
+_metrics = Metrics()
+
+
+def get_metrics() -> Metrics:
+    """Return the process-wide metrics."""
+    return _metrics
+
+
+def reset_metrics() -> None:
+    """Forget every observation of the process-wide metrics."""
+    _metrics.reset()
+
+
+# Metric name suffix, type, help text and snapshot field of every metric, per label.
+_FAMILIES: Dict[str, Tuple[str, List[Tuple[str, str, str, str]]]] = {
+    "tools": ("tool", [
+        ("tool_calls_total", "counter", "Tool calls handled.", "calls"),
+        ("tool_errors_total", "counter", "Tool calls that raised an error.", "errors"),
+        ("tool_response_bytes_total", "counter", "UTF-8 bytes of text returned by tool calls.", "response_bytes"),
+        ("tool_duration_seconds", "histogram", "Tool call latency.", "duration_seconds"),
+    ]),
+    "endpoints": ("endpoint", [
+        ("api_requests_total", "counter", "DevRev API requests made by tools, including those served from a cache.",
+         "requests"),
+        ("api_errors_total", "counter", "DevRev API requests that raised or returned an error status.", "errors"),
+        ("api_cache_hits_total", "counter", "DevRev API requests answered from a cache.", "cache_hits"),
+        ("api_retries_total", "counter", "Retries of DevRev API requests.", "retries"),
+        ("api_request_bytes_total", "counter", "Bytes of request bodies sent to the DevRev API.", "request_bytes"),
+        ("api_response_bytes_total", "counter", "Bytes of response bodies received from the DevRev API.",
+         "response_bytes"),
+        ("api_request_duration_seconds", "histogram", "DevRev API request latency, including cache hits and retries.",
+         "duration_seconds"),
+    ]),
+}
+
+
+def _format_number(value: float) -> str:
+    if isinstance(value, float) and value.is_integer():
+        return f"{value:.1f}"
+    return repr(value)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def render(snapshot: Optional[Dict[str, Any]] = None) -> str:
+    """
+    Format a metrics snapshot in the Prometheus text exposition format.
+
+    Args:
+        snapshot: A snapshot returned by Metrics.snapshot, or a sum of several;
+            defaults to the current process-wide metrics
+
+    Returns:
+        The exposition text
+    """
+    if snapshot is None:
+        snapshot = _metrics.snapshot()
+    lines = []
+    for group, (label, families) in _FAMILIES.items():
+        series = sorted((snapshot.get(group) or {}).items())
+        for suffix, kind, help_text, field in families:
+            name = f"{PREFIX}_{suffix}"
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {kind}")
+            for key, stats in series:
+                labels = f'{label}="{_escape(key)}"'
+                value = stats[field]
+                if kind == "histogram":
+                    for bound, count in value["buckets"].items():
+                        lines.append(f'{name}_bucket{{{labels},le="{bound}"}} {count}')
+                    lines.append(f"{name}_sum{{{labels}}} {value['sum']!r}")
+                    lines.append(f"{name}_count{{{labels}}} {value['count']}")
+                else:
+                    lines.append(f"{name}{{{labels}}} {value}")
+    return "\n".join(lines) + "\n"
+
+
+def dump(destination: Optional[str]) -> None:
+    """
+    Write the process-wide metrics in the Prometheus text format.
+
+    Args:
+        destination: A file path, "-" for stderr, or None or "" to write nothing
+    """
+    if not destination:
+        return
+    text = render()
+    if destination == "-":
+        sys.stderr.write(text)
+        sys.stderr.flush()
+        return
+    try:
+        with open(destination, "w") as f:
+            f.write(text)
+    except OSError as e:
+        logger.warning("Could not write metrics to %s: %s", destination, e)
@@ -0,0 +1,356 @@
+"""
+Copyright (c) 2025 DevRev, Inc.
+SPDX-License-Identifier: MIT
+
+This module provides the retry policy, rate limiter and per-tool-call deadline used by the DevRev API client.
+"""
+
+import asyncio
+import contextvars
+import os
+import random
+import threading
+import time
+from contextlib import contextmanager
+from email.utils import parsedate_to_datetime
+from typing import Any, Callable, Dict, Iterator, Optional
+
+from .lazy import LazyModule
+
+requests = LazyModule("requests")
+
+
+# Default time budget of one tool call, overridable with DEVREV_MCP_CALL_DEADLINE.
+DEFAULT_CALL_DEADLINE_SECONDS = 60.0
+
+# Monotonic time by which the current tool call must finish, if any.
+_call_deadline: contextvars.ContextVar[Optional[float]] = contextvars.ContextVar(
+    "devrev_call_deadline", default=None)
+
+
+def _env_number(name: str, default: float) -> float:
+    """Read a non-negative number from the environment, falling back to default."""
+    try:
+        value = float(os.environ.get(name, default))
+    except ValueError:
+        return default
+    return value if value >= 0 else default
+
+
+@contextmanager
+def call_deadline(seconds: Optional[float] = None) -> Iterator[float]:
+    """
+    Bound the current tool call, and every request it makes, by one time budget.
+
+    A deadline that is already set by an enclosing call is kept if it is
+    earlier, so nested tool calls share the outer budget.
+
+    Args:
+        seconds: The budget in seconds. Defaults to DEVREV_MCP_CALL_DEADLINE (60).
+    """
+    if seconds is None:
+        seconds = _env_number("DEVREV_MCP_CALL_DEADLINE", DEFAULT_CALL_DEADLINE_SECONDS)
+    deadline = time.monotonic() + seconds
+    outer = _call_deadline.get()
+    if outer is not None:
+        deadline = min(deadline, outer)
+    token = _call_deadline.set(deadline)
+    try:
+        yield deadline
+    finally:
+        _call_deadline.reset(token)
+
+
+def deadline_remaining() -> Optional[float]:
+    """Return the seconds left before the current call's deadline, or None if unbounded."""
+    deadline = _call_deadline.get()
+    if deadline is None:
+        return None
+    return deadline - time.monotonic()
+
+
+class DeadlineExceededError(Exception):
+    """Raised instead of starting work that cannot finish before the tool call's deadline."""
+
+
+def check_deadline(needed: float = 0.0) -> Optional[float]:
+    """
+    Return the seconds left before the current call's deadline, or None if unbounded.
+
+    Args:
+        needed: Seconds the caller is about to wait before it can proceed
+
+    Raises:
+        DeadlineExceededError: If fewer than needed seconds are left
+    """
+    remaining = deadline_remaining()
+    if remaining is not None and remaining <= needed:
+        raise DeadlineExceededError("Tool call deadline exceeded; giving up on the remaining DevRev API requests")
+    return remaining
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header given either as seconds or as an HTTP date."""
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(retry_at.timestamp() - time.time(), 0.0)
+
+
+def _sleep(seconds: float) -> None:
+    time.sleep(seconds)
+
+
+_retry_lock = threading.Lock()
+_retry_counts = {"retries": 0, "exhausted": 0}
+
+
+def retry_stats() -> Dict[str, int]:
+    """Return how many retries were made and how many requests ran out of retries."""
+    with _retry_lock:
+        return dict(_retry_counts)
+
+
+def _count(name: str) -> None:
+    with _retry_lock:
+        _retry_counts[name] += 1
+
+
+class RetryPolicy:
+    """
+    Retry transient DevRev API failures with capped exponential backoff.
+
+    Connection errors, timeouts and RETRY_STATUSES responses are retried up
+    to max_attempts attempts in total. The delay before attempt n + 1 is drawn
+    uniformly from [0, min(backoff_max, backoff_base * 2 ** n)] ("full
+    jitter"), unless the response carries a Retry-After header, which is
+    honored as given. No retry is made if its delay would overrun the
+    current tool call's deadline.
+    """
+
+    RETRY_STATUSES = frozenset({429, 502, 503, 504})
+
+    def __init__(self, max_attempts: int = 3, backoff_base: float = 0.5, backoff_max: float = 8.0):
+        self.max_attempts = max(int(max_attempts), 1)
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+
+    @classmethod
+    def from_env(cls) -> "RetryPolicy":
+        """
+        Build a policy from the environment:
+        - DEVREV_RETRY_MAX_ATTEMPTS: attempts per request, including the first (default 3)
+        - DEVREV_RETRY_BACKOFF_BASE: backoff of the first retry in seconds (default 0.5)
+        - DEVREV_RETRY_BACKOFF_MAX: maximum backoff in seconds (default 8)
+        """
+        return cls(
+            max_attempts=_env_number("DEVREV_RETRY_MAX_ATTEMPTS", 3),
+            backoff_base=_env_number("DEVREV_RETRY_BACKOFF_BASE", 0.5),
+            backoff_max=_env_number("DEVREV_RETRY_BACKOFF_MAX", 8.0),
+        )
+
+    def backoff(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        """Return the delay before retrying after the given zero-based attempt."""
+        if retry_after is not None:
+            return retry_after
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * 2 ** attempt))
+
+    def call(self, send: Callable[[], Any]) -> Any:
+        """Call send, retrying transient failures. Returns the last response or raises the last error."""
+        attempt = 0
+        while True:
+            error = None
+            response = None
+            try:
+                response = send()
+            except (requests.ConnectionError, requests.Timeout) as e:
+                error = e
+
+            if error is None and response.status_code not in self.RETRY_STATUSES:
+                return response
+            if attempt + 1 >= self.max_attempts:
+                _count("exhausted")
+                break
+
+            retry_after = None
+            if response is not None:
+                retry_after = parse_retry_after(response.headers.get("Retry-After"))
+            delay = self.backoff(attempt, retry_after)
+            remaining = deadline_remaining()
+            if remaining is not None and delay >= remaining:
+                _count("exhausted")
+                break
+
+            _count("retries")
+            _sleep(delay)
+            attempt += 1
+
+        if error is not None:
+            raise error
+        return response
+
+
+class TokenBucket:
+    """
+    A token bucket refilled at rate tokens per second, holding at most burst tokens.
+
+    reserve() always takes a token and returns how long the caller must wait
+    for it. Tokens taken while the bucket is empty are borrowed from future
+    refills, so waiting callers are admitted in order, one every 1 / rate
+    seconds, instead of being rejected.
+    """
+
+    def __init__(self, rate: float, burst: Optional[float] = None, clock: Callable[[], float] = time.monotonic):
+        self.rate = rate
+        self.burst = max(burst if burst is not None else rate, 1.0)
+        self._clock = clock
+        self._tokens = self.burst
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Take one token and return the seconds to wait before using it."""
+        with self._lock:
+            now = self._clock()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+
+def _parse_rate(spec: str) -> tuple[float, Optional[float]]:
+    """Parse a "rate" or "rate:burst" limit specification."""
+    rate, _, burst = spec.partition(":")
+    return float(rate), float(burst) if burst else None
+
+
+class RateLimiter:
+    """
+    Client-side request rate limiting with a global bucket and per-endpoint buckets.
+
+    A request waits until both the global bucket and its endpoint's bucket
+    grant a token, so bursts from batch and pagination tools are spread out
+    instead of being answered with 429s. A rate of 0 leaves that bucket
+    unlimited.
+    """
+
+    def __init__(self, global_rate: float = 0.0, global_burst: Optional[float] = None,
+                 endpoint_rate: float = 0.0, endpoint_rates: Optional[Dict[str, tuple[float, Optional[float]]]] = None):
+        self._global = TokenBucket(global_rate, global_burst) if global_rate > 0 else None
+        self._endpoint_rate = endpoint_rate
+        self._endpoint_rates = dict(endpoint_rates or {})
+        self._buckets: Dict[str, Optional[TokenBucket]] = {}
+        self._lock = threading.Lock()
+        self._throttled: Dict[str, Dict[str, float]] = {}
+
+    @classmethod
+    def from_env(cls) -> "RateLimiter":
+        """
+        Build a limiter from the environment:
+        - DEVREV_RATE_LIMIT: global requests per second (default 0, unlimited)
+        - DEVREV_RATE_LIMIT_BURST: requests the global bucket admits at once (default: the rate)
+        - DEVREV_RATE_LIMIT_ENDPOINT: requests per second for each endpoint (default 0, unlimited)
+        - DEVREV_RATE_LIMIT_ENDPOINTS: per-endpoint overrides such as "works.list=5,search.hybrid=2:4",
+          each given as rate or rate:burst
+        """
+        endpoint_rates = {}
+        for item in os.environ.get("DEVREV_RATE_LIMIT_ENDPOINTS", "").split(","):
+            endpoint, _, spec = item.strip().partition("=")
+            if not endpoint or not spec:
+                continue
+            try:
+                endpoint_rates[endpoint] = _parse_rate(spec)
+            except ValueError:
+                continue
+        return cls(
+            global_rate=_env_number("DEVREV_RATE_LIMIT", 0.0),
+            global_burst=_env_number("DEVREV_RATE_LIMIT_BURST", 0.0) or None,
+            endpoint_rate=_env_number("DEVREV_RATE_LIMIT_ENDPOINT", 0.0),
+            endpoint_rates=endpoint_rates,
+        )
+
+    def _bucket(self, endpoint: str) -> Optional[TokenBucket]:
+        with self._lock:
+            if endpoint not in self._buckets:
+                rate, burst = self._endpoint_rates.get(endpoint, (self._endpoint_rate, None))
+                self._buckets[endpoint] = TokenBucket(rate, burst) if rate > 0 else None
+            return self._buckets[endpoint]
+
+    def reserve(self, endpoint: str) -> float:
+        """Take a token for a request to endpoint and return the seconds to wait before sending it."""
+        delay = 0.0
+        for bucket in (self._global, self._bucket(endpoint)):
+            if bucket is not None:
+                delay = max(delay, bucket.reserve())
+        if delay > 0:
+            with self._lock:
+                stats = self._throttled.setdefault(endpoint, {"throttled": 0, "throttled_seconds": 0.0})
+                stats["throttled"] += 1
+                stats["throttled_seconds"] += delay
+        return delay
+
+    async def acquire(self, endpoint: str) -> None:
+        """
+        Wait on the event loop until a request to endpoint may be sent.
+
+        Raises:
+            DeadlineExceededError: If the wait would outlast the tool call's deadline
+        """
+        delay = self.reserve(endpoint)
+        if delay > 0:
+            check_deadline(delay)
+            await asyncio.sleep(delay)
+
+    def wait(self, endpoint: str) -> None:
+        """
+        Block the calling thread until a request to endpoint may be sent.
+
+        Raises:
+            DeadlineExceededError: If the wait would outlast the tool call's deadline
+        """
+        delay = self.reserve(endpoint)
+        if delay > 0:
+            check_deadline(delay)
+            _sleep(delay)
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        """Return, per endpoint, how many requests were throttled and for how many seconds in total."""
+        with self._lock:
+            return {endpoint: dict(stats) for endpoint, stats in self._throttled.items()}
+
+
+_rate_limiter: Optional[RateLimiter] = None
+_rate_limiter_lock = threading.Lock()
+
+
+def get_rate_limiter() -> RateLimiter:
+    """Return the process-wide rate limiter, configuring it from the environment on first use."""
+    global _rate_limiter
+    limiter = _rate_limiter
+    if limiter is None:
+        with _rate_limiter_lock:
+            if _rate_limiter is None:
+                _rate_limiter = RateLimiter.from_env()
+            limiter = _rate_limiter
+    return limiter
+
+
+def reset_rate_limiter() -> None:
+    """Drop the rate limiter so it is rebuilt from the environment on next use."""
+    global _rate_limiter
+    with _rate_limiter_lock:
+        _rate_limiter = None
+
+
+def rate_limit_stats() -> Dict[str, Dict[str, float]]:
+    """Return the throttling counters of the process-wide rate limiter."""
+    return get_rate_limiter().stats()
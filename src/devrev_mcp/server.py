@@ -6,21 +6,37 @@ This module implements the MCP server for DevRev integration.
 """
 
 import asyncio
+import contextvars
 import os
-import requests
+import time
 import json
-from typing import Any, Dict
+from typing import Any, Awaitable, Callable, Dict
 
 from mcp.server.models import InitializationOptions
 import mcp.types as types
 from mcp.server import NotificationOptions, Server
-from pydantic import AnyUrl
+from pydantic import AnyUrl, PrivateAttr
 import mcp.server.stdio
-from .utils import make_devrev_request, make_internal_devrev_request
+from . import cache, disk_cache, metrics, workers
+from .lazy import LazyModule
+from .formatting import compile_fields, decode_response, dumps, format_response, format_value, project
+from .resilience import DeadlineExceededError, call_deadline, rate_limit_stats, retry_stats
+from .utils import (
+    CircuitOpenError,
+    circuit_breaker_stats,
+    close_session,
+    coalescing_stats,
+    get_api_key,
+    make_devrev_request_async,
+    make_internal_devrev_request_async,
+    refreshing,
+    using_api_key,
+)
 
-from requests.exceptions import JSONDecodeError as RequestsJSONDecodeError
 from json import JSONDecodeError as StdJSONDecodeError
 
+requests = LazyModule("requests")
+
 
 def safe_json(response: Any) -> Dict[str, Any]:
     """Return parsed JSON from a response-like object, but never raise an exception."""
@@ -33,852 +49,1617 @@ def safe_json(response: Any) -> Dict[str, Any]:
         return {"error": "Malformed response", "raw": text}
 
 
+# In-flight dev-users.self requests, shared by concurrent callers of the same key.
+_current_user_fetches: Dict[str, asyncio.Task] = {}
+
+
+async def _get_current_user() -> Any:
+    """
+    Return the dev-users.self response for the current API key.
+
+    Successful responses are kept in the "current_users" cache under a hash
+    of the API key, so raw keys are never held by the cache, and concurrent
+    first calls share a single request. Failed responses are returned but
+    not kept.
+    """
+    key = disk_cache.cache_key(get_api_key() or "", "dev-users.self", {})
+    response = cache.get_cache("current_users").get(key)
+    if response is not None:
+        metrics.get_metrics().observe_cache_hit("dev-users.self")
+        return response
+
+    task = _current_user_fetches.get(key)
+    if task is None:
+        task = asyncio.create_task(make_devrev_request_async("dev-users.self", {}))
+        _current_user_fetches[key] = task
+
+        def _on_done(done: asyncio.Task) -> None:
+            _current_user_fetches.pop(key, None)
+            if not done.cancelled() and done.exception() is None and done.result().status_code == 200:
+                cache.get_cache("current_users").set(key, done.result())
+
+        task.add_done_callback(_on_done)
+    return await asyncio.shield(task)
+
+
+async def prefetch_current_user() -> None:
+    """Warm the current user memo so the first "me" lookup is served locally. Failures are ignored."""
+    try:
+        await _get_current_user()
+    except Exception:
+        pass
+
+
+async def _resolve_me(user_ids: Any) -> Any:
+    """
+    Replace "me" in a list of user IDs with the ID of the current user.
+
+    Raises:
+        ValueError: If "me" is given and the current user cannot be fetched
+    """
+    if not isinstance(user_ids, list) or not any(isinstance(value, str) and value.lower() == "me" for value in user_ids):
+        return user_ids
+    response = await _get_current_user()
+    if response.status_code != 200:
+        raise ValueError(f"Could not resolve 'me': get current user failed with status {response.status_code}: {response.text}")
+    user_id = decode_response(response).get("dev_user", {}).get("id")
+    if not user_id:
+        raise ValueError("Could not resolve 'me': the current user has no ID")
+    return [user_id if isinstance(value, str) and value.lower() == "me" else value for value in user_ids]
+
+
+# Default soft and hard TTLs in seconds of stale-while-revalidate responses,
+# overridable with DEVREV_MCP_SWR_SOFT_TTL, DEVREV_MCP_SWR_HARD_TTL and,
+# per endpoint, DEVREV_MCP_SWR_TTLS.
+DEFAULT_SWR_SOFT_TTL = 60.0
+DEFAULT_SWR_HARD_TTL = 3600.0
+
+# In-flight stale-while-revalidate fetches, shared by concurrent callers and refreshes.
+_swr_fetches: Dict[tuple, asyncio.Task] = {}
+
+
+def _swr_ttls(endpoint: str) -> tuple[float, float]:
+    """Return the (soft, hard) TTLs of an endpoint, e.g. from DEVREV_MCP_SWR_TTLS="vistas.groups.list=30:600"."""
+    def number(value: Any, default: float) -> float:
+        try:
+            return max(float(value), 0.0)
+        except (TypeError, ValueError):
+            return default
+
+    soft = number(os.environ.get("DEVREV_MCP_SWR_SOFT_TTL"), DEFAULT_SWR_SOFT_TTL)
+    hard = number(os.environ.get("DEVREV_MCP_SWR_HARD_TTL"), DEFAULT_SWR_HARD_TTL)
+    for item in os.environ.get("DEVREV_MCP_SWR_TTLS", "").split(","):
+        name, _, spec = item.strip().partition("=")
+        if name == endpoint:
+            override_soft, _, override_hard = spec.partition(":")
+            soft = number(override_soft or None, soft)
+            hard = number(override_hard or None, hard)
+    return soft, max(hard, soft)
+
+
+async def _fetch_swr(key: tuple, endpoint: str, payload: Dict[str, Any], refresh: bool) -> Any:
+    """Fetch a stale-while-revalidate response and cache it if successful. Refreshes bypass the on-disk cache."""
+    with using_api_key(key[0]), call_deadline():
+        if refresh:
+            with refreshing():
+                response = await make_devrev_request_async(endpoint, payload)
+        else:
+            response = await make_devrev_request_async(endpoint, payload)
+    if response.status_code == 200:
+        cache.get_cache("swr").set(key, (time.monotonic(), response), ttl=_swr_ttls(endpoint)[1])
+    return response
+
+
+def _start_swr_fetch(key: tuple, endpoint: str, payload: Dict[str, Any], refresh: bool) -> asyncio.Task:
+    """
+    Start a shared fetch of key, or return the one in flight.
+
+    A background refresh runs detached from the caller's context, so it is
+    not bound by the deadline of the tool call that triggered it.
+    """
+    task = _swr_fetches.get(key)
+    if task is None:
+        task = asyncio.create_task(
+            _fetch_swr(key, endpoint, payload, refresh),
+            context=contextvars.Context() if refresh else None)
+        _swr_fetches[key] = task
+
+        def _on_done(done: asyncio.Task) -> None:
+            _swr_fetches.pop(key, None)
+            if not done.cancelled():
+                # Retrieve the exception so a failed background refresh is not reported as unhandled.
+                done.exception()
+
+        task.add_done_callback(_on_done)
+    return task
+
+
+async def _request_swr(endpoint: str, payload: Dict[str, Any]) -> Any:
+    """
+    Request a read-only endpoint through the stale-while-revalidate cache.
+
+    A cached response is returned immediately. Once it is older than the soft
+    TTL a background refresh replaces it, and after the hard TTL it expires
+    and the next call waits for a fresh response. Failed refreshes keep the
+    cached response until it expires.
+    """
+    key = (get_api_key(), endpoint, dumps(payload))
+    entry = cache.get_cache("swr").get(key)
+    if entry is None:
+        return await asyncio.shield(_start_swr_fetch(key, endpoint, payload, refresh=False))
+
+    metrics.get_metrics().observe_cache_hit(endpoint)
+    fetched_at, response = entry
+    if time.monotonic() - fetched_at >= _swr_ttls(endpoint)[0]:
+        _start_swr_fetch(key, endpoint, payload, refresh=True)
+    return response
+
+
+# Stage diagram stages are cached in the "stage_diagrams" cache keyed by
+# (API key, leaf_type, subtype). Stage diagrams rarely change, so a warm
+# valid_stage_transition call only costs the works.get or parts.get
+# round-trip for the object itself.
+# In-flight stage diagram fetches, shared by concurrent callers of the same key.
+_stage_diagram_fetches: Dict[tuple, asyncio.Task] = {}
+
+
+class _StageDiagramError(Exception):
+    """Raised when the schema or stage diagram for a leaf type cannot be fetched."""
+
+
+def clear_caches() -> None:
+    """Drop every cached API result held by the server."""
+    cache.clear_caches()
+
+
+async def _fetch_stage_diagram_stages(leaf_type: Any, subtype: Any) -> list:
+    """Fetch the aggregated schema, then the stage diagram it references."""
+    schema_payload = {}
+    if (leaf_type != {}):
+        schema_payload["leaf_type"] = leaf_type
+    if (subtype != {}):
+        schema_payload["custom_schema_spec"] = {"subtype": subtype}
+
+    schema_response = await make_devrev_request_async(
+        "schemas.aggregated.get",
+        schema_payload
+    )
+
+    if schema_response.status_code != 200:
+        raise _StageDiagramError(
+            f"Get schema failed with status {schema_response.status_code}: {schema_response.text}")
+
+    stage_diagram_id = decode_response(schema_response).get(
+        "schema", {}).get("stage_diagram_id", {}).get("id", {})
+    if stage_diagram_id == None:
+        raise ValueError("Could not get stage diagram id")
+
+    stage_transitions_response = await make_devrev_request_async(
+        "stage-diagrams.get",
+        {"id": stage_diagram_id}
+    )
+
+    if stage_transitions_response.status_code != 200:
+        raise _StageDiagramError(
+            f"Get stage diagram for Get stage transitions failed with status {stage_transitions_response.status_code}: {stage_transitions_response.text}")
+
+    return decode_response(stage_transitions_response).get(
+        "stage_diagram", {}).get("stages", [])
+
+
+async def _get_stage_diagram_stages(leaf_type: Any, subtype: Any) -> list:
+    """
+    Return the stages of the stage diagram for (leaf_type, subtype).
+
+    Results are cached, and concurrent lookups of an uncached key share a
+    single schema/stage diagram fetch. Failed fetches are not cached.
+    """
+    key = (get_api_key(), leaf_type, None if subtype == {} else subtype)
+    stages = cache.get_cache("stage_diagrams").get(key)
+    if stages is not None:
+        # A hit saves both requests of the lookup
+        metrics.get_metrics().observe_cache_hit("schemas.aggregated.get")
+        metrics.get_metrics().observe_cache_hit("stage-diagrams.get")
+        return stages
+
+    task = _stage_diagram_fetches.get(key)
+    if task is None:
+        task = asyncio.create_task(_fetch_stage_diagram_stages(leaf_type, subtype))
+        _stage_diagram_fetches[key] = task
+
+        def _on_done(done: asyncio.Task) -> None:
+            _stage_diagram_fetches.pop(key, None)
+            if not done.cancelled() and done.exception() is None:
+                cache.get_cache("stage_diagrams").set(key, done.result())
+
+        task.add_done_callback(_on_done)
+    return await asyncio.shield(task)
+
+
 server = Server("devrev_mcp")
 
 
-@server.list_tools()
-async def handle_list_tools() -> list[types.Tool]:
+# Tool registry. Each tool's schema is declared next to its handler with the
+# @tool decorator; TOOLS keeps registration order for tools/list and
+# TOOL_HANDLERS maps a tool name to its handler for O(1) dispatch.
+TOOLS: list[types.Tool] = []
+TOOL_HANDLERS: Dict[str, Callable[[dict | None], Awaitable[list[types.TextContent]]]] = {}
+
+
+def tool(schema: types.Tool):
+    """Register the decorated coroutine as the handler of the given tool schema."""
+    def decorator(func):
+        if schema.name in TOOL_HANDLERS:
+            raise ValueError(f"Duplicate tool: {schema.name}")
+        TOOLS.append(schema)
+        TOOL_HANDLERS[schema.name] = func
+        return func
+    return decorator
+
+
+# Page size requested while following next_cursor server-side.
+LIST_PAGE_SIZE = 100
+# Item budget of an all_pages listing when max_items is not given.
+DEFAULT_MAX_ITEMS = 500
+# Output budget of an all_pages listing, overridable with DEVREV_MCP_MAX_OUTPUT_BYTES.
+DEFAULT_MAX_OUTPUT_BYTES = 512 * 1024
+
+
+class _PageFetchError(Exception):
+    """Raised when the first page of a paginated listing cannot be fetched."""
+
+    def __init__(self, response: Any):
+        super().__init__(response.status_code)
+        self.response = response
+
+
+async def _report_progress(progress: float, total: float | None = None) -> None:
+    """Send an MCP progress notification if the current request asked for one."""
+    try:
+        ctx = server.request_context
+    except LookupError:
+        return
+    token = ctx.meta.progressToken if ctx.meta else None
+    if token is None:
+        return
+    await ctx.session.send_progress_notification(token, progress, total)
+
+
+async def _list_all_pages(endpoint: str, payload: Dict[str, Any], root: str,
+                          fields: list | None, max_items: int) -> str:
     """
-    List available tools.
-    Each tool specifies its arguments using JSON Schema validation.
+    Follow next_cursor server-side and return the listed items as one JSON object.
+
+    The next page is requested before the current one is processed, and each
+    item is projected and serialized as it arrives, so only the output text is
+    retained rather than every decoded page. Later pages are requested in the
+    mode of the caller's cursor, "after" by default. Iteration stops once
+    max_items items are collected or the output exceeds
+    DEVREV_MCP_MAX_OUTPUT_BYTES; the returned next_cursor then resumes from the
+    last returned page. A progress notification is sent after every page.
+
+    All pages share the tool call's deadline. When a later page cannot be
+    fetched, including because the deadline ran out, the pages collected so
+    far are returned with an error and the cursor to resume from.
+
+    Raises:
+        _PageFetchError: If the first page cannot be fetched
+        DeadlineExceededError: If the deadline runs out before the first page
     """
+    tree = compile_fields(tuple(fields)) if fields else None
+    try:
+        max_bytes = int(os.environ.get("DEVREV_MCP_MAX_OUTPUT_BYTES", DEFAULT_MAX_OUTPUT_BYTES))
+    except ValueError:
+        max_bytes = DEFAULT_MAX_OUTPUT_BYTES
+
+    items: list[str] = []
+    size = 0
+    error = None
+    cursor = payload.get("cursor")
+    mode = payload.get("mode", "after")
+    pending = asyncio.create_task(make_devrev_request_async(
+        endpoint, dict(payload, limit=min(max_items, LIST_PAGE_SIZE))))
+    try:
+        while pending is not None:
+            try:
+                response = await pending
+            except (DeadlineExceededError, CircuitOpenError, requests.RequestException) as e:
+                if not items:
+                    raise
+                error = f"Fetching the next page failed: {e}"
+                break
+            finally:
+                pending = None
+            if response.status_code != 200:
+                if not items:
+                    raise _PageFetchError(response)
+                error = f"Fetching the next page failed with status {response.status_code}: {response.text}"
+                break
+
+            page = decode_response(response)
+            page_items = page.get(root, [])[:max_items - len(items)]
+            cursor = page.get("next_cursor")
+            del page
+
+            remaining = max_items - len(items) - len(page_items)
+            if cursor and remaining > 0:
+                pending = asyncio.create_task(make_devrev_request_async(
+                    endpoint, dict(payload, cursor=cursor, mode=mode, limit=min(remaining, LIST_PAGE_SIZE))))
+
+            for item in page_items:
+                text = dumps(project(item, tree))
+                items.append(text)
+                size += len(text) + 1
+            await _report_progress(len(items), max_items)
+
+            if size >= max_bytes:
+                break
+    finally:
+        if pending is not None:
+            pending.cancel()
+
+    body = "{" + dumps(root) + ":[" + ",".join(items) + "]"
+    if cursor:
+        body += ',"next_cursor":' + dumps(cursor)
+    if error:
+        body += ',"error":' + dumps(error)
+    return body + "}"
+
+
+@tool(
+    types.Tool(
+        name="get_current_user",
+        description="Fetch the current DevRev user details. When the user specifies 'me' in the query, this tool should be called to get the user details. The owned_by and created_by arguments of other tools also accept 'me' directly.",
+        inputSchema={"type": "object", "properties": {}},
+    )
+)
+async def handle_get_current_user(arguments: dict | None) -> list[types.TextContent]:
+    """Fetch the DevRev user that owns the API key, memoized for the life of the process."""
+    response = await _get_current_user()
+
+    if response.status_code != 200:
+        error_text = response.text
+        return [
+            types.TextContent(
+                type="text",
+                text=f"Get current user failed with status {response.status_code}: {error_text}"
+            )
+        ]
+
     return [
-        types.Tool(
-            name="get_current_user",
-            description="Fetch the current DevRev user details. When the user specifies 'me' in the query, this tool should be called to get the user details.",
-            inputSchema={"type": "object", "properties": {}},
-        ),
-        types.Tool(
-            name="get_vista",
-            description="Retrieve information about a vista in DevRev using its ID. In DevRev a vista is a sprint board which contains sprints (or vista group items). The reponse of this tool will contain the sprint (or vista group item) IDs that you can use to filter on sprints.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "id": {
-                        "type": "string",
-                        "description": "The DevRev ID of the vista"
-                    }
-                },
-                "required": ["id"]
+        types.TextContent(
+            type="text",
+            text=f"Current DevRev user details: {format_response(response)}"
+        )
+    ]
+
+
+@tool(
+    types.Tool(
+        name="get_vista",
+        description="Retrieve information about a vista in DevRev using its ID. In DevRev a vista is a sprint board which contains sprints (or vista group items). The reponse of this tool will contain the sprint (or vista group item) IDs that you can use to filter on sprints.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "id": {
+                    "type": "string",
+                    "description": "The DevRev ID of the vista"
+                }
             },
-        ),
-        types.Tool(
-            name="search",
-            description="Search DevRev using the provided query",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "query": {"type": "string"},
-                    "namespace": {
-                        "type": "string",
-                        "enum": ["article", "issue", "ticket", "part", "dev_user", "account", "rev_org", "vista", "incident"],
-                        "description": "The namespace to search in. Use this to specify the type of object to search for."
-                    },
+            "required": ["id"]
+        },
+    )
+)
+async def handle_get_vista(arguments: dict | None) -> list[types.TextContent]:
+    """Fetch a vista (sprint board) by ID."""
+    if not arguments:
+        raise ValueError("Missing arguments")
+
+    id = arguments.get("id")
+    if not id:
+        raise ValueError("Missing id ")
+
+    response = await make_internal_devrev_request_async(
+        "vistas.get",
+        {
+            "id": id
+        }
+    )
+
+    if response.status_code != 200:
+        error_text = response.text
+        return [
+            types.TextContent(
+                type="text",
+                text=f"get_vista failed with status {response.status_code}: {error_text}"
+            )
+        ]
+
+    return [
+        types.TextContent(
+            type="text",
+            text=f"Vista details for '{id}':\n{format_response(response)}"
+        )
+    ]
+
+
+@tool(
+    types.Tool(
+        name="search",
+        description="Search DevRev using the provided query",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "query": {"type": "string"},
+                "namespace": {
+                    "type": "string",
+                    "enum": ["article", "issue", "ticket", "part", "dev_user", "account", "rev_org", "vista", "incident"],
+                    "description": "The namespace to search in. Use this to specify the type of object to search for."
                 },
-                "required": ["query", "namespace"],
             },
-        ),
-        types.Tool(
-            name="get_work",
-            description="Get all information about a DevRev work item (issue, ticket) using its ID",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "id": {"type": "string", "description": "The DevRev ID of the work item"},
-                },
-                "required": ["id"],
+            "required": ["query", "namespace"],
+        },
+    )
+)
+async def handle_search(arguments: dict | None) -> list[types.TextContent]:
+    """Run a hybrid search in a single namespace."""
+    if not arguments:
+        raise ValueError("Missing arguments")
+
+    query = arguments.get("query")
+    if not query:
+        raise ValueError("Missing query parameter")
+
+    namespace = arguments.get("namespace")
+    if not namespace:
+        raise ValueError("Missing namespace parameter")
+
+    response = await make_devrev_request_async(
+        "search.hybrid",
+        {
+            "query": query,
+            "namespace": namespace
+        }
+    )
+    if response.status_code != 200:
+        error_text = response.text
+        return [
+            types.TextContent(
+                type="text",
+                text=f"Search failed with status {response.status_code}: {error_text}"
+            )
+        ]
+
+    search_results = format_response(response)
+    return [
+        types.TextContent(
+            type="text",
+            text=f"Search results for '{query}':\n{search_results}"
+        )
+    ]
+
+
+@tool(
+    types.Tool(
+        name="get_work",
+        description="Get all information about a DevRev work item (issue, ticket) using its ID",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "id": {"type": "string", "description": "The DevRev ID of the work item"},
+                "fields": {"type": "array", "items": {"type": "string"}, "description": "Dotted paths of the fields to return for each work item, for example: display_id, stage.name or owned_by[].display_name. All fields are returned when omitted."},
             },
-        ),
-        types.Tool(
-            name="create_work",
-            description="Create a new work item (issue, ticket) in DevRev",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "type": {"type": "string", "enum": ["issue", "ticket"]},
-                    "title": {"type": "string"},
-                    "body": {"type": "string"},
-                    "applies_to_part": {"type": "string", "description": "The DevRev ID of the part to which the work item applies"},
-                    "owned_by": {"type": "array", "items": {"type": "string"}, "description": "The DevRev IDs of the users who are assigned to the work item"}
-                },
-                "required": ["type", "title", "applies_to_part"],
+            "required": ["id"],
+        },
+    )
+)
+async def handle_get_work(arguments: dict | None) -> list[types.TextContent]:
+    """Fetch a work item (issue, ticket) by ID."""
+    if not arguments:
+        raise ValueError("Missing arguments")
+
+    id = arguments.get("id")
+    if not id:
+        raise ValueError("Missing id parameter")
+
+    fields = arguments.get("fields")
+
+    response = await make_devrev_request_async(
+        "works.get",
+        {
+            "id": id
+        }
+    )
+    if response.status_code != 200:
+        error_text = response.text
+        return [
+            types.TextContent(
+                type="text",
+                text=f"Get object failed with status {response.status_code}: {error_text}"
+            )
+        ]
+
+    return [
+        types.TextContent(
+            type="text",
+            text=f"Object information for '{id}':\n{format_response(response, fields, 'work')}"
+        )
+    ]
+
+
+# Maximum concurrent works.get requests of one get_works call, overridable
+# with DEVREV_MCP_BATCH_CONCURRENCY.
+DEFAULT_BATCH_CONCURRENCY = 8
+
+
+@tool(
+    types.Tool(
+        name="get_works",
+        description="Get all information about several DevRev work items (issues, tickets) using their IDs. Use this instead of calling get_work repeatedly.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "ids": {"type": "array", "items": {"type": "string"}, "description": "The DevRev IDs of the work items"},
+                "fields": {"type": "array", "items": {"type": "string"}, "description": "Dotted paths of the fields to return for each work item, for example: display_id, stage.name or owned_by[].display_name. All fields are returned when omitted."},
             },
-        ),
-        types.Tool(
-            name="update_work",
-            description="Update an existing work item (issue, ticket) in DevRev",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "type": {"type": "string", "enum": ["issue", "ticket"]},
-                    "id": {"type": "string"},
-                    "title": {"type": "string"},
-                    "body": {"type": "string"},
-                    "applies_to_part": {"type": "string", "description": "The DevRev ID of the part to which the work item applies"},
-                    "modified_by": {"type": "array", "items": {"type": "string"}, "description": "The DevRev IDs of the users who modified the work item"},
-                    "owned_by": {"type": "array", "items": {"type": "string"}, "description": "The DevRev IDs of the users who are assigned to the work item"},
-                    "stage": {"type": "string", "description": "The stage name of the work item. Use valid_stage_transition tool to get the list of valid stages you an update to."},
-                    "sprint": {"type": "string", "description": "The DevRev ID of the sprint to be assigned to an issue."},
-                    "subtype": {
-                        "type": "object",
-                        "properties": {
-                            "drop": {"type": "boolean", "description": "If true, the subtype will be dropped from the work item. If false, the subtype will be added to the work item."},
-                            "subtype": {"type": "string", "description": "The subtype value of the work item. Remember to use list_subtypes tool to get the list of valid subtypes."}
-                        },
-                        "required": ["drop"]
-                    }
-                },
-                "required": ["id", "type"],
+            "required": ["ids"],
+        },
+    )
+)
+async def handle_get_works(arguments: dict | None) -> list[types.TextContent]:
+    """Fetch several work items concurrently, one result per distinct ID in input order."""
+    if not arguments:
+        raise ValueError("Missing arguments")
+
+    ids = arguments.get("ids")
+    if not ids:
+        raise ValueError("Missing ids parameter")
+
+    fields = arguments.get("fields")
+
+    try:
+        concurrency = int(os.environ.get("DEVREV_MCP_BATCH_CONCURRENCY", DEFAULT_BATCH_CONCURRENCY))
+    except ValueError:
+        concurrency = DEFAULT_BATCH_CONCURRENCY
+    semaphore = asyncio.Semaphore(max(concurrency, 1))
+
+    async def get_one(id: str) -> types.TextContent:
+        async with semaphore:
+            try:
+                result = await handle_get_work({"id": id, "fields": fields})
+            except Exception as e:
+                return types.TextContent(
+                    type="text",
+                    text=f"Get object failed for '{id}': {e}"
+                )
+        return result[0]
+
+    return list(await asyncio.gather(*[get_one(id) for id in dict.fromkeys(ids)]))
+
+
+@tool(
+    types.Tool(
+        name="create_work",
+        description="Create a new work item (issue, ticket) in DevRev",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "type": {"type": "string", "enum": ["issue", "ticket"]},
+                "title": {"type": "string"},
+                "body": {"type": "string"},
+                "applies_to_part": {"type": "string", "description": "The DevRev ID of the part to which the work item applies"},
+                "owned_by": {"type": "array", "items": {"type": "string"}, "description": "The DevRev IDs of the users who are assigned to the work item. Use \"me\" for the current user."}
             },
-        ),
-        types.Tool(
-            name="list_works",
-            description="List all work items (issues, tickets) in DevRev",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "type": {"type": "array", "items": {"type": "string", "enum": ["issue", "ticket"]}, "description": "The type of works to list"},
-                    "cursor": {
-                        "type": "object",
-                        "properties": {
-                            "next_cursor": {"type": "string", "description": "The cursor to use for pagination. If not provided, iteration begins from the first page."},
-                            "mode": {"type": "string", "enum": ["after", "before"], "description": "The mode to iterate after the cursor or before the cursor ."},
-                        },
-                        "required": ["next_cursor", "mode"],
-                        "description": "The cursor to use for pagination. If not provided, iteration begins from the first page. In the output you get next_cursor, use it and the correct mode to get the next or previous page. You can use these to loop through all the pages."
-                    },
-                    "applies_to_part": {"type": "array", "items": {"type": "string"}, "description": "The part IDs of the works to list"},
-                    "created_by": {"type": "array", "items": {"type": "string"}, "description": "The user IDs of the creators of the works to list"},
-                    "owned_by": {"type": "array", "items": {"type": "string"}, "description": "The user IDs of the owners of the works to list"},
-                    "state": {"type": "array", "items": {"type": "string", "enum": ["open", "closed", "in_progress"]}, "description": "The state names of the works to list"},
-                    "modified_by": {"type": "array", "items": {"type": "string"}, "description": "The user IDs of the users who modified the works to list"},
-                    "sla_summary": {
-                        "type": "object",
-                        "properties": {
-                            "after": {"type": "string", "description": "The start date of the SLA summary range, for example: 2025-06-03T00:00:00Z"},
-                            "before": {"type": "string", "description": "The end date of the SLA summary range, for example: 2025-06-03T00:00:00Z"},
-                        },
-                        "required": ["after", "before"],
-                        "description": "Service Level Agreement summary filter on issues to list."
-                    },
-                    "sort_by": {"type": "array", "items": {"type": "string", "enum": ["target_start_date:asc", "target_start_date:desc", "target_close_date:asc", "target_close_date:desc", "actual_start_date:asc", "actual_start_date:desc", "actual_close_date:asc", "actual_close_date:desc", "created_date:asc", "created_date:desc"]}, "description": "The field (and the order) to sort the works by, in the sequence of the array elements"},
-                    "rev_orgs": {"type": "array", "items": {"type": "string"}, "description": "The rev_org IDs of the customer rev_orgs filter on Issues and Tickets to list. Use this filter for issues and tickets that are related to a customer rev_org."},
-                    "target_close_date": {
-                        "type": "object",
-                        "properties": {
-                            "after": {"type": "string", "description": "The start date of the target close date range, for example: 2025-06-03T00:00:00Z"},
-                            "before": {"type": "string", "description": "The end date of the target close date range, for example: 2025-06-03T00:00:00Z"},
-                        },
-                        "required": ["after", "before"]
-                    },
-                    "target_start_date": {
-                        "type": "object",
-                        "properties": {
-                            "after": {"type": "string", "description": "The start date of the target start date range, for example: 2025-06-03T00:00:00Z"},
-                            "before": {"type": "string", "description": "The end date of the target start date range, for example: 2025-06-03T00:00:00Z"},
-                        },
-                        "description": "The target start date range can only be used for issues. Do not use this field for tickets.",
-                        "required": ["after", "before"]
-                    },
-                    "actual_close_date": {
-                        "type": "object",
-                        "properties": {
-                            "after": {"type": "string", "description": "The start date of the actual close date range, for example: 2025-06-03T00:00:00Z"},
-                            "before": {"type": "string", "description": "The end date of the actual close date range, for example: 2025-06-03T00:00:00Z"},
-                        },
-                        "required": ["after", "before"]
-                    },
-                    "actual_start_date": {
-                        "type": "object",
-                        "properties": {
-                            "after": {"type": "string", "description": "The start date of the actual start date range, for example: 2025-06-03T00:00:00Z"},
-                            "before": {"type": "string", "description": "The end date of the actual start date range, for example: 2025-06-03T00:00:00Z"},
-                        },
-                        "description": "The actual start date range can only be used for issues. Do not use this field for tickets.",
-                        "required": ["after", "before"]
-                    },
-                    "created_date": {
-                        "type": "object",
-                        "properties": {
-                            "after": {"type": "string", "description": "The start date of the created date range, for example: 2025-06-03T00:00:00Z"},
-                            "before": {"type": "string", "description": "The end date of the created date range, for example: 2025-06-03T00:00:00Z"},
-                        },
-                        "required": ["after", "before"]
-                    },
-                    "modified_date": {
-                        "type": "object",
-                        "properties": {
-                            "after": {"type": "string", "description": "The start date of the modified date range, for example: 2025-06-03T00:00:00Z"},
-                            "before": {"type": "string", "description": "The end date of the modified date range, for example: 2025-06-03T00:00:00Z"},
-                        },
-                        "required": ["after", "before"]
-                    },
-                    "sprint": {
-                        "type": "array",
-                        "items": {
-                            "type": "string",
-                            "description": "The DevRev ID of the sprint to filter on. In DevRev a sprint is a vista group item. You will get these IDs from the response of get vista tool."
-                        },
-                        "description": "Use this to filter on sprints."
-                    },
-                    "custom_fields": {
-                        "type": "array",
-                        "items": {
-                            "type": "object",
-                            "properties": {
-                                "name": {"type": "string", "description": "The name of the custom field. All the characters in the name should be lowercase and words separated by underscores. For example: 'custom_field_name'"},
-                                "value": {"type": "array", "items": {"type": "string"}, "description": "The value of the custom field"}
-                            },
-                            "required": ["name", "value"]
-                        },
-                        "description": "Use this to filter on the custom fields, which are not present in the input schema."
+            "required": ["type", "title", "applies_to_part"],
+        },
+    )
+)
+async def handle_create_work(arguments: dict | None) -> list[types.TextContent]:
+    """Create a work item (issue, ticket)."""
+    if not arguments:
+        raise ValueError("Missing arguments")
+
+    type = arguments.get("type")
+    if not type:
+        raise ValueError("Missing type parameter")
+
+    title = arguments.get("title")
+    if not title:
+        raise ValueError("Missing title parameter")
+
+    applies_to_part = arguments.get("applies_to_part")
+    if not applies_to_part:
+        raise ValueError("Missing applies_to_part parameter")
+
+    body = arguments.get("body", "")
+    owned_by = await _resolve_me(arguments.get("owned_by", []))
+
+    response = await make_devrev_request_async(
+        "works.create",
+        {
+            "type": type,
+            "title": title,
+            "body": body,
+            "applies_to_part": applies_to_part,
+            "owned_by": owned_by
+        }
+    )
+    if response.status_code != 201:
+        error_text = response.text
+        return [
+            types.TextContent(
+                type="text",
+                text=f"Create object failed with status {response.status_code}: {error_text}"
+            )
+        ]
+    try:
+        json_data = decode_response(response)
+    except Exception:
+        raw_text = getattr(response, 'text', '') or ''
+        if not raw_text.strip():
+            json_data = {}
+        else:
+            json_data = {'error': 'Malformed response', 'raw': raw_text}
+
+    return [
+        types.TextContent(
+            type="text",
+            text=f"Object created successfully: {format_value(json_data)}"
+        )
+    ]
+
+
+@tool(
+    types.Tool(
+        name="update_work",
+        description="Update an existing work item (issue, ticket) in DevRev",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "type": {"type": "string", "enum": ["issue", "ticket"]},
+                "id": {"type": "string"},
+                "title": {"type": "string"},
+                "body": {"type": "string"},
+                "applies_to_part": {"type": "string", "description": "The DevRev ID of the part to which the work item applies"},
+                "modified_by": {"type": "array", "items": {"type": "string"}, "description": "The DevRev IDs of the users who modified the work item"},
+                "owned_by": {"type": "array", "items": {"type": "string"}, "description": "The DevRev IDs of the users who are assigned to the work item. Use \"me\" for the current user."},
+                "stage": {"type": "string", "description": "The stage name of the work item. Use valid_stage_transition tool to get the list of valid stages you an update to."},
+                "sprint": {"type": "string", "description": "The DevRev ID of the sprint to be assigned to an issue."},
+                "subtype": {
+                    "type": "object",
+                    "properties": {
+                        "drop": {"type": "boolean", "description": "If true, the subtype will be dropped from the work item. If false, the subtype will be added to the work item."},
+                        "subtype": {"type": "string", "description": "The subtype value of the work item. Remember to use list_subtypes tool to get the list of valid subtypes."}
                     },
-                    "subtype": {
-                        "type": "array",
-                        "items": {
-                            "type": "string",
-                            "description": "The DevRev value of the subtype to filter on. Remember to always use the list_subtypes tool to check the correct DevRev values of subtypes."
-                        },
-                        "description": "Use this to filter on the subtype of the work items."
-                    }
-                },
-                "required": ["type"],
-            },
-        ),
-        types.Tool(
-            name="get_part",
-            description="Get information about a part (enhancement) in DevRev using its ID",
-            inputSchema={
-                "type": "object",
-                "properties": {"id": {"type": "string", "description": "The DevRev ID of the part"}},
-                "required": ["id"],
-            },
-        ),
-        types.Tool(
-            name="create_part",
-            description="Create a new part (enhancement) in DevRev",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "type": {"type": "string", "enum": ["enhancement"]},
-                    "name": {"type": "string"},
-                    "owned_by": {"type": "array", "items": {"type": "string"}, "description": "The DevRev IDs of the users assigned to the part"},
-                    "parent_part": {"type": "array", "items": {"type": "string"}, "description": "The DevRev IDs of the parent parts"},
-                    "description": {"type": "string", "description": "The description of the part"},
-                },
-                "required": ["type", "name", "owned_by", "parent_part"],
-            },
-        ),
-        types.Tool(
-            name="update_part",
-            description="Update an existing part (enhancement) in DevRev",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "type": {"type": "string", "enum": ["enhancement"]},
-                    "id": {"type": "string", "description": "The DevRev ID of the part"},
-                    "name": {"type": "string", "description": "The name of the part"},
-                    "owned_by": {"type": "array", "items": {"type": "string"}, "description": "The DevRev IDs of the users assigned to the part"},
-                    "description": {"type": "string", "description": "The description of the part"},
-                    "target_close_date": {"type": "string", "description": "The target closed date of the part, for example: 2025-06-03T00:00:00Z"},
-                    "target_start_date": {"type": "string", "description": "The target start date of the part, for example: 2025-06-03T00:00:00Z"},
-                    "stage": {"type": "string", "description": "The stage DevRev ID of the part. Use valid_stage_transition tool to get the list of valid stages you an update to."},
-                },
-                "required": ["id", "type"],
+                    "required": ["drop"]
+                }
             },
-        ),
-        types.Tool(
-            name="list_parts",
-            description="List all parts (enhancements) in DevRev",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "type": {"type": "string", "enum": ["enhancement"], "description": "The type of parts to list"},
-                    "cursor": {
-                        "type": "object",
-                        "properties": {
-                            "next_cursor": {"type": "string", "description": "The cursor to use for pagination. If not provided, iteration begins from the first page."},
-                            "mode": {"type": "string", "enum": ["after", "before"], "description": "The mode to iterate after the cursor or before the cursor ."},
-                        },
-                        "required": ["next_cursor", "mode"],
-                        "description": "The cursor to use for pagination. If not provided, iteration begins from the first page. In the output you get next_cursor, use it and the correct mode to get the next or previous page. You can use these to loop through all the pages."
-                    },
-                    "owned_by": {"type": "array", "items": {"type": "string"}, "description": "The DevRev IDs of the users assigned to the parts to list"},
-                    "parent_part": {"type": "array", "items": {"type": "string"}, "description": "The DevRev IDs of the parent parts to of the parts to list"},
-                    "created_by": {"type": "array", "items": {"type": "string"}, "description": "The DevRev IDs of the users who created the parts to list"},
-                    "modified_by": {"type": "array", "items": {"type": "string"}, "description": "The DevRev IDs of the users who modified the parts to list"},
-                    "sort_by": {"type": "array", "items": {"type": "string", "enum": ["target_close_date:asc", "target_close_date:desc", "target_start_date:asc", "target_start_date:desc", "actual_close_date:asc", "actual_close_date:desc", "actual_start_date:asc", "actual_start_date:desc", "created_date:asc", "created_date:desc", "modified_date:asc", "modified_date:desc"]}, "description": "The field (and the order) to sort the parts by, in the sequence of the array elements"},
-                    "accounts": {"type": "array", "items": {"type": "string"}, "description": "The account IDs of the accounts filter on parts to list"},
-                    "target_close_date": {
-                        "type": "object",
-                        "properties": {
-                            "after": {"type": "string", "description": "The start date of the target close date range, for example: 2025-06-03T00:00:00Z"},
-                            "before": {"type": "string", "description": "The end date of the target close date range, for example: 2025-06-03T00:00:00Z"},
-                        },
-                        "required": ["after", "before"]
-                    },
-                    "target_start_date": {
-                        "type": "object",
-                        "properties": {
-                            "after": {"type": "string", "description": "The start date of the target start date range, for example: 2025-06-03T00:00:00Z"},
-                            "before": {"type": "string", "description": "The end date of the target start date range, for example: 2025-06-03T00:00:00Z"},
-                        },
-                        "required": ["after", "before"]
-                    },
-                    "actual_close_date": {
-                        "type": "object",
-                        "properties": {
-                            "after": {"type": "string", "description": "The start date of the actual close date range, for example: 2025-06-03T00:00:00Z"},
-                            "before": {"type": "string", "description": "The end date of the actual close date range, for example: 2025-06-03T00:00:00Z"},
-                        },
-                        "required": ["after", "before"]
-                    },
-                    "actual_start_date": {
-                        "type": "object",
-                        "properties": {
-                            "after": {"type": "string", "description": "The start date of the actual start date range, for example: 2025-06-03T00:00:00Z"},
-                            "before": {"type": "string", "description": "The end date of the actual start date range, for example: 2025-06-03T00:00:00Z"},
-                        },
-                        "required": ["after", "before"]
+            "required": ["id", "type"],
+        },
+    )
+)
+async def handle_update_work(arguments: dict | None) -> list[types.TextContent]:
+    """Update the fields, stage or subtype of a work item."""
+    if not arguments:
+        raise ValueError("Missing arguments")
+
+    payload = {}
+
+    id = arguments.get("id")
+    if not id:
+        raise ValueError("Missing id parameter")
+    payload["id"] = id
+
+    type = arguments.get("type")
+    if not type:
+        raise ValueError("Missing type parameter")
+    payload["type"] = type
+
+    title = arguments.get("title")
+    if title:
+        payload["title"] = title
+
+    body = arguments.get("body", "")
+    if body:
+        payload["body"] = body
+
+    modified_by = arguments.get("modified_by")
+    if modified_by:
+        payload["modified_by"] = modified_by
+
+    owned_by = arguments.get("owned_by")
+    if owned_by:
+        payload["owned_by"] = await _resolve_me(owned_by)
+
+    applies_to_part = arguments.get("applies_to_part", [])
+    if applies_to_part:
+        payload["applies_to_part"] = applies_to_part
+
+    stage = arguments.get("stage")
+    if stage:
+        payload["stage"] = {"name": stage}
+
+    sprint = arguments.get("sprint")
+    if sprint:
+        payload["sprint"] = sprint
+
+    subtype = arguments.get("subtype")
+    if subtype:
+        if subtype["drop"]:
+            payload["custom_schema_spec"] = {"drop": {
+                "subtype": True}, "tenant_fragment": True, "validate_required_fields": True}
+        else:
+            payload["custom_schema_spec"] = {
+                "subtype": subtype["subtype"], "tenant_fragment": True, "validate_required_fields": True}
+
+    response = await make_devrev_request_async(
+        "works.update",
+        payload
+    )
+
+    if response.status_code != 200:
+        error_text = response.text
+        return [
+            types.TextContent(
+                type="text",
+                text=f"Update object failed with status {response.status_code}: {error_text}"
+            )
+        ]
+
+    return [
+        types.TextContent(
+            type="text",
+            text=f"Object updated successfully: {id}"
+        )
+    ]
+
+
+@tool(
+    types.Tool(
+        name="list_works",
+        description="List all work items (issues, tickets) in DevRev",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "type": {"type": "array", "items": {"type": "string", "enum": ["issue", "ticket"]}, "description": "The type of works to list"},
+                "cursor": {
+                    "type": "object",
+                    "properties": {
+                        "next_cursor": {"type": "string", "description": "The cursor to use for pagination. If not provided, iteration begins from the first page."},
+                        "mode": {"type": "string", "enum": ["after", "before"], "description": "The mode to iterate after the cursor or before the cursor ."},
                     },
+                    "required": ["next_cursor", "mode"],
+                    "description": "The cursor to use for pagination. If not provided, iteration begins from the first page. In the output you get next_cursor, use it and the correct mode to get the next or previous page. You can use these to loop through all the pages."
                 },
-                "required": ["type"],
-            },
-        ),
-        types.Tool(
-            name="list_meetings",
-            description="List meetings in DevRev",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "channel": {
-                        "type": "array",
-                        "items": {"type": "string", "enum": ["amazon_connect", "google_meet", "offline", "other", "teams", "zoom"]},
-                        "description": "Filters for meeting on specified channels"
+                "applies_to_part": {"type": "array", "items": {"type": "string"}, "description": "The part IDs of the works to list"},
+                "created_by": {"type": "array", "items": {"type": "string"}, "description": "The user IDs of the creators of the works to list. Use \"me\" for the current user."},
+                "owned_by": {"type": "array", "items": {"type": "string"}, "description": "The user IDs of the owners of the works to list. Use \"me\" for the current user."},
+                "state": {"type": "array", "items": {"type": "string", "enum": ["open", "closed", "in_progress"]}, "description": "The state names of the works to list"},
+                "modified_by": {"type": "array", "items": {"type": "string"}, "description": "The user IDs of the users who modified the works to list"},
+                "sla_summary": {
+                    "type": "object",
+                    "properties": {
+                        "after": {"type": "string", "description": "The start date of the SLA summary range, for example: 2025-06-03T00:00:00Z"},
+                        "before": {"type": "string", "description": "The end date of the SLA summary range, for example: 2025-06-03T00:00:00Z"},
                     },
-                    "created_by": {
-                        "type": "array",
-                        "items": {"type": "string"},
-                        "description": "Filters for meetings created by the specified user DevRev IDs"
-                    },
-                    "created_date": {
-                        "type": "object",
-                        "properties": {
-                            "after": {"type": "string", "description": "The start date of the created date range, for example: 2025-06-03T00:00:00Z"},
-                            "before": {"type": "string", "description": "The end date of the created date range, for example: 2025-06-03T00:00:00Z"}
-                        },
-                        "required": ["after", "before"]
-                    },
-                    "cursor": {
-                        "type": "object",
-                        "properties": {
-                            "next_cursor": {"type": "string", "description": "The cursor to use for pagination. If not provided, iteration begins from the first page."},
-                            "mode": {"type": "string", "enum": ["after", "before"], "description": "The mode to iterate after the cursor or before the cursor"}
-                        },
-                        "required": ["next_cursor", "mode"]
+                    "required": ["after", "before"],
+                    "description": "Service Level Agreement summary filter on issues to list."
+                },
+                "sort_by": {"type": "array", "items": {"type": "string", "enum": ["target_start_date:asc", "target_start_date:desc", "target_close_date:asc", "target_close_date:desc", "actual_start_date:asc", "actual_start_date:desc", "actual_close_date:asc", "actual_close_date:desc", "created_date:asc", "created_date:desc"]}, "description": "The field (and the order) to sort the works by, in the sequence of the array elements"},
+                "rev_orgs": {"type": "array", "items": {"type": "string"}, "description": "The rev_org IDs of the customer rev_orgs filter on Issues and Tickets to list. Use this filter for issues and tickets that are related to a customer rev_org."},
+                "target_close_date": {
+                    "type": "object",
+                    "properties": {
+                        "after": {"type": "string", "description": "The start date of the target close date range, for example: 2025-06-03T00:00:00Z"},
+                        "before": {"type": "string", "description": "The end date of the target close date range, for example: 2025-06-03T00:00:00Z"},
                     },
-                    "ended_date": {
-                        "type": "object",
-                        "properties": {
-                            "after": {"type": "string", "description": "The start date of the ended date range, for example: 2025-06-03T00:00:00Z"},
-                            "before": {"type": "string", "description": "The end date of the ended date range, for example: 2025-06-03T00:00:00Z"}
-                        },
-                        "required": ["after", "before"]
+                    "required": ["after", "before"]
+                },
+                "target_start_date": {
+                    "type": "object",
+                    "properties": {
+                        "after": {"type": "string", "description": "The start date of the target start date range, for example: 2025-06-03T00:00:00Z"},
+                        "before": {"type": "string", "description": "The end date of the target start date range, for example: 2025-06-03T00:00:00Z"},
                     },
-                    "external_ref": {
-                        "type": "array",
-                        "items": {"type": "string"},
-                        "description": "Filters for meetings with the provided external_ref(s)"
+                    "description": "The target start date range can only be used for issues. Do not use this field for tickets.",
+                    "required": ["after", "before"]
+                },
+                "actual_close_date": {
+                    "type": "object",
+                    "properties": {
+                        "after": {"type": "string", "description": "The start date of the actual close date range, for example: 2025-06-03T00:00:00Z"},
+                        "before": {"type": "string", "description": "The end date of the actual close date range, for example: 2025-06-03T00:00:00Z"},
                     },
-                    "limit": {
-                        "type": "integer",
-                        "description": "The maximum number of meetings to return"
+                    "required": ["after", "before"]
+                },
+                "actual_start_date": {
+                    "type": "object",
+                    "properties": {
+                        "after": {"type": "string", "description": "The start date of the actual start date range, for example: 2025-06-03T00:00:00Z"},
+                        "before": {"type": "string", "description": "The end date of the actual start date range, for example: 2025-06-03T00:00:00Z"},
                     },
-                    "members": {
-                        "type": "array",
-                        "items": {"type": "string"},
-                        "description": "Filter for meeting on specified Member Ids"
+                    "description": "The actual start date range can only be used for issues. Do not use this field for tickets.",
+                    "required": ["after", "before"]
+                },
+                "created_date": {
+                    "type": "object",
+                    "properties": {
+                        "after": {"type": "string", "description": "The start date of the created date range, for example: 2025-06-03T00:00:00Z"},
+                        "before": {"type": "string", "description": "The end date of the created date range, for example: 2025-06-03T00:00:00Z"},
                     },
-                    "modified_date": {
-                        "type": "object",
-                        "properties": {
-                            "after": {"type": "string", "description": "The start date of the modified date range, for example: 2025-06-03T00:00:00Z"},
-                            "before": {"type": "string", "description": "The end date of the modified date range, for example: 2025-06-03T00:00:00Z"}
-                        },
-                        "required": ["after", "before"]
+                    "required": ["after", "before"]
+                },
+                "modified_date": {
+                    "type": "object",
+                    "properties": {
+                        "after": {"type": "string", "description": "The start date of the modified date range, for example: 2025-06-03T00:00:00Z"},
+                        "before": {"type": "string", "description": "The end date of the modified date range, for example: 2025-06-03T00:00:00Z"},
                     },
-                    "organizer": {
-                        "type": "array",
-                        "items": {"type": "string"},
-                        "description": "Filter for meeting on specified organizers"
+                    "required": ["after", "before"]
+                },
+                "sprint": {
+                    "type": "array",
+                    "items": {
+                        "type": "string",
+                        "description": "The DevRev ID of the sprint to filter on. In DevRev a sprint is a vista group item. You will get these IDs from the response of get vista tool."
                     },
-                    "scheduled_date": {
+                    "description": "Use this to filter on sprints."
+                },
+                "custom_fields": {
+                    "type": "array",
+                    "items": {
                         "type": "object",
                         "properties": {
-                            "after": {"type": "string", "description": "The start date of the scheduled date range, for example: 2025-06-03T00:00:00Z"},
-                            "before": {"type": "string", "description": "The end date of the scheduled date range, for example: 2025-06-03T00:00:00Z"}
-                        },
-                        "required": ["after", "before"]
-                    },
-                    "sort_by": {
-                        "type": "array",
-                        "items": {
-                            "type": "string",
-                            "enum": ["target_start_date:asc", "target_start_date:desc", "target_close_date:asc", "target_close_date:desc", "actual_start_date:asc", "actual_start_date:desc", "actual_close_date:asc", "actual_close_date:desc", "created_date:asc", "created_date:desc", "modified_date:asc", "modified_date:desc"]
+                            "name": {"type": "string", "description": "The name of the custom field. All the characters in the name should be lowercase and words separated by underscores. For example: 'custom_field_name'"},
+                            "value": {"type": "array", "items": {"type": "string"}, "description": "The value of the custom field"}
                         },
-                        "description": "The field (and the order) to sort the meetings by, in the sequence of the array elements"
+                        "required": ["name", "value"]
                     },
-                    "state": {
-                        "type": "array",
-                        "items": {"type": "string", "enum": ["cancelled", "completed", "no_show", "ongoing", "rejected", "scheduled", "rescheduled", "waiting"]},
-                        "description": "Filters for meeting on specified state or outcomes"
-                    }
-                }
-            }
-        ),
-        types.Tool(
-            name="valid_stage_transition",
-            description="gets a list of valid stage transition for a given work item (issue, ticket) or part (enhancement). Use this before updating stage of the work item or part to ensure the transition is valid.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "type": {"type": "string", "enum": ["issue", "ticket", "enhancement"]},
-                    "id": {"type": "string", "description": "The DevRev ID of the work item (issue, ticket) or part (enhancement)"},
+                    "description": "Use this to filter on the custom fields, which are not present in the input schema."
                 },
-                "required": ["type", "id"]
-            }
-        ),
-        types.Tool(
-            name="add_timeline_entry",
-            description="Add a timeline entry to a work item (issue, ticket) or part (enhancement)",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "id": {"type": "string", "description": "The DevRev ID of the work item (issue, ticket) or part (enhancement)"},
-                    "timeline_entry": {"type": "string", "description": "The timeline entry about updates to the work item (issue, ticket) or part (enhancement)."},
-                },
-                "required": ["id", "timeline_entry"],
-            }
-        ),
-        types.Tool(
-            name="get_sprints",
-            description="Get active or planned sprints for a given part ID. Use this to get the sprints for an issue based on its part.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "ancestor_part_id": {"type": "string", "description": "The ID of the part to get the sprints for."},
-                    "state": {
+                "subtype": {
+                    "type": "array",
+                    "items": {
                         "type": "string",
-                        "enum": ["active", "planned"],
-                        "description": "The state of the sprints to get. When the state is not provided in query, the tool will get the active sprints."
+                        "description": "The DevRev value of the subtype to filter on. Remember to always use the list_subtypes tool to check the correct DevRev values of subtypes."
                     },
+                    "description": "Use this to filter on the subtype of the work items."
                 },
-                "required": ["ancestor_part_id"],
+                "fields": {"type": "array", "items": {"type": "string"}, "description": "Dotted paths of the fields to return for each work item, for example: display_id, stage.name or owned_by[].display_name. All fields are returned when omitted."},
+                "all_pages": {"type": "boolean", "description": "If true, follow next_cursor on the server and return the work items of every page in one response, up to max_items. Pages are followed in the mode of the given cursor. The returned next_cursor, if any, continues from the last returned item."},
+                "max_items": {"type": "integer", "minimum": 1, "description": "The maximum number of work items to return across pages. Setting it also enables all_pages. Defaults to 500."}
             },
-        ),
-        types.Tool(
-            name="list_subtypes",
-            description="List all subtypes in DevRev for a given leaf type",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "leaf_type": {"type": "string", "enum": ["issue", "ticket"]},
-                },
-                "required": ["leaf_type"],
-            }
-        )
-    ]
-
-
-@server.call_tool()
-async def handle_call_tool(
-    name: str, arguments: dict | None
-) -> list[types.TextContent | types.ImageContent | types.EmbeddedResource]:
-    """
-    Handle tool execution requests.
-    Tools can modify server state and notify clients of changes.
-    """
-    if name == "get_current_user":
-        response = make_devrev_request(
-            "dev-users.self",
-            {}
-        )
-
-        if response.status_code != 200:
-            error_text = response.text
+            "required": ["type"],
+        },
+    )
+)
+async def handle_list_works(arguments: dict | None) -> list[types.TextContent]:
+    """List work items matching the given filters."""
+    payload = {}
+    payload["issue"] = {}
+    payload["ticket"] = {}
+
+    type = arguments.get("type")
+    if not type:
+        raise ValueError("Missing type parameter")
+    payload["type"] = type
+
+    cursor = arguments.get("cursor")
+    if cursor:
+        payload["cursor"] = cursor["next_cursor"]
+        payload["mode"] = cursor["mode"]
+
+    applies_to_part = arguments.get("applies_to_part")
+    if applies_to_part:
+        payload["applies_to_part"] = applies_to_part
+
+    created_by = arguments.get("created_by")
+    if created_by:
+        payload["created_by"] = await _resolve_me(created_by)
+
+    modified_by = arguments.get("modified_by")
+    if modified_by:
+        payload["modified_by"] = modified_by
+
+    owned_by = arguments.get("owned_by")
+    if owned_by:
+        payload["owned_by"] = await _resolve_me(owned_by)
+
+    state = arguments.get("state")
+    if state:
+        payload["state"] = state
+
+    custom_fields = arguments.get("custom_fields")
+    if custom_fields:
+        payload["custom_fields"] = {}
+        for custom_field in custom_fields:
+            payload["custom_fields"]["tnt__" +
+                                     custom_field["name"]] = custom_field["value"]
+
+    sla_summary = arguments.get("sla_summary")
+    if sla_summary:
+        payload["issue"]["sla_summary"] = {"target_time": {
+            "type": "range", "after": sla_summary["after"], "before": sla_summary["before"]}}
+
+    sort_by = arguments.get("sort_by")
+    if sort_by:
+        payload["sort_by"] = sort_by
+
+    rev_orgs = arguments.get("rev_orgs")
+    if rev_orgs and rev_orgs != []:
+        if 'ticket' in type:
+            payload["ticket"]["rev_org"] = rev_orgs
+
+        if 'issue' in type:
+            payload["issue"]["rev_orgs"] = rev_orgs
+
+    subtype = arguments.get("subtype")
+    if subtype:
+        if 'ticket' in type:
+            payload["ticket"]["subtype"] = subtype
+
+        if 'issue' in type:
+            payload["issue"]["subtype"] = subtype
+
+    target_close_date = arguments.get("target_close_date")
+    if target_close_date:
+        payload["target_close_date"] = {
+            "type": "range", "after": target_close_date["after"], "before": target_close_date["before"]}
+
+    target_start_date = arguments.get("target_start_date")
+    if target_start_date:
+        if 'issue' in type:
+            payload["issue"]["target_start_date"] = {
+                "type": "range", "after": target_start_date["after"], "before": target_start_date["before"]}
+
+    actual_close_date = arguments.get("actual_close_date")
+    if actual_close_date:
+        payload["actual_close_date"] = {
+            "type": "range", "after": actual_close_date["after"], "before": actual_close_date["before"]}
+
+    actual_start_date = arguments.get("actual_start_date")
+    if actual_start_date:
+        if 'issue' in type:
+            payload["issue"]["actual_start_date"] = {
+                "type": "range", "after": actual_start_date["after"], "before": actual_start_date["before"]}
+
+    created_date = arguments.get("created_date")
+    if created_date:
+        payload["created_date"] = {
+            "type": "range", "after": created_date["after"], "before": created_date["before"]}
+
+    modified_date = arguments.get("modified_date")
+    if modified_date:
+        payload["modified_date"] = {
+            "type": "range", "after": modified_date["after"], "before": modified_date["before"]}
+
+    sprint = arguments.get("sprint")
+    if sprint:
+        payload["issue"]["sprint"] = sprint
+
+    if payload["issue"] == {}:
+        payload.pop("issue")
+
+    if payload["ticket"] == {}:
+        payload.pop("ticket")
+
+    fields = arguments.get("fields")
+
+    max_items = arguments.get("max_items")
+    if max_items is not None and (isinstance(max_items, bool) or not isinstance(max_items, int) or max_items < 1):
+        raise ValueError("max_items must be a positive integer")
+    if arguments.get("all_pages") or max_items:
+        try:
+            works = await _list_all_pages("works.list", payload, "works", fields, max_items or DEFAULT_MAX_ITEMS)
+        except _PageFetchError as e:
             return [
                 types.TextContent(
                     type="text",
-                    text=f"Get current user failed with status {response.status_code}: {error_text}"
+                    text=f"List works failed with status {e.response.status_code}: {e.response.text}"
                 )
             ]
-
         return [
             types.TextContent(
                 type="text",
-                text=f"Current DevRev user details: {response.json()}"
+                text=f"Works listed successfully: {works}"
             )
         ]
 
-    elif name == "get_vista":
-        if not arguments:
-            raise ValueError("Missing arguments")
-
-        id = arguments.get("id")
-        if not id:
-            raise ValueError("Missing id ")
-
-        response = make_internal_devrev_request(
-            "vistas.get",
-            {
-                "id": id
-            }
-        )
-
-        if response.status_code != 200:
-            error_text = response.text
-            return [
-                types.TextContent(
-                    type="text",
-                    text=f"get_vista failed with status {response.status_code}: {error_text}"
-                )
-            ]
+    response = await make_devrev_request_async(
+        "works.list",
+        payload
+    )
 
+    if response.status_code != 200:
+        error_text = response.text
         return [
             types.TextContent(
                 type="text",
-                text=f"Vista details for '{id}':\n{response.json()}"
+                text=f"List works failed with status {response.status_code}: {error_text}"
             )
         ]
-
-    elif name == "search":
-        if not arguments:
-            raise ValueError("Missing arguments")
-
-        query = arguments.get("query")
-        if not query:
-            raise ValueError("Missing query parameter")
-
-        namespace = arguments.get("namespace")
-        if not namespace:
-            raise ValueError("Missing namespace parameter")
-
-        response = make_devrev_request(
-            "search.hybrid",
-            {
-                "query": query,
-                "namespace": namespace
-            }
+    return [
+        types.TextContent(
+            type="text",
+            text=f"Works listed successfully: {format_response(response, fields, 'works')}"
         )
-        if response.status_code != 200:
-            error_text = response.text
-            return [
-                types.TextContent(
-                    type="text",
-                    text=f"Search failed with status {response.status_code}: {error_text}"
-                )
-            ]
+    ]
+
 
-        search_results = response.json()
+@tool(
+    types.Tool(
+        name="get_part",
+        description="Get information about a part (enhancement) in DevRev using its ID",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "id": {"type": "string", "description": "The DevRev ID of the part"},
+                "fields": {"type": "array", "items": {"type": "string"}, "description": "Dotted paths of the fields to return for each part, for example: display_id, stage.name or owned_by[].display_name. All fields are returned when omitted."},
+            },
+            "required": ["id"],
+        },
+    )
+)
+async def handle_get_part(arguments: dict | None) -> list[types.TextContent]:
+    """Fetch a part (enhancement) by ID."""
+    if not arguments:
+        raise ValueError("Missing arguments")
+
+    id = arguments.get("id")
+    if not id:
+        raise ValueError("Missing id parameter")
+
+    fields = arguments.get("fields")
+
+    response = await make_devrev_request_async(
+        "parts.get",
+        {
+            "id": id
+        }
+    )
+
+    if response.status_code != 200:
+        error_text = response.text
         return [
             types.TextContent(
                 type="text",
-                text=f"Search results for '{query}':\n{search_results}"
+                text=f"Get part failed with status {response.status_code}: {error_text}"
             )
         ]
-    elif name == "get_work":
-        if not arguments:
-            raise ValueError("Missing arguments")
-
-        id = arguments.get("id")
-        if not id:
-            raise ValueError("Missing id parameter")
 
-        response = make_devrev_request(
-            "works.get",
-            {
-                "id": id
-            }
+    return [
+        types.TextContent(
+            type="text",
+            text=f"Part information for '{id}':\n{format_response(response, fields, 'part')}"
         )
-        if response.status_code != 200:
-            error_text = response.text
-            return [
-                types.TextContent(
-                    type="text",
-                    text=f"Get object failed with status {response.status_code}: {error_text}"
-                )
-            ]
+    ]
+
 
+@tool(
+    types.Tool(
+        name="create_part",
+        description="Create a new part (enhancement) in DevRev",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "type": {"type": "string", "enum": ["enhancement"]},
+                "name": {"type": "string"},
+                "owned_by": {"type": "array", "items": {"type": "string"}, "description": "The DevRev IDs of the users assigned to the part. Use \"me\" for the current user."},
+                "parent_part": {"type": "array", "items": {"type": "string"}, "description": "The DevRev IDs of the parent parts"},
+                "description": {"type": "string", "description": "The description of the part"},
+            },
+            "required": ["type", "name", "owned_by", "parent_part"],
+        },
+    )
+)
+async def handle_create_part(arguments: dict | None) -> list[types.TextContent]:
+    """Create a part (enhancement)."""
+    if not arguments:
+        raise ValueError("Missing arguments")
+
+    payload = {}
+
+    type = arguments.get("type")
+    if not type:
+        raise ValueError("Missing type parameter")
+    payload["type"] = type
+
+    part_name = arguments.get("name")
+    if not part_name:
+        raise ValueError("Missing name parameter")
+    payload["name"] = part_name
+
+    owned_by = arguments.get("owned_by")
+    if not owned_by:
+        raise ValueError("Missing owned_by parameter")
+    payload["owned_by"] = await _resolve_me(owned_by)
+
+    parent_part = arguments.get("parent_part")
+    if not parent_part:
+        raise ValueError("Missing parent_part parameter")
+    payload["parent_part"] = parent_part
+
+    description = arguments.get("description")
+    if description:
+        payload["description"] = description
+
+    response = await make_devrev_request_async(
+        "parts.create",
+        payload
+    )
+
+    if response.status_code != 201:
+        error_text = response.text
         return [
             types.TextContent(
                 type="text",
-                text=f"Object information for '{id}':\n{response.json()}"
+                text=f"Create part failed with status {response.status_code}: {error_text}"
             )
         ]
-    elif name == "create_work":
-        if not arguments:
-            raise ValueError("Missing arguments")
 
-        type = arguments.get("type")
-        if not type:
-            raise ValueError("Missing type parameter")
+    return [
+        types.TextContent(
+            type="text",
+            text=f"Part created successfully: {format_response(response)}"
+        )
+    ]
 
-        title = arguments.get("title")
-        if not title:
-            raise ValueError("Missing title parameter")
 
-        applies_to_part = arguments.get("applies_to_part")
-        if not applies_to_part:
-            raise ValueError("Missing applies_to_part parameter")
+@tool(
+    types.Tool(
+        name="update_part",
+        description="Update an existing part (enhancement) in DevRev",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "type": {"type": "string", "enum": ["enhancement"]},
+                "id": {"type": "string", "description": "The DevRev ID of the part"},
+                "name": {"type": "string", "description": "The name of the part"},
+                "owned_by": {"type": "array", "items": {"type": "string"}, "description": "The DevRev IDs of the users assigned to the part. Use \"me\" for the current user."},
+                "description": {"type": "string", "description": "The description of the part"},
+                "target_close_date": {"type": "string", "description": "The target closed date of the part, for example: 2025-06-03T00:00:00Z"},
+                "target_start_date": {"type": "string", "description": "The target start date of the part, for example: 2025-06-03T00:00:00Z"},
+                "stage": {"type": "string", "description": "The stage DevRev ID of the part. Use valid_stage_transition tool to get the list of valid stages you an update to."},
+            },
+            "required": ["id", "type"],
+        },
+    )
+)
+async def handle_update_part(arguments: dict | None) -> list[types.TextContent]:
+    """Update the fields or stage of a part."""
+    if not arguments:
+        raise ValueError("Missing arguments")
+
+    payload = {}
+
+    id = arguments.get("id")
+    if not id:
+        raise ValueError("Missing id parameter")
+    payload["id"] = id
+
+    type = arguments.get("type")
+    if not type:
+        raise ValueError("Missing type parameter")
+    payload["type"] = type
+
+    part_name = arguments.get("name")
+    if part_name:
+        payload["name"] = part_name
 
-        body = arguments.get("body", "")
-        owned_by = arguments.get("owned_by", [])
+    owned_by = arguments.get("owned_by")
+    if owned_by:
+        payload["owned_by"] = await _resolve_me(owned_by)
 
-        response = make_devrev_request(
-            "works.create",
-            {
-                "type": type,
-                "title": title,
-                "body": body,
-                "applies_to_part": applies_to_part,
-                "owned_by": owned_by
-            }
-        )
-        if response.status_code != 201:
-            error_text = response.text
-            return [
-                types.TextContent(
-                    type="text",
-                    text=f"Create object failed with status {response.status_code}: {error_text}"
-                )
-            ]
-        try:
-            json_data = response.json()
-        except Exception:
-            raw_text = getattr(response, 'text', '') or ''
-            if not raw_text.strip():
-                json_data = {}
-            else:
-                json_data = {'error': 'Malformed response', 'raw': raw_text}
+    description = arguments.get("description")
+    if description:
+        payload["description"] = description
+
+    target_close_date = arguments.get("target_close_date")
+    if target_close_date:
+        payload["target_close_date"] = target_close_date
+
+    target_start_date = arguments.get("target_start_date")
+    if target_start_date:
+        payload["target_start_date"] = target_start_date
 
+    stage = arguments.get("stage")
+    if stage:
+        payload["stage_v2"] = stage
+
+    response = await make_devrev_request_async(
+        "parts.update",
+        payload
+    )
+
+    if response.status_code != 200:
+        error_text = response.text
         return [
             types.TextContent(
                 type="text",
-                text=f"Object created successfully: {json_data}"
+                text=f"Update part failed with status {response.status_code}: {error_text}"
             )
         ]
 
-    elif name == "update_work":
-        if not arguments:
-            raise ValueError("Missing arguments")
-
-        payload = {}
-
-        id = arguments.get("id")
-        if not id:
-            raise ValueError("Missing id parameter")
-        payload["id"] = id
-
-        type = arguments.get("type")
-        if not type:
-            raise ValueError("Missing type parameter")
-        payload["type"] = type
-
-        title = arguments.get("title")
-        if title:
-            payload["title"] = title
-
-        body = arguments.get("body", "")
-        if body:
-            payload["body"] = body
-
-        modified_by = arguments.get("modified_by")
-        if modified_by:
-            payload["modified_by"] = modified_by
-
-        owned_by = arguments.get("owned_by")
-        if owned_by:
-            payload["owned_by"] = owned_by
-
-        applies_to_part = arguments.get("applies_to_part", [])
-        if applies_to_part:
-            payload["applies_to_part"] = applies_to_part
-
-        stage = arguments.get("stage")
-        if stage:
-            payload["stage"] = {"name": stage}
-
-        sprint = arguments.get("sprint")
-        if sprint:
-            payload["sprint"] = sprint
-
-        subtype = arguments.get("subtype")
-        if subtype:
-            if subtype["drop"]:
-                payload["custom_schema_spec"] = {"drop": {
-                    "subtype": True}, "tenant_fragment": True, "validate_required_fields": True}
-            else:
-                payload["custom_schema_spec"] = {
-                    "subtype": subtype["subtype"], "tenant_fragment": True, "validate_required_fields": True}
-
-        response = make_devrev_request(
-            "works.update",
-            payload
+    return [
+        types.TextContent(
+            type="text",
+            text=f"Part updated successfully: {id}"
         )
+    ]
 
-        if response.status_code != 200:
-            error_text = response.text
-            return [
-                types.TextContent(
-                    type="text",
-                    text=f"Update object failed with status {response.status_code}: {error_text}"
-                )
-            ]
 
+@tool(
+    types.Tool(
+        name="list_parts",
+        description="List all parts (enhancements) in DevRev",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "type": {"type": "string", "enum": ["enhancement"], "description": "The type of parts to list"},
+                "cursor": {
+                    "type": "object",
+                    "properties": {
+                        "next_cursor": {"type": "string", "description": "The cursor to use for pagination. If not provided, iteration begins from the first page."},
+                        "mode": {"type": "string", "enum": ["after", "before"], "description": "The mode to iterate after the cursor or before the cursor ."},
+                    },
+                    "required": ["next_cursor", "mode"],
+                    "description": "The cursor to use for pagination. If not provided, iteration begins from the first page. In the output you get next_cursor, use it and the correct mode to get the next or previous page. You can use these to loop through all the pages."
+                },
+                "owned_by": {"type": "array", "items": {"type": "string"}, "description": "The DevRev IDs of the users assigned to the parts to list. Use \"me\" for the current user."},
+                "parent_part": {"type": "array", "items": {"type": "string"}, "description": "The DevRev IDs of the parent parts to of the parts to list"},
+                "created_by": {"type": "array", "items": {"type": "string"}, "description": "The DevRev IDs of the users who created the parts to list. Use \"me\" for the current user."},
+                "modified_by": {"type": "array", "items": {"type": "string"}, "description": "The DevRev IDs of the users who modified the parts to list"},
+                "sort_by": {"type": "array", "items": {"type": "string", "enum": ["target_close_date:asc", "target_close_date:desc", "target_start_date:asc", "target_start_date:desc", "actual_close_date:asc", "actual_close_date:desc", "actual_start_date:asc", "actual_start_date:desc", "created_date:asc", "created_date:desc", "modified_date:asc", "modified_date:desc"]}, "description": "The field (and the order) to sort the parts by, in the sequence of the array elements"},
+                "accounts": {"type": "array", "items": {"type": "string"}, "description": "The account IDs of the accounts filter on parts to list"},
+                "target_close_date": {
+                    "type": "object",
+                    "properties": {
+                        "after": {"type": "string", "description": "The start date of the target close date range, for example: 2025-06-03T00:00:00Z"},
+                        "before": {"type": "string", "description": "The end date of the target close date range, for example: 2025-06-03T00:00:00Z"},
+                    },
+                    "required": ["after", "before"]
+                },
+                "target_start_date": {
+                    "type": "object",
+                    "properties": {
+                        "after": {"type": "string", "description": "The start date of the target start date range, for example: 2025-06-03T00:00:00Z"},
+                        "before": {"type": "string", "description": "The end date of the target start date range, for example: 2025-06-03T00:00:00Z"},
+                    },
+                    "required": ["after", "before"]
+                },
+                "actual_close_date": {
+                    "type": "object",
+                    "properties": {
+                        "after": {"type": "string", "description": "The start date of the actual close date range, for example: 2025-06-03T00:00:00Z"},
+                        "before": {"type": "string", "description": "The end date of the actual close date range, for example: 2025-06-03T00:00:00Z"},
+                    },
+                    "required": ["after", "before"]
+                },
+                "actual_start_date": {
+                    "type": "object",
+                    "properties": {
+                        "after": {"type": "string", "description": "The start date of the actual start date range, for example: 2025-06-03T00:00:00Z"},
+                        "before": {"type": "string", "description": "The end date of the actual start date range, for example: 2025-06-03T00:00:00Z"},
+                    },
+                    "required": ["after", "before"]
+                },
+                "fields": {"type": "array", "items": {"type": "string"}, "description": "Dotted paths of the fields to return for each part, for example: display_id, stage.name or owned_by[].display_name. All fields are returned when omitted."},
+            },
+            "required": ["type"],
+        },
+    )
+)
+async def handle_list_parts(arguments: dict | None) -> list[types.TextContent]:
+    """List parts matching the given filters."""
+    if not arguments:
+        raise ValueError("Missing arguments")
+
+    payload = {}
+    payload["enhancement"] = {}
+
+    type = arguments.get("type")
+    if not type:
+        raise ValueError("Missing type parameter")
+    payload["type"] = type
+
+    cursor = arguments.get("cursor")
+    if cursor:
+        payload["cursor"] = cursor["next_cursor"]
+        payload["mode"] = cursor["mode"]
+
+    owned_by = arguments.get("owned_by")
+    if owned_by:
+        payload["owned_by"] = await _resolve_me(owned_by)
+
+    parent_part = arguments.get("parent_part")
+    if parent_part:
+        payload["parent_part"] = {"parts": parent_part}
+
+    created_by = arguments.get("created_by")
+    if created_by:
+        payload["created_by"] = await _resolve_me(created_by)
+
+    modified_by = arguments.get("modified_by")
+    if modified_by:
+        payload["modified_by"] = modified_by
+
+    sort_by = arguments.get("sort_by")
+    if sort_by:
+        payload["sort_by"] = sort_by
+
+    accounts = arguments.get("accounts")
+    if accounts:
+        if 'enhancement' in type:
+            payload["enhancement"]["accounts"] = accounts
+
+    target_close_date = arguments.get("target_close_date")
+    if target_close_date:
+        if 'enhancement' in type:
+            payload["enhancement"]["target_close_date"] = {
+                "after": target_close_date["after"], "before": target_close_date["before"]}
+
+    target_start_date = arguments.get("target_start_date")
+    if target_start_date:
+        if 'enhancement' in type:
+            payload["enhancement"]["target_start_date"] = {
+                "after": target_start_date["after"], "before": target_start_date["before"]}
+
+    actual_close_date = arguments.get("actual_close_date")
+    if actual_close_date:
+        if 'enhancement' in type:
+            payload["enhancement"]["actual_close_date"] = {
+                "after": actual_close_date["after"], "before": actual_close_date["before"]}
+
+    actual_start_date = arguments.get("actual_start_date")
+    if actual_start_date:
+        if 'enhancement' in type:
+            payload["enhancement"]["actual_start_date"] = {
+                "after": actual_start_date["after"], "before": actual_start_date["before"]}
+
+    if payload["enhancement"] == {}:
+        payload.pop("enhancement")
+
+    fields = arguments.get("fields")
+
+    response = await make_devrev_request_async(
+        "parts.list",
+        payload
+    )
+
+    if response.status_code != 200:
+        error_text = response.text
         return [
             types.TextContent(
                 type="text",
-                text=f"Object updated successfully: {id}"
+                text=f"List parts failed with status {response.status_code}: {error_text}"
             )
         ]
-    elif name == "list_works":
-        payload = {}
-        payload["issue"] = {}
-        payload["ticket"] = {}
-
-        type = arguments.get("type")
-        if not type:
-            raise ValueError("Missing type parameter")
-        payload["type"] = type
-
-        cursor = arguments.get("cursor")
-        if cursor:
-            payload["cursor"] = cursor["next_cursor"]
-            payload["mode"] = cursor["mode"]
-
-        applies_to_part = arguments.get("applies_to_part")
-        if applies_to_part:
-            payload["applies_to_part"] = applies_to_part
-
-        created_by = arguments.get("created_by")
-        if created_by:
-            payload["created_by"] = created_by
-
-        modified_by = arguments.get("modified_by")
-        if modified_by:
-            payload["modified_by"] = modified_by
-
-        owned_by = arguments.get("owned_by")
-        if owned_by:
-            payload["owned_by"] = owned_by
-
-        state = arguments.get("state")
-        if state:
-            payload["state"] = state
-
-        custom_fields = arguments.get("custom_fields")
-        if custom_fields:
-            payload["custom_fields"] = {}
-            for custom_field in custom_fields:
-                payload["custom_fields"]["tnt__" +
-                                         custom_field["name"]] = custom_field["value"]
-
-        sla_summary = arguments.get("sla_summary")
-        if sla_summary:
-            payload["issue"]["sla_summary"] = {"target_time": {
-                "type": "range", "after": sla_summary["after"], "before": sla_summary["before"]}}
-
-        sort_by = arguments.get("sort_by")
-        if sort_by:
-            payload["sort_by"] = sort_by
-
-        rev_orgs = arguments.get("rev_orgs")
-        if rev_orgs and rev_orgs != []:
-            if 'ticket' in type:
-                payload["ticket"]["rev_org"] = rev_orgs
-
-            if 'issue' in type:
-                payload["issue"]["rev_orgs"] = rev_orgs
-
-        subtype = arguments.get("subtype")
-        if subtype:
-            if 'ticket' in type:
-                payload["ticket"]["subtype"] = subtype
-
-            if 'issue' in type:
-                payload["issue"]["subtype"] = subtype
-
-        target_close_date = arguments.get("target_close_date")
-        if target_close_date:
-            payload["target_close_date"] = {
-                "type": "range", "after": target_close_date["after"], "before": target_close_date["before"]}
-
-        target_start_date = arguments.get("target_start_date")
-        if target_start_date:
-            if 'issue' in type:
-                payload["issue"]["target_start_date"] = {
-                    "type": "range", "after": target_start_date["after"], "before": target_start_date["before"]}
-
-        actual_close_date = arguments.get("actual_close_date")
-        if actual_close_date:
-            payload["actual_close_date"] = {
-                "type": "range", "after": actual_close_date["after"], "before": actual_close_date["before"]}
-
-        actual_start_date = arguments.get("actual_start_date")
-        if actual_start_date:
-            if 'issue' in type:
-                payload["issue"]["actual_start_date"] = {
-                    "type": "range", "after": actual_start_date["after"], "before": actual_start_date["before"]}
-
-        created_date = arguments.get("created_date")
-        if created_date:
-            payload["created_date"] = {
-                "type": "range", "after": created_date["after"], "before": created_date["before"]}
-
-        modified_date = arguments.get("modified_date")
-        if modified_date:
-            payload["modified_date"] = {
-                "type": "range", "after": modified_date["after"], "before": modified_date["before"]}
-
-        sprint = arguments.get("sprint")
-        if sprint:
-            payload["issue"]["sprint"] = sprint
-
-        if payload["issue"] == {}:
-            payload.pop("issue")
-
-        if payload["ticket"] == {}:
-            payload.pop("ticket")
-
-        response = make_devrev_request(
-            "works.list",
-            payload
+
+    return [
+        types.TextContent(
+            type="text",
+            text=f"Parts listed successfully: {format_response(response, fields, 'parts')}"
         )
+    ]
 
-        if response.status_code != 200:
-            error_text = response.text
-            return [
-                types.TextContent(
-                    type="text",
-                    text=f"List works failed with status {response.status_code}: {error_text}"
-                )
-            ]
+
+@tool(
+    types.Tool(
+        name="list_meetings",
+        description="List meetings in DevRev",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "channel": {
+                    "type": "array",
+                    "items": {"type": "string", "enum": ["amazon_connect", "google_meet", "offline", "other", "teams", "zoom"]},
+                    "description": "Filters for meeting on specified channels"
+                },
+                "created_by": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Filters for meetings created by the specified user DevRev IDs. Use \"me\" for the current user."
+                },
+                "created_date": {
+                    "type": "object",
+                    "properties": {
+                        "after": {"type": "string", "description": "The start date of the created date range, for example: 2025-06-03T00:00:00Z"},
+                        "before": {"type": "string", "description": "The end date of the created date range, for example: 2025-06-03T00:00:00Z"}
+                    },
+                    "required": ["after", "before"]
+                },
+                "cursor": {
+                    "type": "object",
+                    "properties": {
+                        "next_cursor": {"type": "string", "description": "The cursor to use for pagination. If not provided, iteration begins from the first page."},
+                        "mode": {"type": "string", "enum": ["after", "before"], "description": "The mode to iterate after the cursor or before the cursor"}
+                    },
+                    "required": ["next_cursor", "mode"]
+                },
+                "ended_date": {
+                    "type": "object",
+                    "properties": {
+                        "after": {"type": "string", "description": "The start date of the ended date range, for example: 2025-06-03T00:00:00Z"},
+                        "before": {"type": "string", "description": "The end date of the ended date range, for example: 2025-06-03T00:00:00Z"}
+                    },
+                    "required": ["after", "before"]
+                },
+                "external_ref": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Filters for meetings with the provided external_ref(s)"
+                },
+                "limit": {
+                    "type": "integer",
+                    "description": "The maximum number of meetings to return"
+                },
+                "members": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Filter for meeting on specified Member Ids"
+                },
+                "modified_date": {
+                    "type": "object",
+                    "properties": {
+                        "after": {"type": "string", "description": "The start date of the modified date range, for example: 2025-06-03T00:00:00Z"},
+                        "before": {"type": "string", "description": "The end date of the modified date range, for example: 2025-06-03T00:00:00Z"}
+                    },
+                    "required": ["after", "before"]
+                },
+                "organizer": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Filter for meeting on specified organizers"
+                },
+                "scheduled_date": {
+                    "type": "object",
+                    "properties": {
+                        "after": {"type": "string", "description": "The start date of the scheduled date range, for example: 2025-06-03T00:00:00Z"},
+                        "before": {"type": "string", "description": "The end date of the scheduled date range, for example: 2025-06-03T00:00:00Z"}
+                    },
+                    "required": ["after", "before"]
+                },
+                "sort_by": {
+                    "type": "array",
+                    "items": {
+                        "type": "string",
+                        "enum": ["target_start_date:asc", "target_start_date:desc", "target_close_date:asc", "target_close_date:desc", "actual_start_date:asc", "actual_start_date:desc", "actual_close_date:asc", "actual_close_date:desc", "created_date:asc", "created_date:desc", "modified_date:asc", "modified_date:desc"]
+                    },
+                    "description": "The field (and the order) to sort the meetings by, in the sequence of the array elements"
+                },
+                "state": {
+                    "type": "array",
+                    "items": {"type": "string", "enum": ["cancelled", "completed", "no_show", "ongoing", "rejected", "scheduled", "rescheduled", "waiting"]},
+                    "description": "Filters for meeting on specified state or outcomes"
+                }
+            }
+        }
+    )
+)
+async def handle_list_meetings(arguments: dict | None) -> list[types.TextContent]:
+    """List meetings matching the given filters."""
+    if not arguments:
+        arguments = {}
+
+    payload = {}
+
+    channel = arguments.get("channel")
+    if channel:
+        payload["channel"] = channel
+
+    created_by = arguments.get("created_by")
+    if created_by:
+        payload["created_by"] = await _resolve_me(created_by)
+
+    created_date = arguments.get("created_date")
+    if created_date:
+        payload["created_date"] = {
+            "type": "range", "after": created_date["after"], "before": created_date["before"]}
+
+    cursor = arguments.get("cursor")
+    if cursor:
+        payload["cursor"] = cursor["next_cursor"]
+        payload["mode"] = cursor["mode"]
+
+    ended_date = arguments.get("ended_date")
+    if ended_date:
+        payload["ended_date"] = {
+            "type": "range", "after": ended_date["after"], "before": ended_date["before"]}
+
+    external_ref = arguments.get("external_ref")
+    if external_ref:
+        payload["external_ref"] = external_ref
+
+    limit = arguments.get("limit")
+    if limit:
+        payload["limit"] = limit
+
+    members = arguments.get("members")
+    if members:
+        payload["members"] = members
+
+    modified_date = arguments.get("modified_date")
+    if modified_date:
+        payload["modified_date"] = {
+            "type": "range", "after": modified_date["after"], "before": modified_date["before"]}
+
+    organizer = arguments.get("organizer")
+    if organizer:
+        payload["organizer"] = organizer
+
+    scheduled_date = arguments.get("scheduled_date")
+    if scheduled_date:
+        payload["scheduled_date"] = {
+            "type": "range", "after": scheduled_date["after"], "before": scheduled_date["before"]}
+
+    sort_by = arguments.get("sort_by")
+    if sort_by:
+        payload["sort_by"] = sort_by
+
+    state = arguments.get("state")
+    if state:
+        payload["state"] = state
+
+    response = await make_devrev_request_async(
+        "meetings.list",
+        payload
+    )
+
+    if response.status_code != 200:
+        error_text = response.text
         return [
             types.TextContent(
                 type="text",
-                text=f"Works listed successfully: {response.json()}"
+                text=f"List meetings failed with status {response.status_code}: {error_text}"
             )
         ]
-    elif name == "get_part":
-        if not arguments:
-            raise ValueError("Missing arguments")
 
-        id = arguments.get("id")
-        if not id:
-            raise ValueError("Missing id parameter")
+    return [
+        types.TextContent(
+            type="text",
+            text=f"Meetings listed successfully: {format_response(response)}"
+        )
+    ]
+
 
-        response = make_devrev_request(
-            "parts.get",
+@tool(
+    types.Tool(
+        name="valid_stage_transition",
+        description="gets a list of valid stage transition for a given work item (issue, ticket) or part (enhancement). Use this before updating stage of the work item or part to ensure the transition is valid.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "type": {"type": "string", "enum": ["issue", "ticket", "enhancement"]},
+                "id": {"type": "string", "description": "The DevRev ID of the work item (issue, ticket) or part (enhancement)"},
+            },
+            "required": ["type", "id"]
+        }
+    )
+)
+async def handle_valid_stage_transition(arguments: dict | None) -> list[types.TextContent]:
+    """List the stages a work item or part can move to from its current stage."""
+    if not arguments:
+        raise ValueError("Missing arguments")
+
+    payload = {}
+
+    id = arguments.get("id")
+    if not id:
+        raise ValueError("Missing id parameter")
+    payload["id"] = id
+
+    type = arguments.get("type")
+    if not type:
+        raise ValueError("Missing type parameter")
+    payload["type"] = type
+
+    current_stage_id = None
+    leaf_type = None
+    subtype = None
+
+    if (type == "issue" or type == "ticket"):
+        response = await make_devrev_request_async(
+            "works.get",
             {
                 "id": id
             }
@@ -889,545 +1670,381 @@ async def handle_call_tool(
             return [
                 types.TextContent(
                     type="text",
-                    text=f"Get part failed with status {response.status_code}: {error_text}"
+                    text=f"Get work item failed with status {response.status_code}: {error_text}"
                 )
             ]
 
-        return [
-            types.TextContent(
-                type="text",
-                text=f"Part information for '{id}':\n{response.json()}"
-            )
-        ]
-    elif name == "create_part":
-        if not arguments:
-            raise ValueError("Missing arguments")
-
-        payload = {}
+        work = decode_response(response).get("work", {})
+        current_stage_id = work.get("stage", {}).get("stage", {}).get("id", {})
+        leaf_type = work.get("type", {})
+        subtype = work.get("subtype", {})
 
-        type = arguments.get("type")
-        if not type:
-            raise ValueError("Missing type parameter")
-        payload["type"] = type
-
-        part_name = arguments.get("name")
-        if not part_name:
-            raise ValueError("Missing name parameter")
-        payload["name"] = part_name
-
-        owned_by = arguments.get("owned_by")
-        if not owned_by:
-            raise ValueError("Missing owned_by parameter")
-        payload["owned_by"] = owned_by
-
-        parent_part = arguments.get("parent_part")
-        if not parent_part:
-            raise ValueError("Missing parent_part parameter")
-        payload["parent_part"] = parent_part
-
-        description = arguments.get("description")
-        if description:
-            payload["description"] = description
-
-        response = make_devrev_request(
-            "parts.create",
-            payload
+    elif (type == "enhancement"):
+        response = await make_devrev_request_async(
+            "parts.get",
+            {
+                "id": id
+            }
         )
 
-        if response.status_code != 201:
+        if response.status_code != 200:
             error_text = response.text
             return [
                 types.TextContent(
                     type="text",
-                    text=f"Create part failed with status {response.status_code}: {error_text}"
+                    text=f"Get part failed with status {response.status_code}: {error_text}"
                 )
             ]
 
+        part = decode_response(response).get("part", {})
+        current_stage_id = part.get("stage_v2", {}).get("stage", {}).get("id", {})
+        leaf_type = part.get("type", {})
+        subtype = part.get("subtype", {})
+    else:
+        raise ValueError("Invalid type parameter")
+
+    if (current_stage_id == {} or leaf_type == {}):
+        raise ValueError("Could not get current stage or leaf type")
+
+    try:
+        stages = await _get_stage_diagram_stages(leaf_type, subtype)
+    except _StageDiagramError as e:
         return [
             types.TextContent(
                 type="text",
-                text=f"Part created successfully: {response.json()}"
+                text=str(e)
             )
         ]
-    elif name == "update_part":
-        if not arguments:
-            raise ValueError("Missing arguments")
-
-        payload = {}
-
-        id = arguments.get("id")
-        if not id:
-            raise ValueError("Missing id parameter")
-        payload["id"] = id
-
-        type = arguments.get("type")
-        if not type:
-            raise ValueError("Missing type parameter")
-        payload["type"] = type
-
-        part_name = arguments.get("name")
-        if part_name:
-            payload["name"] = part_name
-
-        owned_by = arguments.get("owned_by")
-        if owned_by:
-            payload["owned_by"] = owned_by
-
-        description = arguments.get("description")
-        if description:
-            payload["description"] = description
-
-        target_close_date = arguments.get("target_close_date")
-        if target_close_date:
-            payload["target_close_date"] = target_close_date
-
-        target_start_date = arguments.get("target_start_date")
-        if target_start_date:
-            payload["target_start_date"] = target_start_date
 
-        stage = arguments.get("stage")
-        if stage:
-            payload["stage_v2"] = stage
-
-        response = make_devrev_request(
-            "parts.update",
-            payload
-        )
-
-        if response.status_code != 200:
-            error_text = response.text
+    for stage in stages:
+        if stage.get("stage", {}).get("id") == current_stage_id:
+            transitions = stage.get("transitions", [])
             return [
                 types.TextContent(
                     type="text",
-                    text=f"Update part failed with status {response.status_code}: {error_text}"
+                    text=f"Valid Transitions for '{id}' from current stage:\n{format_value(transitions)}"
                 )
             ]
 
+    return [
+        types.TextContent(
+            type="text",
+            text=f"No valid transitions found for '{id}' from current stage"
+        ),
+    ]
+
+
+@tool(
+    types.Tool(
+        name="add_timeline_entry",
+        description="Add a timeline entry to a work item (issue, ticket) or part (enhancement)",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "id": {"type": "string", "description": "The DevRev ID of the work item (issue, ticket) or part (enhancement)"},
+                "timeline_entry": {"type": "string", "description": "The timeline entry about updates to the work item (issue, ticket) or part (enhancement)."},
+            },
+            "required": ["id", "timeline_entry"],
+        }
+    )
+)
+async def handle_add_timeline_entry(arguments: dict | None) -> list[types.TextContent]:
+    """Add a timeline comment to a work item or part."""
+    if not arguments:
+        raise ValueError("Missing arguments")
+
+    payload = {"type": "timeline_comment"}
+
+    id = arguments.get("id")
+    if not id:
+        raise ValueError("Missing id parameter")
+    payload["object"] = id
+
+    timeline_entry = arguments.get("timeline_entry")
+    if not timeline_entry:
+        raise ValueError("Missing timeline_entry parameter")
+    payload["body"] = timeline_entry
+
+    timeline_response = await make_devrev_request_async(
+        "timeline-entries.create",
+        payload
+    )
+    if timeline_response.status_code != 201:
+        error_text = timeline_response.text
         return [
             types.TextContent(
                 type="text",
-                text=f"Part updated successfully: {id}"
+                text=f"Create timeline entry failed with status {timeline_response.status_code}: {error_text}"
             )
         ]
-    elif name == "list_parts":
-        if not arguments:
-            raise ValueError("Missing arguments")
-
-        payload = {}
-        payload["enhancement"] = {}
-
-        type = arguments.get("type")
-        if not type:
-            raise ValueError("Missing type parameter")
-        payload["type"] = type
-
-        cursor = arguments.get("cursor")
-        if cursor:
-            payload["cursor"] = cursor["next_cursor"]
-            payload["mode"] = cursor["mode"]
-
-        owned_by = arguments.get("owned_by")
-        if owned_by:
-            payload["owned_by"] = owned_by
-
-        parent_part = arguments.get("parent_part")
-        if parent_part:
-            payload["parent_part"] = {"parts": parent_part}
-
-        created_by = arguments.get("created_by")
-        if created_by:
-            payload["created_by"] = created_by
-
-        modified_by = arguments.get("modified_by")
-        if modified_by:
-            payload["modified_by"] = modified_by
-
-        sort_by = arguments.get("sort_by")
-        if sort_by:
-            payload["sort_by"] = sort_by
-
-        accounts = arguments.get("accounts")
-        if accounts:
-            if 'enhancement' in type:
-                payload["enhancement"]["accounts"] = accounts
-
-        target_close_date = arguments.get("target_close_date")
-        if target_close_date:
-            if 'enhancement' in type:
-                payload["enhancement"]["target_close_date"] = {
-                    "after": target_close_date["after"], "before": target_close_date["before"]}
-
-        target_start_date = arguments.get("target_start_date")
-        if target_start_date:
-            if 'enhancement' in type:
-                payload["enhancement"]["target_start_date"] = {
-                    "after": target_start_date["after"], "before": target_start_date["before"]}
-
-        actual_close_date = arguments.get("actual_close_date")
-        if actual_close_date:
-            if 'enhancement' in type:
-                payload["enhancement"]["actual_close_date"] = {
-                    "after": actual_close_date["after"], "before": actual_close_date["before"]}
-
-        actual_start_date = arguments.get("actual_start_date")
-        if actual_start_date:
-            if 'enhancement' in type:
-                payload["enhancement"]["actual_start_date"] = {
-                    "after": actual_start_date["after"], "before": actual_start_date["before"]}
-
-        if payload["enhancement"] == {}:
-            payload.pop("enhancement")
-
-        response = make_devrev_request(
-            "parts.list",
-            payload
+
+    return [
+        types.TextContent(
+            type="text",
+            text=f"Timeline entry created successfully: {format_response(timeline_response)}"
         )
+    ]
 
-        if response.status_code != 200:
-            error_text = response.text
-            return [
-                types.TextContent(
-                    type="text",
-                    text=f"List parts failed with status {response.status_code}: {error_text}"
-                )
-            ]
 
+@tool(
+    types.Tool(
+        name="get_sprints",
+        description="Get active or planned sprints for a given part ID. Use this to get the sprints for an issue based on its part.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "ancestor_part_id": {"type": "string", "description": "The ID of the part to get the sprints for."},
+                "state": {
+                    "type": "string",
+                    "enum": ["active", "planned"],
+                    "description": "The state of the sprints to get. When the state is not provided in query, the tool will get the active sprints."
+                },
+            },
+            "required": ["ancestor_part_id"],
+        },
+    )
+)
+async def handle_get_sprints(arguments: dict | None) -> list[types.TextContent]:
+    """List the active or planned sprints under a part, served stale-while-revalidate."""
+    if not arguments:
+        raise ValueError("Missing arguments")
+
+    payload = {"group_object_type": ["work"]}
+
+    ancestor_part_id = arguments.get("ancestor_part_id")
+    if not ancestor_part_id:
+        raise ValueError("Missing ancestor_part_id parameter")
+    payload["ancestor_part"] = [ancestor_part_id]
+
+    state = arguments.get("state")
+    if not state:
+        state = "active"
+    payload["state"] = [state]
+
+    response = await _request_swr(
+        "vistas.groups.list",
+        payload
+    )
+    if response.status_code != 200:
+        error_text = response.text
         return [
             types.TextContent(
                 type="text",
-                text=f"Parts listed successfully: {response.json()}"
+                text=f"Get sprints failed with status {response.status_code}: {error_text}"
             )
         ]
-    elif name == "list_meetings":
-        if not arguments:
-            arguments = {}
-
-        payload = {}
-
-        channel = arguments.get("channel")
-        if channel:
-            payload["channel"] = channel
-
-        created_by = arguments.get("created_by")
-        if created_by:
-            payload["created_by"] = created_by
-
-        created_date = arguments.get("created_date")
-        if created_date:
-            payload["created_date"] = {
-                "type": "range", "after": created_date["after"], "before": created_date["before"]}
-
-        cursor = arguments.get("cursor")
-        if cursor:
-            payload["cursor"] = cursor["next_cursor"]
-            payload["mode"] = cursor["mode"]
-
-        ended_date = arguments.get("ended_date")
-        if ended_date:
-            payload["ended_date"] = {
-                "type": "range", "after": ended_date["after"], "before": ended_date["before"]}
-
-        external_ref = arguments.get("external_ref")
-        if external_ref:
-            payload["external_ref"] = external_ref
-
-        limit = arguments.get("limit")
-        if limit:
-            payload["limit"] = limit
-
-        members = arguments.get("members")
-        if members:
-            payload["members"] = members
-
-        modified_date = arguments.get("modified_date")
-        if modified_date:
-            payload["modified_date"] = {
-                "type": "range", "after": modified_date["after"], "before": modified_date["before"]}
-
-        organizer = arguments.get("organizer")
-        if organizer:
-            payload["organizer"] = organizer
-
-        scheduled_date = arguments.get("scheduled_date")
-        if scheduled_date:
-            payload["scheduled_date"] = {
-                "type": "range", "after": scheduled_date["after"], "before": scheduled_date["before"]}
-
-        sort_by = arguments.get("sort_by")
-        if sort_by:
-            payload["sort_by"] = sort_by
-
-        state = arguments.get("state")
-        if state:
-            payload["state"] = state
-
-        response = make_devrev_request(
-            "meetings.list",
-            payload
+
+    sprints = decode_response(response).get("vista_group", [])
+    return [
+        types.TextContent(
+            type="text",
+            text=f"Sprints for '{ancestor_part_id}':\n{format_value(sprints)}"
         )
+    ]
 
-        if response.status_code != 200:
-            error_text = response.text
-            return [
-                types.TextContent(
-                    type="text",
-                    text=f"List meetings failed with status {response.status_code}: {error_text}"
-                )
-            ]
 
+@tool(
+    types.Tool(
+        name="list_subtypes",
+        description="List all subtypes in DevRev for a given leaf type",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "leaf_type": {"type": "string", "enum": ["issue", "ticket"]},
+            },
+            "required": ["leaf_type"],
+        }
+    )
+)
+async def handle_list_subtypes(arguments: dict | None) -> list[types.TextContent]:
+    """List the subtypes available for a leaf type, served stale-while-revalidate."""
+    if not arguments:
+        raise ValueError("Missing arguments")
+
+    payload = {}
+
+    leaf_type = arguments.get("leaf_type")
+    if not leaf_type:
+        raise ValueError("Missing leaf_type parameter")
+    payload["leaf_type"] = leaf_type
+
+    response = await _request_swr(
+        "schemas.subtypes.list",
+        payload
+    )
+
+    if response.status_code != 200:
+        error_text = response.text
         return [
             types.TextContent(
                 type="text",
-                text=f"Meetings listed successfully: {response.json()}"
+                text=f"List subtypes failed with status {response.status_code}: {error_text}"
             )
         ]
-    elif name == "valid_stage_transition":
-        if not arguments:
-            raise ValueError("Missing arguments")
-
-        payload = {}
-
-        id = arguments.get("id")
-        if not id:
-            raise ValueError("Missing id parameter")
-        payload["id"] = id
-
-        type = arguments.get("type")
-        if not type:
-            raise ValueError("Missing type parameter")
-        payload["type"] = type
-
-        current_stage_id = None
-        leaf_type = None
-        subtype = None
-
-        if (type == "issue" or type == "ticket"):
-            response = make_devrev_request(
-                "works.get",
-                {
-                    "id": id
-                }
-            )
-
-            if response.status_code != 200:
-                error_text = response.text
-                return [
-                    types.TextContent(
-                        type="text",
-                        text=f"Get work item failed with status {response.status_code}: {error_text}"
-                    )
-                ]
-
-            current_stage_id = response.json().get("work", {}).get(
-                "stage", {}).get("stage", {}).get("id", {})
-            leaf_type = response.json().get("work", {}).get("type", {})
-            subtype = response.json().get("work", {}).get("subtype", {})
-
-        elif (type == "enhancement"):
-            response = make_devrev_request(
-                "parts.get",
-                {
-                    "id": id
-                }
-            )
 
-            if response.status_code != 200:
-                error_text = response.text
-                return [
-                    types.TextContent(
-                        type="text",
-                        text=f"Get part failed with status {response.status_code}: {error_text}"
-                    )
-                ]
-
-            current_stage_id = response.json().get("part", {}).get(
-                "stage_v2", {}).get("stage", {}).get("id", {})
-            leaf_type = response.json().get("part", {}).get("type", {})
-            subtype = response.json().get("part", {}).get("subtype", {})
-        else:
-            raise ValueError("Invalid type parameter")
-
-        if (current_stage_id == {} or leaf_type == {}):
-            raise ValueError("Could not get current stage or leaf type")
+    return [
+        types.TextContent(
+            type="text",
+            text=f"Subtypes for '{leaf_type}':\n{format_response(response)}"
+        )
+    ]
 
-        schema_payload = {}
-        if (leaf_type != {}):
-            schema_payload["leaf_type"] = leaf_type
-        if (subtype != {}):
-            schema_payload["custom_schema_spec"] = {"subtype": subtype}
 
-        schema_response = make_devrev_request(
-            "schemas.aggregated.get",
-            schema_payload
+def get_diagnostics() -> Dict[str, Any]:
+    """Return the circuit breaker, cache, coalescing, retry and rate limiting state of this process."""
+    return {
+        "circuit_breakers": circuit_breaker_stats(),
+        "caches": cache.cache_stats(),
+        "disk_cache": disk_cache.disk_cache_stats(),
+        "coalescing": coalescing_stats(),
+        "retries": retry_stats(),
+        "rate_limits": rate_limit_stats(),
+    }
+
+
+@tool(
+    types.Tool(
+        name="get_diagnostics",
+        description="Report the health of this server's connection to the DevRev API: circuit breaker states per endpoint family, cache, request coalescing, retry and rate limiting counters. Use it to tell whether DevRev is currently failing or being throttled.",
+        inputSchema={
+            "type": "object",
+            "properties": {},
+        },
+    )
+)
+async def handle_get_diagnostics(arguments: dict | None) -> list[types.TextContent]:
+    """Report circuit breaker, cache, coalescing, retry and rate limiting state, summed over workers if any."""
+    diagnostics = get_diagnostics()
+    if workers.worker_dir():
+        # The tool and endpoint metrics are served by the metrics endpoint instead
+        snapshots = {name: {k: v for k, v in snapshot.items() if k != "metrics"}
+                     for name, snapshot in workers.read_snapshots().items()}
+        diagnostics["workers"] = {
+            "count": len(snapshots),
+            "total": workers.totals(snapshots.values()),
+            "per_worker": snapshots,
+        }
+    return [
+        types.TextContent(
+            type="text",
+            text=f"Diagnostics:\n{format_value(diagnostics)}"
         )
+    ]
 
-        if schema_response.status_code != 200:
-            error_text = schema_response.text
-            return [
-                types.TextContent(
-                    type="text",
-                    text=f"Get schema failed with status {schema_response.status_code}: {error_text}"
-                )
-            ]
-
-        stage_diagram_id = schema_response.json().get(
-            "schema", {}).get("stage_diagram_id", {}).get("id", {})
-        if stage_diagram_id == None:
-            raise ValueError("Could not get stage diagram id")
 
-        stage_transitions_response = make_devrev_request(
-            "stage-diagrams.get",
-            {"id": stage_diagram_id}
-        )
+@server.list_tools()
+async def handle_list_tools() -> list[types.Tool]:
+    """
+    List available tools.
+    Each tool specifies its arguments using JSON Schema validation.
+    The list is built once at import time by the @tool registrations.
+    """
+    return TOOLS
 
-        if stage_transitions_response.status_code != 200:
-            error_text = stage_transitions_response.text
-            return [
-                types.TextContent(
-                    type="text",
-                    text=f"Get stage diagram for Get stage transitions failed with status {stage_transitions_response.status_code}: {error_text}"
-                )
-            ]
 
-        stages = stage_transitions_response.json().get(
-            "stage_diagram", {}).get("stages", [])
-        for stage in stages:
-            if stage.get("stage", {}).get("id") == current_stage_id:
-                transitions = stage.get("transitions", [])
-                return [
-                    types.TextContent(
-                        type="text",
-                        text=f"Valid Transitions for '{id}' from current stage:\n{transitions}"
-                    )
-                ]
+class _MemoizedServerResult(types.ServerResult):
+    """
+    A ServerResult whose JSON-RPC dump is computed once and then reused.
 
-        return [
-            types.TextContent(
-                type="text",
-                text=f"No valid transitions found for '{id}' from current stage"
-            ),
-        ]
-    elif name == "add_timeline_entry":
-        if not arguments:
-            raise ValueError("Missing arguments")
+    The MCP session dumps every result with the same arguments before writing
+    it out, so an immutable result only needs to be walked by pydantic once.
+    """
 
-        payload = {"type": "timeline_comment"}
+    _json_dump: Dict[str, Any] | None = PrivateAttr(default=None)
 
-        id = arguments.get("id")
-        if not id:
-            raise ValueError("Missing id parameter")
-        payload["object"] = id
+    def model_dump(self, **kwargs: Any) -> Dict[str, Any]:
+        if kwargs != {"by_alias": True, "mode": "json", "exclude_none": True}:
+            return super().model_dump(**kwargs)
+        if self._json_dump is None:
+            self._json_dump = super().model_dump(**kwargs)
+        return self._json_dump
 
-        timeline_entry = arguments.get("timeline_entry")
-        if not timeline_entry:
-            raise ValueError("Missing timeline_entry parameter")
-        payload["body"] = timeline_entry
 
-        timeline_response = make_devrev_request(
-            "timeline-entries.create",
-            payload
-        )
-        if timeline_response.status_code != 201:
-            error_text = timeline_response.text
-            return [
-                types.TextContent(
-                    type="text",
-                    text=f"Create timeline entry failed with status {timeline_response.status_code}: {error_text}"
-                )
-            ]
+# The tools/list result, validated and serialized once at import.
+LIST_TOOLS_RESULT = _MemoizedServerResult(types.ListToolsResult(tools=TOOLS))
+LIST_TOOLS_RESULT.model_dump(by_alias=True, mode="json", exclude_none=True)
 
-        return [
-            types.TextContent(
-                type="text",
-                text=f"Timeline entry created successfully: {timeline_response.json()}"
-            )
-        ]
-    elif name == "get_sprints":
-        if not arguments:
-            raise ValueError("Missing arguments")
+_list_tools_request_handler = server.request_handlers[types.ListToolsRequest]
+_tools_listed = False
 
-        payload = {"group_object_type": ["work"]}
 
-        ancestor_part_id = arguments.get("ancestor_part_id")
-        if not ancestor_part_id:
-            raise ValueError("Missing ancestor_part_id parameter")
-        payload["ancestor_part"] = [ancestor_part_id]
+async def _handle_list_tools_request(req: types.ListToolsRequest | None) -> types.ServerResult:
+    """
+    Serve tools/list from the precomputed result.
 
-        state = arguments.get("state")
-        if not state:
-            state = "active"
-        payload["state"] = [state]
+    The first request still runs the handler registered by @server.list_tools()
+    so the SDK records the tool definitions it validates call arguments against.
+    """
+    global _tools_listed
+    if not _tools_listed:
+        await _list_tools_request_handler(req)
+        _tools_listed = True
+    return LIST_TOOLS_RESULT
 
-        response = make_devrev_request(
-            "vistas.groups.list",
-            payload
-        )
-        if response.status_code != 200:
-            error_text = response.text
-            return [
-                types.TextContent(
-                    type="text",
-                    text=f"Get sprints failed with status {response.status_code}: {error_text}"
-                )
-            ]
 
-        sprints = response.json().get("vista_group", [])
-        return [
-            types.TextContent(
-                type="text",
-                text=f"Sprints for '{ancestor_part_id}':\n{sprints}"
-            )
-        ]
-    elif name == "list_subtypes":
-        if not arguments:
-            raise ValueError("Missing arguments")
+server.request_handlers[types.ListToolsRequest] = _handle_list_tools_request
 
-        payload = {}
 
-        leaf_type = arguments.get("leaf_type")
-        if not leaf_type:
-            raise ValueError("Missing leaf_type parameter")
-        payload["leaf_type"] = leaf_type
+@server.call_tool()
+async def handle_call_tool(
+    name: str, arguments: dict | None
+) -> list[types.TextContent | types.ImageContent | types.EmbeddedResource]:
+    """
+    Handle tool execution requests.
+    Tools can modify server state and notify clients of changes.
+    """
+    handler = TOOL_HANDLERS.get(name)
+    if handler is None:
+        raise ValueError(f"Unknown tool: {name}")
+    start = time.perf_counter()
+    try:
+        with using_api_key(_session_api_key()), call_deadline():
+            result = await handler(arguments)
+    except Exception:
+        metrics.get_metrics().observe_tool(name, time.perf_counter() - start, True)
+        raise
+    size = sum(len(item.text.encode()) for item in result if isinstance(item, types.TextContent))
+    metrics.get_metrics().observe_tool(name, time.perf_counter() - start, False, size)
+    return result
 
-        response = make_devrev_request(
-            "schemas.subtypes.list",
-            payload
-        )
 
-        if response.status_code != 200:
-            error_text = response.text
-            return [
-                types.TextContent(
-                    type="text",
-                    text=f"List subtypes failed with status {response.status_code}: {error_text}"
-                )
-            ]
+def _session_api_key() -> str | None:
+    """Return the API key the HTTP client of the current request authenticated with, if any."""
+    try:
+        request = getattr(server.request_context, "request", None)
+    except LookupError:
+        return None
+    scope = getattr(request, "scope", None)
+    user = scope.get("user") if isinstance(scope, dict) else None
+    access_token = getattr(user, "access_token", None)
+    return access_token.token if access_token is not None else None
 
-        return [
-            types.TextContent(
-                type="text",
-                text=f"Subtypes for '{leaf_type}':\n{response.json()}"
-            )
-        ]
-    else:
-        raise ValueError(f"Unknown tool: {name}")
 
 
 async def main():
     # Run the server using stdin/stdout streams
-    async with mcp.server.stdio.stdio_server() as (read_stream, write_stream):
-        await server.run(
-            read_stream,
-            write_stream,
-            InitializationOptions(
-                server_name="devrev_mcp",
-                server_version="0.4.2",
-                capabilities=server.get_capabilities(
-                    notification_options=NotificationOptions(),
-                    experimental_capabilities={},
+    if os.environ.get("DEVREV_MCP_PREFETCH_USER") == "1":
+        # Resolve the current user while the client is still initializing
+        asyncio.get_running_loop().create_task(prefetch_current_user())
+    try:
+        async with mcp.server.stdio.stdio_server() as (read_stream, write_stream):
+            await server.run(
+                read_stream,
+                write_stream,
+                InitializationOptions(
+                    server_name="devrev_mcp",
+                    server_version="0.4.2",
+                    capabilities=server.get_capabilities(
+                        notification_options=NotificationOptions(),
+                        experimental_capabilities={},
+                    ),
                 ),
-            ),
-        )
+            )
+    finally:
+        # Release pooled HTTP connections and the on-disk cache on shutdown
+        close_session()
+        disk_cache.close_disk_cache()
+        metrics.dump(os.environ.get("DEVREV_MCP_METRICS_FILE"))
 
 # Main entry point for CLI and integration tests
 if __name__ == "__main__":
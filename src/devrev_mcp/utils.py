@@ -5,9 +5,823 @@ SPDX-License-Identifier: MIT
 This module provides utility functions for making authenticated requests to the DevRev API.
 """
 
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import copy
+import json
 import os
-import requests
-from typing import Any, Dict
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import Any, Callable, Deque, Dict, Hashable, Iterator, Optional
+
+from . import cache, disk_cache, metrics
+from .lazy import LazyModule
+from .formatting import decode_response
+from .resilience import DeadlineExceededError, RetryPolicy, check_deadline, deadline_remaining, get_rate_limiter
+
+# Imported on first use so that starting the server does not pay for the HTTP client.
+requests = LazyModule("requests")
+
+
+# Base URL of the DevRev API. DEVREV_API_BASE_URL points the server at
+# another deployment, or at the local fake API in devrev_mcp.fake_api.
+API_BASE_URL = os.environ.get("DEVREV_API_BASE_URL", "https://api.devrev.ai").rstrip("/")
+
+# Endpoints that only read data. Identical concurrent requests to them are
+# coalesced into one upstream call.
+READ_ONLY_ENDPOINTS = frozenset({
+    "dev-users.self",
+    "internal/vistas.get",
+    "meetings.list",
+    "parts.get",
+    "parts.list",
+    "schemas.aggregated.get",
+    "schemas.subtypes.list",
+    "search.hybrid",
+    "stage-diagrams.get",
+    "vistas.groups.list",
+    "works.get",
+    "works.list",
+})
+
+# Endpoints that are safe to retry after a transient failure: reads, and
+# updates that set fields to given values.
+IDEMPOTENT_ENDPOINTS = READ_ONLY_ENDPOINTS | frozenset({
+    "parts.update",
+    "works.update",
+})
+
+# Read-only endpoints whose successful responses may be served from the
+# response cache. Caching is opt-in: anything not listed here, and in
+# particular every mutating endpoint, always goes to the API.
+CACHEABLE_ENDPOINTS = frozenset({
+    "schemas.aggregated.get",
+    "stage-diagrams.get",
+})
+
+# Object reads served from the "objects" cache, keyed by (endpoint, object
+# ID), with the key of the object in their response body.
+OBJECT_READ_ENDPOINTS = {
+    "parts.get": "part",
+    "works.get": "work",
+}
+
+# Mutations whose response body carries the object they created or updated,
+# in the same shape as the read endpoint's response. They refresh the
+# object's cache entry instead of just dropping it.
+OBJECT_WRITE_ENDPOINTS = {
+    "parts.create": "parts.get",
+    "parts.update": "parts.get",
+    "works.create": "works.get",
+    "works.update": "works.get",
+}
+
+# Default lifetime of cached objects in seconds, overridable with
+# DEVREV_MCP_OBJECT_CACHE_TTL. Shorter than other cached responses because
+# objects are also changed outside this server.
+DEFAULT_OBJECT_CACHE_TTL = 60.0
+
+# Shared HTTP session. Created lazily on first request and torn down by
+# close_session() when the server shuts down.
+_session: Optional[requests.Session] = None
+_session_lock = threading.Lock()
+
+# Bounded worker pool used to run blocking requests off the asyncio loop.
+_executor: Optional[ThreadPoolExecutor] = None
+
+# Set in the context handed to a worker thread when the async helpers have
+# already waited for the request's rate limit token on the event loop.
+_rate_admitted: contextvars.ContextVar[bool] = contextvars.ContextVar("devrev_rate_admitted", default=False)
+
+# API key of the MCP session being served, when the session brings its own.
+_session_api_key: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar("devrev_session_api_key", default=None)
+
+
+def get_api_key() -> Optional[str]:
+    """Return the API key of the current MCP session, falling back to DEVREV_API_KEY."""
+    return _session_api_key.get() or os.environ.get("DEVREV_API_KEY")
+
+
+@contextmanager
+def using_api_key(api_key: Optional[str]) -> Iterator[None]:
+    """
+    Send the requests made within this block with api_key, and keep their cached responses apart.
+
+    A None or empty api_key falls back to DEVREV_API_KEY.
+    """
+    token = _session_api_key.set(api_key or None)
+    try:
+        yield
+    finally:
+        _session_api_key.reset(token)
+
+
+def _env_int(name: str, default: int) -> int:
+    """Read a positive integer from the environment, falling back to default."""
+    value = os.environ.get(name)
+    if not value:
+        return default
+    try:
+        parsed = int(value)
+    except ValueError:
+        return default
+    return parsed if parsed > 0 else default
+
+
+def _env_float(name: str, default: float) -> float:
+    """Read a non-negative number from the environment, falling back to default."""
+    try:
+        value = float(os.environ.get(name, default))
+    except ValueError:
+        return default
+    return value if value >= 0 else default
+
+
+def _build_session() -> requests.Session:
+    """
+    Build a requests.Session backed by a keep-alive connection pool.
+
+    The pool is configured through environment variables:
+    - DEVREV_HTTP_POOL_CONNECTIONS: number of per-host pools to keep (default 4)
+    - DEVREV_HTTP_POOL_MAXSIZE: maximum connections kept per host (default 16)
+    - DEVREV_HTTP_POOL_BLOCK: if "1" (default), block instead of opening
+      connections beyond the per-host limit
+    """
+    adapter = requests.adapters.HTTPAdapter(
+        pool_connections=_env_int("DEVREV_HTTP_POOL_CONNECTIONS", 4),
+        pool_maxsize=_env_int("DEVREV_HTTP_POOL_MAXSIZE", 16),
+        pool_block=os.environ.get("DEVREV_HTTP_POOL_BLOCK", "1") == "1",
+    )
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers.update({
+        "Content-Type": "application/json",
+        "Connection": "keep-alive",
+    })
+    return session
+
+
+def get_session() -> requests.Session:
+    """Return the shared HTTP session, creating it on first use."""
+    global _session
+    session = _session
+    if session is None:
+        with _session_lock:
+            if _session is None:
+                _session = _build_session()
+            session = _session
+    return session
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    """
+    Return the shared request executor, creating it on first use.
+
+    Its size is read from DEVREV_HTTP_MAX_WORKERS and defaults to the
+    per-host pool size so that every worker can hold a pooled connection.
+    """
+    global _executor
+    executor = _executor
+    if executor is None:
+        with _session_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=_env_int(
+                        "DEVREV_HTTP_MAX_WORKERS",
+                        _env_int("DEVREV_HTTP_POOL_MAXSIZE", 16)
+                    ),
+                    thread_name_prefix="devrev-http",
+                )
+            executor = _executor
+    return executor
+
+
+def close_session() -> None:
+    """Close the shared HTTP session and stop the request executor."""
+    global _session, _executor
+    with _session_lock:
+        if _session is not None:
+            _session.close()
+            _session = None
+        if _executor is not None:
+            _executor.shutdown(wait=False, cancel_futures=True)
+            _executor = None
+
+
+# Default connect and read timeouts in seconds, overridable with
+# DEVREV_HTTP_CONNECT_TIMEOUT and DEVREV_HTTP_READ_TIMEOUT.
+DEFAULT_CONNECT_TIMEOUT = 5.0
+DEFAULT_READ_TIMEOUT = 30.0
+
+
+@lru_cache(maxsize=8)
+def _endpoint_timeouts(spec: str) -> Dict[str, tuple[Optional[float], Optional[float]]]:
+    """Parse per-endpoint timeouts such as "works.list=5:60,search.hybrid=:20"."""
+    timeouts = {}
+    for item in spec.split(","):
+        endpoint, _, value = item.strip().partition("=")
+        connect, _, read = value.partition(":")
+        try:
+            timeouts[endpoint] = (float(connect) if connect else None, float(read) if read else None)
+        except ValueError:
+            continue
+    return timeouts
+
+
+def request_timeout(path: str) -> tuple[float, float]:
+    """
+    Return the (connect, read) timeouts of a request to an API path.
+
+    Timeouts are read from the environment:
+    - DEVREV_HTTP_CONNECT_TIMEOUT: connect timeout in seconds (default 5)
+    - DEVREV_HTTP_READ_TIMEOUT: read timeout in seconds (default 30)
+    - DEVREV_HTTP_TIMEOUTS: per-endpoint overrides such as
+      "works.list=5:60,search.hybrid=:20", each given as connect:read with
+      either part optional
+
+    Both are cut down to what is left of the current tool call's deadline.
+
+    Raises:
+        DeadlineExceededError: If the tool call's deadline has already passed
+    """
+    connect = _env_float("DEVREV_HTTP_CONNECT_TIMEOUT", DEFAULT_CONNECT_TIMEOUT)
+    read = _env_float("DEVREV_HTTP_READ_TIMEOUT", DEFAULT_READ_TIMEOUT)
+    override_connect, override_read = _endpoint_timeouts(os.environ.get("DEVREV_HTTP_TIMEOUTS", "")).get(path, (None, None))
+    if override_connect is not None:
+        connect = override_connect
+    if override_read is not None:
+        read = override_read
+
+    remaining = check_deadline()
+    if remaining is not None:
+        connect = min(connect, remaining)
+        read = min(read, remaining)
+    return connect, read
+
+
+def _post(path: str, url: str, payload: Dict[str, Any]) -> requests.Response:
+    """POST a JSON payload through the shared session with the DevRev API key and the path's timeouts."""
+    api_key = get_api_key()
+    if not api_key:
+        raise ValueError("DEVREV_API_KEY environment variable is not set")
+
+    response = get_session().post(
+        url,
+        headers={"Authorization": f"{api_key}"},
+        json=payload,
+        timeout=request_timeout(path)
+    )
+    metrics.get_metrics().observe_upstream(path, _body_size(getattr(response, "request", None), "body"),
+                                           _body_size(response, "content"))
+    return response
+
+
+def _body_size(message: Any, attribute: str) -> int:
+    """Return the size of a request or response body, or 0 if it is not available as bytes."""
+    body = getattr(message, attribute, None)
+    return len(body) if isinstance(body, (bytes, str)) else 0
+
+
+class SingleFlight:
+    """
+    Share one in-flight call among concurrent callers of the same key.
+
+    The first caller of a key runs the call; callers arriving while it is in
+    flight wait for it, up to their own tool call's deadline, and receive its
+    result or exception.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._in_flight: Dict[Hashable, Future] = {}
+        self.calls = 0
+        self.coalesced = 0
+
+    def do(self, key: Hashable, call: Callable[[], Any]) -> Any:
+        """
+        Run call for key, or wait for the identical call already in flight.
+
+        Raises:
+            DeadlineExceededError: If the tool call's deadline passes while
+                waiting for another caller's call
+        """
+        with self._lock:
+            future = self._in_flight.get(key)
+            if future is None:
+                future = Future()
+                self._in_flight[key] = future
+                self.calls += 1
+                leader = True
+            else:
+                self.coalesced += 1
+                leader = False
+        if not leader:
+            remaining = deadline_remaining()
+            try:
+                return future.result(timeout=None if remaining is None else max(remaining, 0.0))
+            except FutureTimeoutError:
+                raise DeadlineExceededError(
+                    "Tool call deadline exceeded while waiting for an identical in-flight request") from None
+
+        try:
+            result = call()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                self._in_flight.pop(key, None)
+
+    def __contains__(self, key: Hashable) -> bool:
+        """Return whether a call for key is in flight."""
+        with self._lock:
+            return key in self._in_flight
+
+    def stats(self) -> Dict[str, int]:
+        """Return how many upstream calls were made and how many were coalesced."""
+        with self._lock:
+            return {"calls": self.calls, "coalesced": self.coalesced}
+
+
+_single_flight = SingleFlight()
+
+
+def coalescing_stats() -> Dict[str, int]:
+    """Return the request coalescing counters."""
+    return _single_flight.stats()
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling the DevRev API while an endpoint family's circuit is open."""
+
+
+def endpoint_family(path: str) -> str:
+    """Return the endpoint family of an API path, e.g. "works" for "works.get"."""
+    return path.rsplit("/", 1)[-1].split(".", 1)[0]
+
+
+class CircuitBreaker:
+    """
+    Stop calling an endpoint family while it is failing or too slow.
+
+    The breaker starts closed and records the outcome of every call made in
+    the last window seconds. Once at least min_calls were made, it opens
+    when the share of failed calls reaches error_rate, or the share of calls
+    slower than slow_call_seconds reaches slow_call_rate. Failures are
+    connection errors, timeouts and 5xx responses.
+
+    While open, calls fail immediately with CircuitOpenError. After
+    open_seconds the breaker turns half-open and lets a single probe call
+    through: its success closes the breaker, its failure opens it again.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, name: str, window: float = 30.0, min_calls: int = 10, error_rate: float = 0.5,
+                 slow_call_seconds: float = 10.0, slow_call_rate: float = 0.8, open_seconds: float = 30.0,
+                 clock: Callable[[], float] = time.monotonic):
+        self.name = name
+        self.window = window
+        self.min_calls = min_calls
+        self.error_rate = error_rate
+        self.slow_call_seconds = slow_call_seconds
+        self.slow_call_rate = slow_call_rate
+        self.open_seconds = open_seconds
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._calls: Deque[tuple[float, bool, bool]] = deque()
+        self._state = self.CLOSED
+        self._opened_at = 0.0
+        self._probing = False
+        self.trips = 0
+        self.rejected = 0
+
+    @classmethod
+    def from_env(cls, name: str) -> "CircuitBreaker":
+        """
+        Build a breaker from the environment:
+        - DEVREV_CIRCUIT_WINDOW: seconds of call history considered (default 30)
+        - DEVREV_CIRCUIT_MIN_CALLS: calls in the window before the breaker may open (default 10)
+        - DEVREV_CIRCUIT_ERROR_RATE: failed share of calls that opens the breaker (default 0.5)
+        - DEVREV_CIRCUIT_SLOW_CALL_SECONDS: latency above which a call counts as slow (default 10)
+        - DEVREV_CIRCUIT_SLOW_CALL_RATE: slow share of calls that opens the breaker (default 0.8)
+        - DEVREV_CIRCUIT_OPEN_SECONDS: how long the breaker stays open before a probe (default 30)
+        """
+        return cls(
+            name,
+            window=_env_float("DEVREV_CIRCUIT_WINDOW", 30.0),
+            min_calls=_env_int("DEVREV_CIRCUIT_MIN_CALLS", 10),
+            error_rate=_env_float("DEVREV_CIRCUIT_ERROR_RATE", 0.5),
+            slow_call_seconds=_env_float("DEVREV_CIRCUIT_SLOW_CALL_SECONDS", 10.0),
+            slow_call_rate=_env_float("DEVREV_CIRCUIT_SLOW_CALL_RATE", 0.8),
+            open_seconds=_env_float("DEVREV_CIRCUIT_OPEN_SECONDS", 30.0),
+        )
+
+    @property
+    def state(self) -> str:
+        """Return the current state, turning an expired open state into half-open."""
+        with self._lock:
+            return self._current_state(self._clock())
+
+    def _current_state(self, now: float) -> str:
+        if self._state == self.OPEN and now - self._opened_at >= self.open_seconds:
+            self._state = self.HALF_OPEN
+            self._probing = False
+        return self._state
+
+    def before_call(self) -> None:
+        """
+        Admit a call or fail fast.
+
+        Raises:
+            CircuitOpenError: If the breaker is open, or half-open with a probe already in flight
+        """
+        with self._lock:
+            now = self._clock()
+            state = self._current_state(now)
+            if state == self.CLOSED:
+                return
+            if state == self.HALF_OPEN and not self._probing:
+                self._probing = True
+                return
+            self.rejected += 1
+            retry_in = max(self.open_seconds - (now - self._opened_at), 0.0)
+        raise CircuitOpenError(
+            f"DevRev API circuit for '{self.name}' endpoints is open after repeated failures or slow "
+            f"responses; failing fast, next attempt allowed in {retry_in:.0f}s"
+        )
+
+    def record(self, failed: bool, latency: float) -> None:
+        """Record the outcome of an admitted call and open or close the breaker accordingly."""
+        with self._lock:
+            now = self._clock()
+            slow = latency >= self.slow_call_seconds
+            if self._state == self.HALF_OPEN:
+                self._probing = False
+                if failed or slow:
+                    self._open(now)
+                else:
+                    self._state = self.CLOSED
+                    self._calls.clear()
+                return
+            if self._state == self.OPEN:
+                return
+
+            self._calls.append((now, failed, slow))
+            while self._calls and self._calls[0][0] <= now - self.window:
+                self._calls.popleft()
+            total = len(self._calls)
+            if total < self.min_calls:
+                return
+            failures = sum(1 for _, failed, _ in self._calls if failed)
+            slow_calls = sum(1 for _, _, slow in self._calls if slow)
+            if failures >= self.error_rate * total or slow_calls >= self.slow_call_rate * total:
+                self._open(now)
+
+    def release(self) -> None:
+        """Forget an admitted call that ended without reaching the API, such as one missing its API key."""
+        with self._lock:
+            self._probing = False
+
+    def _open(self, now: float) -> None:
+        self._state = self.OPEN
+        self._opened_at = now
+        self._calls.clear()
+        self.trips += 1
+
+    def stats(self) -> Dict[str, Any]:
+        """Return the state, calls in the window and trip and rejection counters."""
+        with self._lock:
+            now = self._clock()
+            state = self._current_state(now)
+            return {
+                "state": state,
+                "window_calls": len(self._calls),
+                "window_failures": sum(1 for _, failed, _ in self._calls if failed),
+                "trips": self.trips,
+                "rejected": self.rejected,
+            }
+
+
+_breakers: Dict[str, CircuitBreaker] = {}
+_breakers_lock = threading.Lock()
+
+
+def get_circuit_breaker(path: str) -> Optional[CircuitBreaker]:
+    """
+    Return the circuit breaker of the endpoint family of path.
+
+    Returns None when breakers are disabled with DEVREV_CIRCUIT_BREAKER=0.
+    """
+    if os.environ.get("DEVREV_CIRCUIT_BREAKER", "1") == "0":
+        return None
+    family = endpoint_family(path)
+    breaker = _breakers.get(family)
+    if breaker is None:
+        with _breakers_lock:
+            breaker = _breakers.get(family)
+            if breaker is None:
+                breaker = CircuitBreaker.from_env(family)
+                _breakers[family] = breaker
+    return breaker
+
+
+def circuit_breaker_stats() -> Dict[str, Dict[str, Any]]:
+    """Return the state and counters of every circuit breaker, keyed by endpoint family."""
+    with _breakers_lock:
+        breakers = dict(_breakers)
+    return {family: breaker.stats() for family, breaker in sorted(breakers.items())}
+
+
+def reset_circuit_breakers() -> None:
+    """Forget all circuit breakers so they start closed with settings read from the environment."""
+    with _breakers_lock:
+        _breakers.clear()
+
+
+def _cache_key(path: str, payload: Dict[str, Any]) -> tuple:
+    """Build a response cache key from the API key, the endpoint path and the canonicalized payload."""
+    return (get_api_key(), path, json.dumps(payload, sort_keys=True, separators=(",", ":")))
+
+
+def _send(path: str, url: str, payload: Dict[str, Any]) -> requests.Response:
+    """
+    POST once, or under the retry policy if the endpoint is idempotent.
+
+    Every attempt passes the endpoint family's circuit breaker, which fails
+    fast with CircuitOpenError while open, and then takes a rate limit
+    token; a half-open probe that fails to get one is released. The token
+    of the first attempt has usually been awaited on the event loop
+    already; retries, and reads whose cached answer went away before they
+    ran, wait for theirs in the worker thread. A timeout that ends at the
+    tool call's deadline is raised as DeadlineExceededError.
+    """
+    breaker = get_circuit_breaker(path)
+    attempts = 0
+
+    def attempt() -> requests.Response:
+        nonlocal attempts
+        attempts += 1
+        if breaker is not None:
+            breaker.before_call()
+        try:
+            if _rate_admitted.get():
+                _rate_admitted.set(False)
+            else:
+                get_rate_limiter().wait(path)
+        except BaseException:
+            # A half-open breaker must not stay reserved for a probe that was never sent
+            if breaker is not None:
+                breaker.release()
+            raise
+        if breaker is None:
+            return _post(path, url, payload)
+
+        start = time.monotonic()
+        try:
+            response = _post(path, url, payload)
+        except (requests.ConnectionError, requests.Timeout):
+            breaker.record(True, time.monotonic() - start)
+            raise
+        except BaseException:
+            breaker.release()
+            raise
+        breaker.record(response.status_code >= 500, time.monotonic() - start)
+        return response
+
+    try:
+        if path not in IDEMPOTENT_ENDPOINTS:
+            return attempt()
+        return RetryPolicy.from_env().call(attempt)
+    except requests.Timeout as e:
+        remaining = deadline_remaining()
+        if remaining is not None and remaining <= 0:
+            raise DeadlineExceededError(
+                f"Tool call deadline exceeded while waiting for DevRev API endpoint '{path}'") from e
+        raise
+    finally:
+        if attempts > 1:
+            metrics.get_metrics().count_retries(path, attempts - 1)
+
+
+# Incremented by every mutation so that an object read which was in flight
+# while an object changed does not store its possibly stale response.
+_object_writes = 0
+_object_writes_lock = threading.Lock()
+
+# API keys with entries in the object cache. A mutation made with one key
+# drops the object's entries of every key.
+_object_api_keys: set = set()
+
+
+def _object_ids(path: str, response: requests.Response) -> list:
+    """Return the id and display_id of the object in a read endpoint's response body."""
+    try:
+        body = decode_response(response)
+    except ValueError:
+        return []
+    item = body.get(OBJECT_READ_ENDPOINTS[path]) if isinstance(body, dict) else None
+    if not isinstance(item, dict):
+        return []
+    return [item[name] for name in ("id", "display_id") if isinstance(item.get(name), str)]
+
+
+def _store_object(path: str, ref: str, response: requests.Response) -> None:
+    """Cache an object response under the ID it was requested by and under each of its own IDs."""
+    if response.status_code != 200:
+        response = copy.copy(response)
+        response.status_code = 200
+    objects = cache.get_cache("objects")
+    ttl = _env_float("DEVREV_MCP_OBJECT_CACHE_TTL", DEFAULT_OBJECT_CACHE_TTL)
+    api_key = get_api_key()
+    _object_api_keys.add(api_key)
+    for id in dict.fromkeys([ref, *_object_ids(path, response)]):
+        objects.set((api_key, path, id), response, ttl=ttl)
+
+
+def _invalidate_object(path: str, ref: Any) -> None:
+    """Drop every cache entry of the object with the given ID, under every API key."""
+    if not isinstance(ref, str):
+        return
+    objects = cache.get_cache("objects")
+    for api_key in list(_object_api_keys):
+        cached = objects.get((api_key, path, ref))
+        objects.pop((api_key, path, ref))
+        if cached is not None:
+            for id in _object_ids(path, cached):
+                objects.pop((api_key, path, id))
+
+
+def _write_through(path: str, payload: Dict[str, Any], response: Optional[requests.Response]) -> None:
+    """
+    Keep the object cache correct after a mutation.
+
+    A successful create or update whose response carries the object refreshes
+    the object's entries; otherwise, including when the request raised and
+    response is None, the entries of every object the request may have
+    changed are dropped.
+    """
+    global _object_writes
+    with _object_writes_lock:
+        _object_writes += 1
+
+    read_path = OBJECT_WRITE_ENDPOINTS.get(path)
+    if read_path is not None:
+        _invalidate_object(read_path, payload.get("id"))
+        if response is not None and response.status_code in (200, 201):
+            ids = _object_ids(read_path, response)
+            if ids:
+                _invalidate_object(read_path, ids[0])
+                _store_object(read_path, ids[0], response)
+    elif path == "timeline-entries.create":
+        for read_path in OBJECT_READ_ENDPOINTS:
+            _invalidate_object(read_path, payload.get("object"))
+
+
+# Set while refreshing cached data, so that reads skip the on-disk cache.
+_refreshing: contextvars.ContextVar[bool] = contextvars.ContextVar("devrev_refreshing", default=False)
+
+
+@contextmanager
+def refreshing() -> Iterator[None]:
+    """Within this block, reads bypass the on-disk cache but still store their responses in it."""
+    token = _refreshing.set(True)
+    try:
+        yield
+    finally:
+        _refreshing.reset(token)
+
+
+def _fetch(path: str, url: str, payload: Dict[str, Any]) -> requests.Response:
+    """
+    Send a read request, going through the on-disk cache for the endpoints it keeps.
+
+    Bodies found on disk are returned as 200 responses without touching the
+    network, unless refreshing; successful responses of those endpoints are
+    written to disk.
+    """
+    store = disk_cache.get_disk_cache()
+    ttl = disk_cache.endpoint_ttl(path) if store is not None else 0
+    if not ttl:
+        return _send(path, url, payload)
+
+    key = disk_cache.cache_key(get_api_key() or "", path, payload)
+    body = None if _refreshing.get() else store.get(key)
+    if body is not None:
+        metrics.get_metrics().count_cache_hit(path)
+        response = requests.Response()
+        response.status_code = 200
+        response._content = body
+        response.headers["Content-Type"] = "application/json"
+        response.encoding = "utf-8"
+        response.url = url
+        return response
+
+    response = _send(path, url, payload)
+    if response.status_code == 200:
+        store.set(key, path, response.content, ttl)
+    return response
+
+
+def _request_object(path: str, url: str, payload: Dict[str, Any]) -> requests.Response:
+    """Serve an object read from the object cache, fetching and caching it on a miss."""
+    ref = payload["id"]
+    response = cache.get_cache("objects").get((get_api_key(), path, ref))
+    if response is not None:
+        metrics.get_metrics().count_cache_hit(path)
+        return response
+
+    writes = _object_writes
+    response = _single_flight.do(_cache_key(path, payload), lambda: _fetch(path, url, payload))
+    if response.status_code == 200 and writes == _object_writes:
+        _store_object(path, ref, response)
+    return response
+
+
+def _request(path: str, payload: Dict[str, Any]) -> requests.Response:
+    """
+    POST to an API path.
+
+    Cacheable endpoints are served from the response cache and single-object
+    reads from the object cache, which mutations keep up to date. Reads of
+    slowly changing data can also be served from the optional on-disk cache.
+    Identical concurrent requests to read-only endpoints share one upstream
+    call, and idempotent endpoints are retried on transient failures.
+    """
+    url = f"{API_BASE_URL}/{path}"
+    if path not in READ_ONLY_ENDPOINTS:
+        try:
+            response = _send(path, url, payload)
+        except BaseException:
+            _write_through(path, payload, None)
+            raise
+        _write_through(path, payload, response)
+        return response
+
+    if path in OBJECT_READ_ENDPOINTS and isinstance(payload.get("id"), str) and len(payload) == 1:
+        return _request_object(path, url, payload)
+
+    key = _cache_key(path, payload)
+    if path not in CACHEABLE_ENDPOINTS:
+        return _single_flight.do(key, lambda: _fetch(path, url, payload))
+
+    responses = cache.get_cache("responses")
+    response = responses.get(key)
+    if response is None:
+        response = _single_flight.do(key, lambda: _fetch(path, url, payload))
+        if response.status_code == 200:
+            responses.set(key, response)
+    else:
+        metrics.get_metrics().count_cache_hit(path)
+    return response
+
+
+def _will_send(path: str, payload: Dict[str, Any]) -> bool:
+    """
+    Return whether a request is expected to reach the DevRev API.
+
+    Reads that the object, response or on-disk cache can answer, and reads
+    that would join an identical request in flight, are not. The caches are
+    only peeked at, so no hit or miss is counted.
+    """
+    if path not in READ_ONLY_ENDPOINTS:
+        return True
+    key = _cache_key(path, payload)
+    if key in _single_flight:
+        return False
+    if path in OBJECT_READ_ENDPOINTS and isinstance(payload.get("id"), str) and len(payload) == 1:
+        if (get_api_key(), path, payload["id"]) in cache.get_cache("objects"):
+            return False
+    elif path in CACHEABLE_ENDPOINTS and key in cache.get_cache("responses"):
+        return False
+    store = disk_cache.get_disk_cache()
+    if store is None or _refreshing.get() or not disk_cache.endpoint_ttl(path):
+        return True
+    return disk_cache.cache_key(get_api_key() or "", path, payload) not in store
+
+
+def _observed_request(path: str, payload: Dict[str, Any]) -> requests.Response:
+    """Make a request with _request and record its latency and outcome in the endpoint's metrics."""
+    start = time.perf_counter()
+    try:
+        response = _request(path, payload)
+    except BaseException:
+        metrics.get_metrics().observe_request(path, time.perf_counter() - start, True)
+        raise
+    metrics.get_metrics().observe_request(path, time.perf_counter() - start, response.status_code >= 400)
+    return response
 
 
 def make_devrev_request(endpoint: str, payload: Dict[str, Any]) -> requests.Response:
@@ -54,19 +868,7 @@ def make_devrev_request(endpoint: str, payload: Dict[str, Any]) -> requests.Resp
 
         return DummyResponse()
 
-    api_key = os.environ.get("DEVREV_API_KEY")
-    if not api_key:
-        raise ValueError("DEVREV_API_KEY environment variable is not set")
-
-    headers = {
-        "Authorization": f"{api_key}",
-        "Content-Type": "application/json",
-    }
-    return requests.post(
-        f"https://api.devrev.ai/{endpoint}",
-        headers=headers,
-        json=payload
-    )
+    return _observed_request(endpoint, payload)
 
 
 def make_internal_devrev_request(endpoint: str, payload: Dict[str, Any]) -> requests.Response:
@@ -109,16 +911,62 @@ def make_internal_devrev_request(endpoint: str, payload: Dict[str, Any]) -> requ
 
         return DummyResponse()
 
-    api_key = os.environ.get("DEVREV_API_KEY")
-    if not api_key:
-        raise ValueError("DEVREV_API_KEY environment variable is not set")
+    return _observed_request(f"internal/{endpoint}", payload)
 
-    headers = {
-        "Authorization": f"{api_key}",
-        "Content-Type": "application/json",
-    }
-    return requests.post(
-        f"https://api.devrev.ai/internal/{endpoint}",
-        headers=headers,
-        json=payload
-    )
+
+async def _run_request(path: str, request: Callable[..., requests.Response], endpoint: str, payload: Dict[str, Any]) -> requests.Response:
+    """
+    Run a blocking request helper on the shared executor.
+
+    A request that will reach the API first waits for its rate limit token
+    on the event loop, so a throttled request does not hold a worker thread.
+    Reads answered from the object, response or on-disk cache, and reads
+    coalesced into an identical one in flight, take no token.
+
+    Raises:
+        DeadlineExceededError: If the tool call's deadline has passed
+    """
+    check_deadline()
+    admitted = os.environ.get("MCP_TEST_MODE") != "1" and _will_send(path, payload)
+    if admitted:
+        await get_rate_limiter().acquire(path)
+    token = _rate_admitted.set(admitted)
+    try:
+        context = contextvars.copy_context()
+    finally:
+        _rate_admitted.reset(token)
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_get_executor(), context.run, request, endpoint, payload)
+
+
+async def make_devrev_request_async(endpoint: str, payload: Dict[str, Any]) -> requests.Response:
+    """
+    Make an authenticated request to the DevRev API without blocking the event loop.
+
+    The blocking request runs on the shared bounded executor, so concurrent
+    tool calls overlap instead of serializing on the asyncio loop. The
+    caller's context, including its tool call deadline, is carried over,
+    and rate limiting waits happen on the loop rather than in a worker.
+
+    Args:
+        endpoint: The API endpoint path (e.g., "works.get" or "search.hybrid")
+        payload: The JSON payload to send
+
+    Returns:
+        requests.Response object
+    """
+    return await _run_request(endpoint, make_devrev_request, endpoint, payload)
+
+
+async def make_internal_devrev_request_async(endpoint: str, payload: Dict[str, Any]) -> requests.Response:
+    """
+    Make an authenticated request to the internal DevRev API without blocking the event loop.
+
+    Args:
+        endpoint: The API endpoint path (e.g., "vistas.get")
+        payload: The JSON payload to send
+
+    Returns:
+        requests.Response object
+    """
+    return await _run_request(f"internal/{endpoint}", make_internal_devrev_request, endpoint, payload)
@@ -0,0 +1,197 @@
+"""
+Copyright (c) 2025 DevRev, Inc.
+SPDX-License-Identifier: MIT
+
+This module provides the pre-fork mode of the HTTP transport: a supervisor that
+runs several worker processes accepting connections on one listening socket.
+
+Workers serve the transport statelessly, since consecutive requests of one
+client may reach different workers. They share the on-disk response cache, and
+each worker periodically writes a snapshot of its counters to a state
+directory, from which get_diagnostics reports the totals over all workers.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import shutil
+import signal
+import socket
+import tempfile
+import time
+from typing import Any, Dict, Iterable, List, Optional
+
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_PREFIX = "worker-"
+
+# A worker that exits sooner than this after starting is not restarted.
+MIN_WORKER_LIFETIME = 1.0
+
+
+def worker_dir() -> Optional[str]:
+    """Return the state directory shared by the workers, or None outside of pre-fork mode."""
+    return os.environ.get("DEVREV_MCP_WORKER_DIR") or None
+
+
+def write_snapshot(worker_id: int, snapshot: Dict[str, Any]) -> None:
+    """Atomically replace this worker's snapshot in the state directory."""
+    directory = worker_dir()
+    if directory is None:
+        return
+    path = os.path.join(directory, f"{SNAPSHOT_PREFIX}{worker_id}.json")
+    try:
+        with open(f"{path}.tmp", "w") as f:
+            json.dump(snapshot, f)
+        os.replace(f"{path}.tmp", path)
+    except OSError as e:
+        logger.warning("Could not write the snapshot of worker %s: %s", worker_id, e)
+
+
+def read_snapshots() -> Dict[str, Dict[str, Any]]:
+    """Return the latest snapshot of every worker, keyed by worker name."""
+    directory = worker_dir()
+    if directory is None:
+        return {}
+    snapshots = {}
+    for name in sorted(os.listdir(directory)):
+        if not (name.startswith(SNAPSHOT_PREFIX) and name.endswith(".json")):
+            continue
+        try:
+            with open(os.path.join(directory, name)) as f:
+                snapshots[name[:-len(".json")]] = json.load(f)
+        except (OSError, ValueError):
+            continue
+    return snapshots
+
+
+def aggregate(snapshots: Iterable[Any]) -> Any:
+    """
+    Merge worker snapshots key by key.
+
+    Numbers are summed, dicts are merged recursively, values that every
+    worker agrees on are kept, and differing values are listed per worker.
+    """
+    values = list(snapshots)
+    if values and all(isinstance(v, (int, float)) and not isinstance(v, bool) for v in values):
+        return sum(values)
+    if values and all(isinstance(v, dict) for v in values):
+        keys = dict.fromkeys(key for v in values for key in v)
+        return {key: aggregate([v[key] for v in values if key in v]) for key in keys}
+    if all(v == values[0] for v in values[1:]):
+        return values[0] if values else None
+    return values
+
+
+def totals(snapshots: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
+    """Return the counters of all workers combined, without the per-process fields."""
+    return aggregate({k: v for k, v in snapshot.items() if k not in ("pid", "updated")} for snapshot in snapshots)
+
+
+def _bind(host: str, port: int) -> socket.socket:
+    """Open the listening socket the workers share."""
+    family = socket.AF_INET6 if ":" in host else socket.AF_INET
+    sock = socket.socket(family, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind((host, port))
+    sock.listen(2048)
+    sock.set_inheritable(True)
+    return sock
+
+
+def _run_worker(worker_id: int, sock: socket.socket, host: str, drain_seconds: Optional[float]) -> None:
+    """Serve the HTTP transport in a forked worker process; never returns."""
+    code = 0
+    try:
+        # Signals reach workers only through the supervisor, once per signal
+        os.setpgid(0, 0)
+        signal.signal(signal.SIGINT, signal.SIG_DFL)
+        signal.signal(signal.SIGTERM, signal.SIG_DFL)
+        from .http_server import serve_http
+        asyncio.run(serve_http(host=host, sockets=[sock], stateless=True, worker_id=worker_id,
+                               drain_seconds=drain_seconds))
+    except BaseException:
+        logger.exception("Worker %s failed", worker_id)
+        code = 1
+    finally:
+        os._exit(code)
+
+
+def serve_workers(workers: int, host: Optional[str] = None, port: Optional[int] = None,
+                  drain_seconds: Optional[float] = None) -> None:
+    """
+    Run the HTTP transport in workers pre-forked processes until SIGTERM or SIGINT.
+
+    The supervisor forwards each signal to every worker, so the first one
+    drains the workers and a second one stops them at once. Workers that exit
+    on their own are replaced. Unless configured otherwise, the workers share
+    an on-disk response cache in a temporary state directory, and the object
+    cache is turned off, since a worker cannot invalidate the copies other
+    workers hold after a mutation.
+
+    Raises:
+        RuntimeError: If the platform cannot fork processes
+    """
+    if not hasattr(os, "fork"):
+        raise RuntimeError("Running several workers requires a platform with os.fork")
+    from .http_server import DEFAULT_HOST, DEFAULT_PORT
+
+    host = host or os.environ.get("DEVREV_MCP_HTTP_HOST", DEFAULT_HOST)
+    port = port if port is not None else int(os.environ.get("DEVREV_MCP_HTTP_PORT", DEFAULT_PORT))
+    state_dir = tempfile.mkdtemp(prefix="devrev-mcp-")
+    environ = {name: os.environ.get(name) for name in (
+        "DEVREV_MCP_WORKER_DIR", "DEVREV_MCP_DISK_CACHE_DIR", "DEVREV_MCP_OBJECT_CACHE_TTL")}
+    os.environ["DEVREV_MCP_WORKER_DIR"] = state_dir
+    os.environ.setdefault("DEVREV_MCP_DISK_CACHE_DIR", os.path.join(state_dir, "cache"))
+    os.environ.setdefault("DEVREV_MCP_OBJECT_CACHE_TTL", "0")
+
+    sock = _bind(host, port)
+    children: Dict[int, tuple] = {}
+    stopping: List[int] = []
+
+    def spawn(worker_id: int) -> None:
+        pid = os.fork()
+        if pid == 0:
+            _run_worker(worker_id, sock, host, drain_seconds)
+        children[pid] = (worker_id, time.monotonic())
+
+    def forward(sig: int, frame: Any) -> None:
+        stopping.append(sig)
+        for pid in list(children):
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+
+    previous = {sig: signal.signal(sig, forward) for sig in (signal.SIGINT, signal.SIGTERM)}
+    try:
+        for worker_id in range(max(workers, 1)):
+            spawn(worker_id)
+        logger.info("Serving %d workers on http://%s:%d", len(children), host, sock.getsockname()[1])
+        while children:
+            try:
+                pid, status = os.waitpid(-1, 0)
+            except ChildProcessError:
+                break
+            worker_id, started = children.pop(pid, (None, 0.0))
+            if worker_id is None or stopping:
+                continue
+            if time.monotonic() - started < MIN_WORKER_LIFETIME:
+                logger.error("Worker %d exited right after starting; stopping", worker_id)
+                forward(signal.SIGTERM, None)
+            else:
+                logger.warning("Worker %d exited with status %d; restarting it", worker_id, status)
+                spawn(worker_id)
+        logger.info("Worker totals: %s", json.dumps(totals(read_snapshots().values())))
+    finally:
+        for sig, handler in previous.items():
+            signal.signal(sig, handler)
+        sock.close()
+        shutil.rmtree(state_dir, ignore_errors=True)
+        for name, value in environ.items():
+            if value is None:
+                os.environ.pop(name, None)
+            else:
+                os.environ[name] = value
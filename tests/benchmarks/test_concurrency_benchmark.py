@@ -0,0 +1,43 @@
+import asyncio
+import time
+
+import pytest
+from devrev_mcp import resilience, server
+
+
+DELAY = 0.3
+CONCURRENT_CALLS = 8
+
+
+@pytest.mark.asyncio
+async def test_concurrent_get_work_wall_time(stub_api):
+    """Compare the wall time of concurrent get_work calls with serializing them."""
+    stub_api.delay = DELAY
+    stub_api.default = (200, {"work": {"id": "work_1"}}, {})
+
+    start = time.perf_counter()
+    await asyncio.gather(*[
+        server.handle_call_tool(name="get_work", arguments={"id": f"work_{i}"})
+        for i in range(CONCURRENT_CALLS)
+    ])
+    elapsed = time.perf_counter() - start
+
+    print(f"\n{CONCURRENT_CALLS} concurrent get_work calls: {elapsed:.3f} s, "
+          f"serialized would take {CONCURRENT_CALLS * DELAY:.3f} s")
+    assert stub_api.peak_in_flight > 1
+
+
+@pytest.mark.asyncio
+async def test_rate_limited_get_works_wall_time(stub_api, monkeypatch):
+    """Report how long a per-endpoint rate limit spreads a get_works burst."""
+    monkeypatch.setenv("DEVREV_RATE_LIMIT_ENDPOINTS", "works.get=20:1")
+    stub_api.default = (200, {"work": {"id": "w"}}, {})
+
+    start = time.monotonic()
+    await server.handle_call_tool("get_works", {"ids": [f"work_{i}" for i in range(5)]})
+    elapsed = time.monotonic() - start
+
+    stats = resilience.rate_limit_stats()["works.get"]
+    print(f"\nget_works of 5 ids at 20/s: {elapsed:.3f} s, "
+          f"{stats['throttled']} requests throttled for {stats['throttled_seconds']:.3f} s")
+    assert stats["throttled"] == 4
@@ -0,0 +1,46 @@
+import asyncio
+import time
+
+import mcp.types as types
+from devrev_mcp import server
+
+
+ITERATIONS = 2000
+
+
+def _per_call_us(func):
+    """Return the mean cost of func over ITERATIONS calls, in microseconds."""
+    start = time.perf_counter()
+    for _ in range(ITERATIONS):
+        func()
+    return (time.perf_counter() - start) / ITERATIONS * 1e6
+
+
+def test_dispatch_lookup_overhead():
+    """Compare the registry lookup with a linear scan like the former if/elif chain."""
+    names = [tool.name for tool in server.TOOLS]
+    last = names[-1]
+
+    def linear_scan():
+        for name in names:
+            if name == last:
+                return name
+
+    before = _per_call_us(linear_scan)
+    after = _per_call_us(lambda: server.TOOL_HANDLERS.get(last))
+    print(f"\ndispatch of '{last}': linear scan {before:.3f} us, registry lookup {after:.3f} us")
+    assert server.TOOL_HANDLERS[last] is server.handle_get_diagnostics
+
+
+def test_list_tools_overhead():
+    """Compare serving the prebuilt tool list with rebuilding every types.Tool."""
+    schemas = [tool.model_dump() for tool in server.TOOLS]
+    loop = asyncio.new_event_loop()
+    try:
+        before = _per_call_us(lambda: [types.Tool(**schema) for schema in schemas])
+        after = _per_call_us(lambda: loop.run_until_complete(server.handle_list_tools()))
+        tools = loop.run_until_complete(server.handle_list_tools())
+    finally:
+        loop.close()
+    print(f"\ntools/list: rebuild {before:.1f} us, prebuilt {after:.1f} us")
+    assert [tool.name for tool in tools] == [schema["name"] for schema in schemas]
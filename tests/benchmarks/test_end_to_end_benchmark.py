@@ -0,0 +1,64 @@
+import asyncio
+import json
+import subprocess
+import sys
+import time
+
+import pytest
+from devrev_mcp.fake_api import FakeDataset, FakeDevRevAPI
+from devrev_mcp.loadgen import _peak_rss_kb, format_summary, run_load
+
+
+@pytest.fixture
+def api():
+    dataset = FakeDataset(works=200, parts=10)
+    with FakeDevRevAPI(dataset) as api:
+        yield api
+
+
+def test_closed_loop_load(api, tmp_path):
+    """Drive the server over stdio with concurrent clients and write the results as JSON."""
+    results = asyncio.run(run_load(
+        api_url=api.url, dataset=api.dataset, concurrency=4, requests=200))
+
+    print("\n" + format_summary(results))
+    (tmp_path / "results.json").write_text(json.dumps(results))
+    assert results["requests"] == 200
+    assert results["errors"] == 0
+    latency = results["latency_ms"]
+    assert 0 < latency["p50"] <= latency["p95"] <= latency["p99"] <= latency["max"]
+    assert results["throughput_rps"] > 0
+    assert results["server"]["cpu_user_s"] > 0
+    assert results["server"]["max_rss_kb"] > 0
+    assert sum(tool["requests"] for tool in results["per_tool"].values()) == 200
+    assert api.requests["works.get"] > 0
+
+
+def test_open_loop_load(api):
+    """Send requests at a fixed arrival rate."""
+    results = asyncio.run(run_load(
+        api_url=api.url, dataset=api.dataset, rate=50, requests=50, mix="get_work=1,search=1"))
+
+    print("\n" + format_summary(results))
+    assert results["config"]["mode"] == "rate"
+    assert results["requests"] == 50
+    assert results["errors"] == 0
+    assert results["elapsed_s"] >= 49 / 50
+
+
+def test_peak_rss_is_per_process():
+    """Check that the reported peak RSS is the measured process tree's own, not that of earlier children."""
+    def peak(script):
+        child = subprocess.Popen([sys.executable, "-c", script + "; import time; time.sleep(30)"])
+        try:
+            time.sleep(1.0)
+            return _peak_rss_kb(child.pid)
+        finally:
+            child.kill()
+            child.wait()
+
+    large = peak("data = bytearray(200 * 1024 * 1024); data[::4096] = b'x' * len(data[::4096])")
+    small = peak("pass")
+    print(f"\npeak rss: large child {large} KiB, small child {small} KiB")
+    assert large > 200 * 1024
+    assert small < 100 * 1024
@@ -0,0 +1,79 @@
+import json
+import time
+
+import requests
+from devrev_mcp import formatting
+
+
+ITERATIONS = 50
+
+
+def _works_page(items=100):
+    """Build a works.list page with the nesting of real DevRev work items."""
+    user = {"id": "don:identity:dvrv-us-1:devo/0:devu/1", "display_id": "DEVU-1",
+            "display_name": "Jane Doe", "email": "jane@example.com", "state": "active"}
+    works = [{
+        "id": f"don:core:dvrv-us-1:devo/0:issue/{i}",
+        "display_id": f"ISS-{i}",
+        "type": "issue",
+        "title": f"Work item {i}",
+        "body": "Steps to reproduce\n1. Open the page\n2. Click save",
+        "created_by": user,
+        "owned_by": [user, user],
+        "stage": {"name": "triage", "stage": {"id": "don:core:stage/1"}},
+        "applies_to_part": {"id": "don:core:enhancement/1", "name": "Billing", "type": "enhancement"},
+        "tags": [],
+        "custom_fields": {"tnt__severity": "high", "tnt__escalated": False, "tnt__score": None},
+        "created_date": "2025-06-03T00:00:00Z",
+        "modified_date": "2025-06-04T00:00:00Z",
+    } for i in range(items)]
+    return {"works": works, "next_cursor": "abc", "prev_cursor": None}
+
+
+def _measure(monkeypatch, response, mode):
+    """Return (bytes, microseconds) of formatting the page in an output mode."""
+    monkeypatch.setenv("DEVREV_MCP_OUTPUT", mode)
+    start = time.perf_counter()
+    for _ in range(ITERATIONS):
+        text = f"Works listed successfully: {formatting.format_response(response)}"
+    elapsed = (time.perf_counter() - start) / ITERATIONS * 1e6
+    return len(text.encode()), elapsed
+
+
+def test_list_works_page_formatting(monkeypatch):
+    """Compare bytes and CPU per list_works page across output modes and JSON backends."""
+    response = requests.Response()
+    response.status_code = 200
+    response._content = json.dumps(_works_page(), separators=(",", ":")).encode()
+    response.encoding = "utf-8"
+
+    results = {"repr": _measure(monkeypatch, response, "repr"), "raw": _measure(monkeypatch, response, "raw")}
+    monkeypatch.setenv("DEVREV_MCP_JSON_BACKEND", "json")
+    results["json (stdlib)"] = _measure(monkeypatch, response, "json")
+    if formatting.orjson is not None:
+        monkeypatch.setenv("DEVREV_MCP_JSON_BACKEND", "orjson")
+        results["json (orjson)"] = _measure(monkeypatch, response, "json")
+
+    print("\nlist_works page (100 items):")
+    for mode, (size, elapsed) in results.items():
+        print(f"  {mode:14} {size:7} bytes {elapsed:9.1f} us")
+    assert results["raw"][0] < results["repr"][0]
+
+
+def test_list_works_page_projection(monkeypatch):
+    """Measure bytes and CPU of a projected list_works page."""
+    monkeypatch.delenv("DEVREV_MCP_OUTPUT", raising=False)
+    response = requests.Response()
+    response.status_code = 200
+    response._content = json.dumps(_works_page(), separators=(",", ":")).encode()
+    response.encoding = "utf-8"
+    fields = ["display_id", "title", "stage.name", "owned_by[].display_name"]
+
+    start = time.perf_counter()
+    for _ in range(ITERATIONS):
+        text = formatting.format_response(response, fields, "works")
+    elapsed = (time.perf_counter() - start) / ITERATIONS * 1e6
+
+    print(f"\nlist_works page (100 items) projected to {len(fields)} fields: "
+          f"{len(text.encode())} bytes {elapsed:.1f} us")
+    assert len(text) < len(response.text) / 4
@@ -0,0 +1,32 @@
+import statistics
+import time
+
+import requests
+from devrev_mcp import utils
+
+
+CALLS = 200
+
+
+def _per_call_latency(call):
+    """Return the median latency of CALLS invocations of call, in milliseconds."""
+    samples = []
+    for _ in range(CALLS):
+        start = time.perf_counter()
+        response = call()
+        samples.append((time.perf_counter() - start) * 1000)
+        assert response.status_code == 200
+    return statistics.median(samples)
+
+
+def test_pooled_session_latency(stub_api):
+    """Compare per-call latency of bare requests.post against the pooled session."""
+    url = f"{stub_api.url}/works.list"
+    headers = {"Authorization": "test-api-key", "Content-Type": "application/json"}
+    payload = {"type": ["issue"]}
+
+    before = _per_call_latency(lambda: requests.post(url, headers=headers, json=payload))
+    after = _per_call_latency(lambda: utils.make_devrev_request("works.list", payload))
+
+    print(f"\nworks.list per-call latency: bare requests.post {before:.3f} ms, "
+          f"pooled session {after:.3f} ms ({before / after:.1f}x)")
@@ -0,0 +1,59 @@
+import asyncio
+import time
+import tracemalloc
+
+import mcp.types as types
+from devrev_mcp import server
+
+
+ITERATIONS = 200
+
+
+def _respond(result):
+    """Serialize a result the way the MCP session and stdio transport do."""
+    response = types.JSONRPCResponse(
+        jsonrpc="2.0",
+        id=1,
+        result=result.model_dump(by_alias=True, mode="json", exclude_none=True),
+    )
+    return types.JSONRPCMessage(response).model_dump_json(by_alias=True, exclude_none=True)
+
+
+def _measure(loop, handler):
+    """Return (microseconds, peak bytes allocated) per tools/list round."""
+    request = types.ListToolsRequest(method="tools/list")
+
+    start = time.perf_counter()
+    for _ in range(ITERATIONS):
+        _respond(loop.run_until_complete(handler(request)))
+    elapsed = (time.perf_counter() - start) / ITERATIONS * 1e6
+
+    tracemalloc.start()
+    try:
+        tracemalloc.reset_peak()
+        base = tracemalloc.get_traced_memory()[0]
+        _respond(loop.run_until_complete(handler(request)))
+        peak = tracemalloc.get_traced_memory()[1] - base
+    finally:
+        tracemalloc.stop()
+    return elapsed, peak
+
+
+def test_list_tools_allocations():
+    """Compare rebuilding the tools/list result per call with the memoized result."""
+    schemas = [tool.model_dump() for tool in server.TOOLS]
+
+    async def rebuild(request):
+        tools = [types.Tool(**schema) for schema in schemas]
+        return types.ServerResult(types.ListToolsResult(tools=tools))
+
+    loop = asyncio.new_event_loop()
+    try:
+        before_us, before_bytes = _measure(loop, rebuild)
+        after_us, after_bytes = _measure(loop, server.server.request_handlers[types.ListToolsRequest])
+    finally:
+        loop.close()
+
+    print(f"\ntools/list per call: rebuilt {before_us:.0f} us / {before_bytes} B peak, "
+          f"memoized {after_us:.0f} us / {after_bytes} B peak")
+    assert after_bytes < before_bytes
@@ -0,0 +1,41 @@
+import asyncio
+import time
+
+from devrev_mcp import metrics, server
+
+
+ITERATIONS = 2000
+
+
+def _per_call_us(func):
+    """Return the mean cost of func over ITERATIONS calls, in microseconds."""
+    start = time.perf_counter()
+    for _ in range(ITERATIONS):
+        func()
+    return (time.perf_counter() - start) / ITERATIONS * 1e6
+
+
+def test_recording_overhead(fake_api):
+    """Compare what a tool call records in metrics with a cached tool call's own latency."""
+    recorder = metrics.Metrics()
+
+    def record():
+        # A tool call making one API request that reached the API
+        recorder.observe_upstream("works.get", 20, 2000)
+        recorder.observe_request("works.get", 0.01, False)
+        recorder.observe_tool("get_work", 0.012, False, 2500)
+
+    overhead = _per_call_us(record)
+
+    work = next(iter(fake_api.dataset.works.values()))
+    loop = asyncio.new_event_loop()
+    try:
+        call = lambda: loop.run_until_complete(server.handle_call_tool("get_work", {"id": work["display_id"]}))
+        call()
+        cached = _per_call_us(call)
+    finally:
+        loop.close()
+
+    print(f"\nmetrics per tool call {overhead:.2f} us, cached get_work call {cached:.1f} us "
+          f"({overhead / cached:.1%})")
+    assert metrics.get_metrics().snapshot()["tools"]["get_work"]["calls"] == ITERATIONS + 1
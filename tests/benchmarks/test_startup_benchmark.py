@@ -0,0 +1,60 @@
+import asyncio
+import os
+import statistics
+import subprocess
+import sys
+
+from devrev_mcp.loadgen import DEFAULT_COMMAND, StdioClient
+
+
+LAUNCHES = 3
+
+# Modules that are only needed once a tool is called.
+DEFERRED = ("requests", "urllib3", "sqlite3")
+
+
+def _import_times(statement):
+    """Return {module: cumulative microseconds} reported by python -X importtime for statement."""
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", statement],
+                            capture_output=True, text=True, check=True)
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative_us, module = line.split("|")
+        times[module.strip()] = int(cumulative_us)
+    return times
+
+
+def _time_to_initialize(command):
+    """Return the median milliseconds from launching command to its initialize response."""
+    env = dict(os.environ, DEVREV_API_KEY="test-api-key")
+    env.pop("MCP_TEST_MODE", None)
+
+    async def launch():
+        client = StdioClient(command, env)
+        try:
+            return await client.start()
+        finally:
+            await client.stop()
+
+    return statistics.median(asyncio.run(launch()) for _ in range(LAUNCHES)) * 1000
+
+
+def test_import_time_breakdown():
+    """Report the heaviest imports of the server module and check the HTTP client and SQLite stay deferred."""
+    times = _import_times("import devrev_mcp.server")
+    heaviest = sorted(times.items(), key=lambda item: item[1], reverse=True)[:10]
+    print("\nimport devrev_mcp.server, cumulative ms:")
+    for module, us in heaviest:
+        print(f"  {us / 1000:8.1f}  {module}")
+    assert not [module for module in DEFERRED if module in times]
+
+
+def test_time_to_first_response():
+    """Compare time to the initialize response with and without the deferred imports."""
+    eager = _time_to_initialize(
+        [sys.executable, "-c", "import requests, sqlite3, devrev_mcp; devrev_mcp.main()"])
+    lazy = _time_to_initialize(DEFAULT_COMMAND)
+    print(f"\ntime to initialize response: eager imports {eager:.0f} ms, deferred imports {lazy:.0f} ms")
+    assert lazy > 0
@@ -0,0 +1,30 @@
+import asyncio
+import os
+
+import pytest
+from devrev_mcp.fake_api import FakeDataset, FakeDevRevAPI
+from devrev_mcp.loadgen import format_summary, run_load
+
+
+@pytest.fixture
+def api():
+    dataset = FakeDataset(works=200, parts=10)
+    with FakeDevRevAPI(dataset) as api:
+        yield api
+
+
+def test_worker_scaling(api):
+    """Compare HTTP throughput with one and two pre-forked workers under the same load."""
+    throughput = {}
+    for workers in (1, 2):
+        results = asyncio.run(run_load(
+            api_url=api.url, dataset=api.dataset, concurrency=16, requests=300,
+            transport="http", workers=workers))
+        print(f"\n{workers} worker(s):\n" + format_summary(results))
+        assert results["errors"] == 0
+        assert results["requests"] == 300
+        throughput[workers] = results["throughput_rps"]
+
+    print(f"\nthroughput: {throughput}, speedup {throughput[2] / throughput[1]:.2f}x on {os.cpu_count()} CPU(s)")
+    assert results["server"]["worker_requests"] is not None
+    assert len(results["server"]["worker_requests"]) == 2
@@ -0,0 +1,142 @@
+import json
+import threading
+import time
+from collections import defaultdict, deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+from devrev_mcp import cache, disk_cache, metrics, resilience, server, utils
+from devrev_mcp.fake_api import FakeDataset, FakeDevRevAPI
+
+
+class StubDevRevAPI:
+    """
+    A minimal local HTTP server standing in for the DevRev API.
+
+    Every POST returns the next scripted response for its endpoint, or the
+    default response when nothing is scripted. A fixed delay can be injected
+    to simulate a slow upstream, and peak_in_flight records how many requests
+    were ever being handled at the same time.
+    """
+
+    def __init__(self):
+        self.delay = 0.0
+        self.default = (200, {"result": "ok"}, {})
+        self.requests = []
+        self.connections = set()
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self._scripted = defaultdict(deque)
+        self._lock = threading.Lock()
+        self._httpd = ThreadingHTTPServer(("127.0.0.1", 0), _StubHandler)
+        self._httpd.daemon_threads = True
+        self._httpd.stub = self
+        self._thread = threading.Thread(
+            target=self._httpd.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True)
+
+    @property
+    def url(self):
+        host, port = self._httpd.server_address
+        return f"http://{host}:{port}"
+
+    def script(self, endpoint, *responses):
+        """Queue (status, body[, headers]) responses for an endpoint."""
+        with self._lock:
+            for response in responses:
+                status, body, *rest = response
+                self._scripted[endpoint].append((status, body, rest[0] if rest else {}))
+
+    def calls(self, endpoint):
+        """Return the payloads received for an endpoint."""
+        with self._lock:
+            return [payload for path, payload in self.requests if path == endpoint]
+
+    def _next(self, endpoint, payload, peer):
+        with self._lock:
+            self.requests.append((endpoint, payload))
+            self.connections.add(peer)
+            self.in_flight += 1
+            self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+            if self._scripted[endpoint]:
+                return self._scripted[endpoint].popleft()
+        return self.default
+
+    def _done(self):
+        with self._lock:
+            self.in_flight -= 1
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        raw = self.rfile.read(length) if length else b""
+        payload = json.loads(raw) if raw else {}
+        stub = self.server.stub
+        status, body, headers = stub._next(self.path.lstrip("/"), payload, self.client_address)
+        try:
+            if stub.delay:
+                time.sleep(stub.delay)
+            data = json.dumps(body).encode()
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            for key, value in headers.items():
+                self.send_header(key, str(value))
+            self.end_headers()
+            self.wfile.write(data)
+        finally:
+            stub._done()
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def stub_api(monkeypatch):
+    """Run a local stub DevRev API and point the request helpers at it."""
+    monkeypatch.setenv("DEVREV_API_KEY", "test-api-key")
+    stub = StubDevRevAPI().start()
+    monkeypatch.setattr(utils, "API_BASE_URL", stub.url)
+    utils.close_session()
+    yield stub
+    utils.close_session()
+    stub.stop()
+
+
+@pytest.fixture
+def fake_api(monkeypatch):
+    """Run the bundled fake DevRev API on a small dataset and point the request helpers at it."""
+    monkeypatch.setenv("DEVREV_API_KEY", "test-api-key")
+    api = FakeDevRevAPI(FakeDataset(works=250, parts=10)).start()
+    monkeypatch.setattr(utils, "API_BASE_URL", api.url)
+    utils.close_session()
+    yield api
+    utils.close_session()
+    api.stop()
+
+
+@pytest.fixture(autouse=True)
+def clear_server_caches():
+    """Start every test with empty server-side caches, a fresh rate limiter, closed circuit breakers and no metrics."""
+    cache.reset_configuration()
+    disk_cache.reset_configuration()
+    resilience.reset_rate_limiter()
+    utils.reset_circuit_breakers()
+    server.clear_caches()
+    metrics.reset_metrics()
+    yield
+    cache.reset_configuration()
+    disk_cache.reset_configuration()
+    resilience.reset_rate_limiter()
+    utils.reset_circuit_breakers()
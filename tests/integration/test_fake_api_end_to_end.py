@@ -0,0 +1,49 @@
+import json
+import os
+import subprocess
+import sys
+
+from devrev_mcp.fake_api import FakeDataset, FakeDevRevAPI
+
+
+def send(proc, message):
+    proc.stdin.write(json.dumps(message) + "\n")
+    proc.stdin.flush()
+
+
+def receive(proc, id):
+    """Read JSON-RPC messages until the response with the given id."""
+    while True:
+        line = proc.stdout.readline()
+        assert line, proc.stderr.read()
+        message = json.loads(line)
+        if message.get("id") == id:
+            return message
+
+
+def test_stdio_server_against_fake_api():
+    """Test a real tools/call over stdio through the full request path to the fake API."""
+    with FakeDevRevAPI(FakeDataset(works=20, parts=2)) as api:
+        env = dict(os.environ, DEVREV_API_KEY="test-api-key", DEVREV_API_BASE_URL=api.url)
+        env.pop("MCP_TEST_MODE", None)
+        proc = subprocess.Popen(
+            [sys.executable, "-c", "import devrev_mcp; devrev_mcp.main()"],
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.PIPE, env=env, text=True)
+        try:
+            send(proc, {"jsonrpc": "2.0", "id": 1, "method": "initialize", "params": {
+                "protocolVersion": "2024-11-05", "capabilities": {},
+                "clientInfo": {"name": "test", "version": "1.0"}}})
+            assert receive(proc, 1)["result"]["serverInfo"]["name"] == "devrev_mcp"
+            send(proc, {"jsonrpc": "2.0", "method": "notifications/initialized"})
+
+            work = next(iter(api.dataset.works.values()))
+            send(proc, {"jsonrpc": "2.0", "id": 2, "method": "tools/call",
+                        "params": {"name": "get_work", "arguments": {"id": work["display_id"]}}})
+            result = receive(proc, 2)["result"]
+            assert not result.get("isError")
+            assert work["title"] in result["content"][0]["text"]
+            assert api.requests["works.get"] == 1
+        finally:
+            proc.stdin.close()
+            proc.terminate()
+            proc.wait(timeout=5)
@@ -0,0 +1,101 @@
+import pytest
+from devrev_mcp import cache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+def test_ttl_cache_hit_and_miss(clock):
+    """Test that stored values are returned and counted as hits."""
+    c = cache.TTLCache(maxsize=2, ttl=10, clock=clock)
+    assert c.get("a") is None
+    c.set("a", 1)
+    assert c.get("a") == 1
+    assert c.stats() == {"hits": 1, "misses": 1, "evictions": 0, "expirations": 0, "size": 1}
+
+
+def test_ttl_cache_membership_is_not_counted(clock):
+    """Test that checking for an entry neither counts a hit or miss nor sees expired entries."""
+    c = cache.TTLCache(maxsize=2, ttl=10, clock=clock)
+    c.set("a", 1)
+    assert "a" in c
+    assert "b" not in c
+    clock.now = 10
+    assert "a" not in c
+    assert c.stats() == {"hits": 0, "misses": 0, "evictions": 0, "expirations": 0, "size": 1}
+
+
+def test_ttl_cache_expires_entries(clock):
+    """Test that entries are dropped once their TTL has passed."""
+    c = cache.TTLCache(maxsize=2, ttl=10, clock=clock)
+    c.set("a", 1)
+    c.set("b", 2, ttl=30)
+    clock.now = 10
+    assert c.get("a") is None
+    assert c.get("b") == 2
+    assert c.stats()["expirations"] == 1
+
+
+def test_ttl_cache_evicts_least_recently_used(clock):
+    """Test that the least recently used entry is evicted when full."""
+    c = cache.TTLCache(maxsize=2, ttl=10, clock=clock)
+    c.set("a", 1)
+    c.set("b", 2)
+    c.get("a")
+    c.set("c", 3)
+    assert c.get("b") is None
+    assert c.get("a") == 1
+    assert c.get("c") == 3
+    assert c.stats()["evictions"] == 1
+
+
+def test_ttl_cache_with_zero_size_stores_nothing(clock):
+    """Test that a zero-sized cache acts as a disabled cache."""
+    c = cache.TTLCache(maxsize=0, ttl=10, clock=clock)
+    c.set("a", 1)
+    assert c.get("a") is None
+    assert len(c) == 0
+
+
+def test_get_cache_reads_environment(monkeypatch):
+    """Test that cache settings are read from the environment."""
+    monkeypatch.setenv("DEVREV_MCP_CACHE_TTL", "42")
+    monkeypatch.setenv("DEVREV_MCP_CACHE_MAXSIZE", "7")
+    cache.reset_configuration()
+    c = cache.get_cache("test")
+    assert c.ttl == 42
+    assert c.maxsize == 7
+    assert cache.get_cache("test") is c
+
+
+def test_cache_disabled_by_environment(monkeypatch):
+    """Test that DEVREV_MCP_CACHE=0 turns every cache off."""
+    monkeypatch.setenv("DEVREV_MCP_CACHE", "0")
+    cache.reset_configuration()
+    assert cache.get_cache("test").maxsize == 0
+
+
+def test_configure_overrides_environment(monkeypatch):
+    """Test that configure() takes precedence over the environment."""
+    monkeypatch.setenv("DEVREV_MCP_CACHE_TTL", "42")
+    cache.configure(enabled=False, ttl=5)
+    c = cache.get_cache("test")
+    assert c.maxsize == 0
+    assert c.ttl == 5
+
+
+def test_cache_stats_reports_every_cache():
+    """Test that cache_stats() returns counters keyed by cache name."""
+    cache.get_cache("one").get("missing")
+    stats = cache.cache_stats()
+    assert stats["one"]["misses"] == 1
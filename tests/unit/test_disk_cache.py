@@ -0,0 +1,163 @@
+import multiprocessing
+import sqlite3
+
+import pytest
+from devrev_mcp import cache, disk_cache, resilience, server, utils
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_cache_key_separates_api_keys_and_payloads():
+    """Test that keys depend on the API key, endpoint and canonical payload without exposing the API key."""
+    key = disk_cache.cache_key("secret", "schemas.subtypes.list", {"a": 1, "b": 2})
+    assert key == disk_cache.cache_key("secret", "schemas.subtypes.list", {"b": 2, "a": 1})
+    assert key != disk_cache.cache_key("other", "schemas.subtypes.list", {"a": 1, "b": 2})
+    assert key != disk_cache.cache_key("secret", "schemas.subtypes.list", {"a": 1})
+    assert "secret" not in key
+
+
+def test_disk_cache_ttl_and_persistence(tmp_path):
+    """Test that entries survive reopening the database and expire after their TTL."""
+    clock = FakeClock()
+    store = disk_cache.DiskCache(str(tmp_path), clock=clock)
+    store.set("k", "schemas.subtypes.list", b'{"subtypes":[]}', ttl=60)
+    store.close()
+
+    reopened = disk_cache.DiskCache(str(tmp_path), clock=clock)
+    assert "k" in reopened
+    assert reopened.get("k") == b'{"subtypes":[]}'
+    clock.now += 61
+    assert "k" not in reopened
+    assert reopened.get("k") is None
+    assert reopened.stats()["hits"] == 1
+    assert reopened.stats()["misses"] == 1
+    mode = sqlite3.connect(reopened.path).execute("PRAGMA journal_mode").fetchone()[0]
+    assert mode == "wal"
+
+
+def test_disk_cache_evicts_least_recently_used(tmp_path):
+    """Test that the size cap evicts the least recently used entries first."""
+    clock = FakeClock()
+    store = disk_cache.DiskCache(str(tmp_path), max_bytes=25, clock=clock)
+    for key in ("a", "b"):
+        clock.now += 1
+        store.set(key, "e", b"x" * 10, ttl=60)
+    clock.now += 1
+    store.get("a")
+    clock.now += 1
+    store.set("c", "e", b"x" * 10, ttl=60)
+
+    assert store.get("b") is None
+    assert store.get("a") is not None
+    assert store.get("c") is not None
+    assert store.stats()["evictions"] == 1
+    assert store.stats()["bytes"] == 20
+
+
+def test_endpoint_ttl(monkeypatch):
+    """Test default and overridden per-endpoint lifetimes."""
+    assert disk_cache.endpoint_ttl("schemas.subtypes.list") == 3600
+    assert disk_cache.endpoint_ttl("works.get") == 0
+    monkeypatch.setenv("DEVREV_MCP_DISK_CACHE_TTLS", "schemas.subtypes.list=10, works.list=5,dev-users.self=0")
+    assert disk_cache.endpoint_ttl("schemas.subtypes.list") == 10
+    assert disk_cache.endpoint_ttl("works.list") == 5
+    assert disk_cache.endpoint_ttl("dev-users.self") == 0
+
+
+def _write_entries(directory, worker):
+    store = disk_cache.DiskCache(directory)
+    for i in range(50):
+        store.set(f"{worker}-{i}", "e", b"body", ttl=60)
+    store.close()
+
+
+def test_disk_cache_is_shared_by_processes(tmp_path):
+    """Test that concurrent processes can write to one cache directory."""
+    context = multiprocessing.get_context("spawn")
+    processes = [context.Process(target=_write_entries, args=(str(tmp_path), worker)) for worker in range(2)]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join(30)
+        assert process.exitcode == 0
+
+    store = disk_cache.DiskCache(str(tmp_path))
+    assert store.stats()["size"] == 100
+    assert store.stats()["errors"] == 0
+
+
+@pytest.mark.asyncio
+async def test_list_subtypes_served_from_disk_after_restart(stub_api, tmp_path, monkeypatch):
+    """Test that a response stored by one server session is reused by the next one."""
+    monkeypatch.setenv("DEVREV_MCP_DISK_CACHE_DIR", str(tmp_path))
+    stub_api.script("schemas.subtypes.list", (200, {"subtypes": [{"value": "bug"}]}))
+
+    first = await server.handle_call_tool("list_subtypes", {"leaf_type": "issue"})
+    # Simulate a new server process: drop every in-memory cache and reopen the database.
+    server.clear_caches()
+    disk_cache.close_disk_cache()
+    second = await server.handle_call_tool("list_subtypes", {"leaf_type": "issue"})
+
+    assert first[0].text == second[0].text
+    assert len(stub_api.calls("schemas.subtypes.list")) == 1
+    assert disk_cache.disk_cache_stats()["hits"] == 1
+
+
+def test_disk_cache_respects_api_key_and_cache_switch(stub_api, tmp_path, monkeypatch):
+    """Test that another API key misses the cache and --no-cache bypasses it."""
+    disk_cache.configure(directory=str(tmp_path))
+    stub_api.default = (200, {"subtypes": []}, {})
+
+    utils.make_devrev_request("schemas.subtypes.list", {"leaf_type": "issue"})
+    monkeypatch.setenv("DEVREV_API_KEY", "another-key")
+    utils.make_devrev_request("schemas.subtypes.list", {"leaf_type": "issue"})
+    cache.configure(enabled=False)
+    utils.make_devrev_request("schemas.subtypes.list", {"leaf_type": "issue"})
+
+    assert len(stub_api.calls("schemas.subtypes.list")) == 3
+
+
+def test_disk_cache_does_not_store_errors(stub_api, tmp_path):
+    """Test that failed responses are not written to disk."""
+    disk_cache.configure(directory=str(tmp_path))
+    stub_api.script("schemas.subtypes.list", (500, {"message": "down"}))
+
+    assert utils.make_devrev_request("schemas.subtypes.list", {}).status_code == 500
+    assert utils.make_devrev_request("schemas.subtypes.list", {}).status_code == 200
+    assert len(stub_api.calls("schemas.subtypes.list")) == 2
+
+
+def test_disk_cache_that_cannot_be_opened_is_off(stub_api, tmp_path, caplog):
+    """Test that an unusable cache directory is logged once and requests still reach the API."""
+    blocker = tmp_path / "file"
+    blocker.write_text("")
+    disk_cache.configure(directory=str(blocker / "cache"))
+    stub_api.default = (200, {"subtypes": []}, {})
+
+    for _ in range(2):
+        assert utils.make_devrev_request("schemas.subtypes.list", {}).status_code == 200
+
+    assert disk_cache.get_disk_cache() is None
+    assert len(stub_api.calls("schemas.subtypes.list")) == 2
+    assert len([r for r in caplog.records if "on-disk cache" in r.getMessage()]) == 1
+
+
+@pytest.mark.asyncio
+async def test_disk_cache_hits_take_no_rate_limit_token(stub_api, tmp_path, monkeypatch):
+    """Test that responses served from disk do not wait for the rate limiter."""
+    monkeypatch.setenv("DEVREV_RATE_LIMIT", "1")
+    monkeypatch.setenv("DEVREV_RATE_LIMIT_BURST", "1")
+    disk_cache.configure(directory=str(tmp_path))
+    stub_api.default = (200, {"user": {"id": "u"}}, {})
+
+    for _ in range(4):
+        await utils.make_devrev_request_async("dev-users.self", {})
+
+    assert len(stub_api.calls("dev-users.self")) == 1
+    assert resilience.rate_limit_stats() == {}
@@ -0,0 +1,110 @@
+import json
+
+import pytest
+import requests
+from devrev_mcp import server, utils
+from devrev_mcp.fake_api import FakeDataset, FakeDevRevAPI
+
+
+def text_json(result):
+    return json.loads(result[0].text.split("\n", 1)[1])
+
+
+def test_dataset_is_deterministic():
+    """Test that a seed always produces the same dataset."""
+    first = FakeDataset(works=20, parts=3, seed=7)
+    second = FakeDataset(works=20, parts=3, seed=7)
+    assert list(first.works.values()) == list(second.works.values())
+    assert len(first.works) == 20
+    assert len(first.parts) == 4
+
+
+@pytest.mark.asyncio
+async def test_work_lifecycle_against_fake_api(fake_api):
+    """Test create, get, update and list of work items through the tools."""
+    created = await server.handle_call_tool(
+        "create_work", {"type": "issue", "title": "Checkout fails", "applies_to_part": ["ENH-1"], "owned_by": ["me"]})
+    assert "Object created successfully" in created[0].text
+
+    work = text_json(await server.handle_call_tool("get_work", {"id": "ISS-251"}))["work"]
+    assert work["title"] == "Checkout fails"
+    assert work["owned_by"] == [{"id": fake_api.dataset.users[0]["id"]}]
+
+    await server.handle_call_tool("update_work", {"id": "ISS-251", "type": "issue", "stage": "queued"})
+    work = text_json(await server.handle_call_tool("get_work", {"id": "ISS-251"}))["work"]
+    assert work["stage"]["name"] == "queued"
+
+    transitions = await server.handle_call_tool("valid_stage_transition", {"type": "issue", "id": "ISS-251"})
+    assert "in_development" in transitions[0].text
+
+
+@pytest.mark.asyncio
+async def test_update_part_stage_against_fake_api(fake_api):
+    """Test that update_part moves a part to the stage with the ID it sends."""
+    stage = fake_api.dataset.stages[2]
+    result = await server.handle_call_tool(
+        "update_part", {"id": "ENH-1", "type": "enhancement", "stage": stage["stage"]["id"]})
+    assert "updated successfully" in result[0].text
+
+    part = text_json(await server.handle_call_tool("get_part", {"id": "ENH-1"}))["part"]
+    assert part["stage_v2"] == {"name": stage["name"], "stage": stage["stage"]}
+
+
+@pytest.mark.asyncio
+async def test_list_works_pages_through_fake_api(fake_api):
+    """Test that all_pages follows the fake API's cursors over the whole dataset."""
+    result = await server.handle_call_tool(
+        "list_works", {"type": ["issue", "ticket"], "all_pages": True, "max_items": 1000, "fields": ["display_id"]})
+    body = json.loads(result[0].text.split(": ", 1)[1])
+    assert len(body["works"]) == 250
+    assert "next_cursor" not in body
+    assert fake_api.requests["works.list"] == 3
+
+
+@pytest.mark.asyncio
+async def test_read_endpoints_of_fake_api(fake_api):
+    """Test the read-only endpoints used by the tools."""
+    assert "Search results" in (await server.handle_call_tool("search", {"query": "login", "namespace": "issue"}))[0].text
+    assert "ENH-1" in (await server.handle_call_tool("get_part", {"id": "ENH-1"}))[0].text
+    assert "parts" in (await server.handle_call_tool("list_parts", {"type": "enhancement"}))[0].text
+    assert "Sprint 1" in (await server.handle_call_tool("get_sprints", {"ancestor_part_id": "PROD-1"}))[0].text
+    assert "bug" in (await server.handle_call_tool("list_subtypes", {"leaf_type": "issue"}))[0].text
+    assert "meetings" in (await server.handle_call_tool("list_meetings", {}))[0].text
+    assert "Sprint 1" in (await server.handle_call_tool("get_vista", {"id": "vista_1"}))[0].text
+    first = next(iter(fake_api.dataset.works.values()))
+    entry = await server.handle_call_tool("add_timeline_entry", {"id": first["id"], "timeline_entry": "note"})
+    assert "Timeline entry created successfully" in entry[0].text
+
+
+def test_fake_api_responses_are_detached_from_the_dataset():
+    """Test that a response body is encoded under the dataset lock, not read after later updates."""
+    api = FakeDevRevAPI(FakeDataset(works=5, parts=1))
+    status, data = api.respond("works.get", {"id": "ISS-2"}, "key")
+    api.handle("works.update", {"id": "ISS-2", "title": "Changed"}, "key")
+
+    assert status == 200
+    assert json.loads(data)["work"]["title"] != "Changed"
+    assert api.handle("works.get", {"id": "ISS-2"}, "key")[1]["work"]["title"] == "Changed"
+
+
+def test_fake_api_injects_errors_and_latency():
+    """Test the injected failure rate, latency and authentication check."""
+    with FakeDevRevAPI(FakeDataset(works=5, parts=1), error_rate=1.0, error_status=502, latency=0.05) as api:
+        response = requests.post(f"{api.url}/works.get", json={"id": "ISS-1"}, headers={"Authorization": "key"})
+        assert response.status_code == 502
+        assert response.elapsed.total_seconds() >= 0.05
+    with FakeDevRevAPI(FakeDataset(works=5, parts=1)) as api:
+        assert requests.post(f"{api.url}/works.get", json={"id": "ISS-1"}).status_code == 401
+        assert requests.post(f"{api.url}/works.get", json={"id": "ISS-99"}, headers={"Authorization": "key"}).status_code == 404
+        assert requests.post(f"{api.url}/nope", json={}, headers={"Authorization": "key"}).status_code == 404
+
+
+def test_api_base_url_from_environment(monkeypatch):
+    """Test that DEVREV_API_BASE_URL selects the API the server talks to."""
+    import importlib
+    monkeypatch.setenv("DEVREV_API_BASE_URL", "http://127.0.0.1:8765/")
+    try:
+        assert importlib.reload(utils).API_BASE_URL == "http://127.0.0.1:8765"
+    finally:
+        monkeypatch.delenv("DEVREV_API_BASE_URL")
+        importlib.reload(utils)
@@ -0,0 +1,90 @@
+import json
+
+import pytest
+import requests
+from devrev_mcp import formatting
+
+
+def make_response(body: bytes) -> requests.Response:
+    response = requests.Response()
+    response.status_code = 200
+    response._content = body
+    response.encoding = "utf-8"
+    return response
+
+
+BODY = b'{"works": [{"id": "work_1", "title": "T\xc3\xa9st", "closed": false, "owner": null}]}'
+
+
+def test_raw_mode_forwards_response_text(monkeypatch):
+    """Test that raw mode returns the body without decoding it."""
+    monkeypatch.delenv("DEVREV_MCP_OUTPUT", raising=False)
+    assert formatting.format_response(make_response(BODY)) == BODY.decode()
+
+
+@pytest.mark.parametrize("backend", ["json", "orjson"])
+def test_json_mode_is_compact(monkeypatch, backend):
+    """Test that json mode re-serializes without whitespace using either backend."""
+    if backend == "orjson":
+        pytest.importorskip("orjson")
+    monkeypatch.setenv("DEVREV_MCP_OUTPUT", "json")
+    monkeypatch.setenv("DEVREV_MCP_JSON_BACKEND", backend)
+    assert formatting.json_backend() == backend
+    text = formatting.format_response(make_response(BODY))
+    assert text == '{"works":[{"id":"work_1","title":"Tést","closed":false,"owner":null}]}'
+
+
+def test_repr_mode_keeps_legacy_output(monkeypatch):
+    """Test that repr mode returns the Python repr of the decoded body."""
+    monkeypatch.setenv("DEVREV_MCP_OUTPUT", "repr")
+    text = formatting.format_response(make_response(BODY))
+    assert text == str(json.loads(BODY))
+    assert formatting.format_value(["a"]) == "['a']"
+
+
+def test_format_value_is_compact_json(monkeypatch):
+    """Test that partial values are emitted as compact JSON."""
+    monkeypatch.delenv("DEVREV_MCP_OUTPUT", raising=False)
+    assert formatting.format_value([{"id": "stage_2"}]) == '[{"id":"stage_2"}]'
+
+
+def test_unknown_output_mode_falls_back_to_raw(monkeypatch):
+    """Test that an invalid DEVREV_MCP_OUTPUT value selects raw mode."""
+    monkeypatch.setenv("DEVREV_MCP_OUTPUT", "yaml")
+    assert formatting.output_mode() == "raw"
+
+
+def test_compile_fields_builds_projection_tree():
+    """Test that dotted paths are merged into one projection tree."""
+    tree = formatting.compile_fields(("display_id", "stage.name", "owned_by[].display_name", "owned_by[].id"))
+    assert tree == {"display_id": None, "stage": {"name": None}, "owned_by": {"display_name": None, "id": None}}
+
+
+def test_compile_fields_whole_value_wins():
+    """Test that selecting a whole value overrides paths below it."""
+    assert formatting.compile_fields(("stage.name", "stage")) == {"stage": None}
+    assert formatting.compile_fields(("stage", "stage.name")) == {"stage": None}
+
+
+def test_project_selects_nested_fields():
+    """Test projection of nested objects and lists, skipping missing keys."""
+    work = {
+        "display_id": "ISS-1",
+        "title": "Title",
+        "stage": {"name": "triage", "stage": {"id": "stage_1"}},
+        "owned_by": [{"display_name": "Jane", "email": "jane@example.com"}, {"id": "devu/2"}],
+    }
+    tree = formatting.compile_fields(("display_id", "stage.name", "owned_by[].display_name", "missing.value"))
+    assert formatting.project(work, tree) == {
+        "display_id": "ISS-1",
+        "stage": {"name": "triage"},
+        "owned_by": [{"display_name": "Jane"}, {}],
+    }
+
+
+def test_format_response_with_fields_keeps_other_keys(monkeypatch):
+    """Test that projection applies under the root key only."""
+    monkeypatch.delenv("DEVREV_MCP_OUTPUT", raising=False)
+    body = b'{"works": [{"id": "work_1", "title": "T"}], "next_cursor": "abc"}'
+    text = formatting.format_response(make_response(body), ["id"], "works")
+    assert json.loads(text) == {"works": [{"id": "work_1"}], "next_cursor": "abc"}
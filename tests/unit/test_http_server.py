@@ -0,0 +1,135 @@
+import asyncio
+import contextlib
+
+import httpx
+import pytest
+from mcp import ClientSession
+from mcp.client.streamable_http import streamable_http_client
+from devrev_mcp.http_server import METRICS_PATH, MCP_PATH, HTTPServer
+
+
+INITIALIZE = {
+    "jsonrpc": "2.0", "id": 1, "method": "initialize",
+    "params": {"protocolVersion": "2025-03-26", "capabilities": {}, "clientInfo": {"name": "test", "version": "1"}},
+}
+HEADERS = {"Accept": "application/json, text/event-stream"}
+
+
+@contextlib.asynccontextmanager
+async def running(**kwargs):
+    """Run an HTTPServer on a free port for the duration of the block."""
+    http_server = HTTPServer(port=0, **kwargs)
+    task = asyncio.create_task(http_server.serve())
+    while not http_server.started:
+        await asyncio.sleep(0.01)
+    try:
+        yield http_server, f"http://127.0.0.1:{http_server.port}{MCP_PATH}"
+    finally:
+        http_server.should_exit = True
+        await asyncio.wait_for(task, 10)
+
+
+@contextlib.asynccontextmanager
+async def session(url, api_key=None):
+    """Open an initialized MCP client session, authenticating with api_key if given."""
+    headers = {"Authorization": f"Bearer {api_key}"} if api_key else {}
+    async with httpx.AsyncClient(headers=headers, timeout=30) as client:
+        async with streamable_http_client(url, http_client=client) as (read, write, _):
+            async with ClientSession(read, write) as client_session:
+                await client_session.initialize()
+                yield client_session
+
+
+@pytest.mark.asyncio
+async def test_sessions_use_their_own_api_keys(fake_api):
+    """Test that each session's requests carry its API key and that sessions share one process."""
+    work = next(iter(fake_api.dataset.works.values()))
+    async with running() as (_, url):
+        async with session(url, "key-a") as a, session(url, "key-b") as b:
+            results = await asyncio.gather(
+                a.call_tool("get_work", {"id": work["display_id"]}),
+                b.call_tool("get_work", {"id": work["display_id"]}),
+            )
+            again = await a.call_tool("get_work", {"id": work["display_id"]})
+
+    for result in [*results, again]:
+        assert not result.isError
+        assert work["title"] in result.content[0].text
+    assert set(fake_api.api_keys) == {"key-a", "key-b"}
+    # Each key fetched the work once; the repeated call was served from key-a's cache entry
+    assert fake_api.requests["works.get"] == 2
+
+
+@pytest.mark.asyncio
+async def test_sessions_without_api_key_use_environment(fake_api):
+    """Test that a session without a bearer token falls back to DEVREV_API_KEY."""
+    async with running() as (_, url):
+        async with session(url) as client_session:
+            result = await client_session.call_tool("get_current_user", {})
+    assert not result.isError
+    assert set(fake_api.api_keys) == {"test-api-key"}
+
+
+@pytest.mark.asyncio
+async def test_missing_api_key_is_rejected(monkeypatch):
+    """Test that requests are refused when neither the client nor the environment provides a key."""
+    monkeypatch.delenv("DEVREV_API_KEY", raising=False)
+    async with running() as (_, url):
+        async with httpx.AsyncClient() as client:
+            response = await client.post(url, json=INITIALIZE, headers=HEADERS)
+    assert response.status_code == 401
+
+
+@pytest.mark.asyncio
+async def test_max_sessions(fake_api):
+    """Test that new sessions are refused once max_sessions are open."""
+    async with running(max_sessions=1) as (_, url):
+        async with session(url, "key-a"):
+            async with httpx.AsyncClient() as client:
+                response = await client.post(url, json=INITIALIZE, headers={**HEADERS, "Authorization": "Bearer key-b"})
+    assert response.status_code == 503
+
+
+@pytest.mark.asyncio
+async def test_drain_finishes_inflight_requests(fake_api):
+    """Test that draining refuses new requests but lets the request in flight complete."""
+    fake_api.latency = 0.5
+    work = next(iter(fake_api.dataset.works.values()))
+    http_server = HTTPServer(port=0, drain_seconds=10)
+    serve = asyncio.create_task(http_server.serve())
+    while not http_server.started:
+        await asyncio.sleep(0.01)
+    url = f"http://127.0.0.1:{http_server.port}{MCP_PATH}"
+
+    async with session(url, "key-a") as client_session:
+        # The client validates results against the tool list; fetch it before draining
+        await client_session.list_tools()
+        call = asyncio.create_task(client_session.call_tool("get_work", {"id": work["display_id"]}))
+        while "works.get" not in fake_api.requests:
+            await asyncio.sleep(0.01)
+        http_server.drain()
+
+        async with httpx.AsyncClient() as client:
+            refused = await client.post(url, json=INITIALIZE, headers={**HEADERS, "Authorization": "Bearer key-b"})
+        result = await call
+
+    await asyncio.wait_for(serve, 10)
+    assert refused.status_code == 503
+    assert not result.isError
+    assert work["title"] in result.content[0].text
+
+
+@pytest.mark.asyncio
+async def test_metrics_endpoint(fake_api):
+    """Test that tool and endpoint metrics are served in the Prometheus text format."""
+    work = next(iter(fake_api.dataset.works.values()))
+    async with running() as (http_server, url):
+        async with session(url, "key-a") as client_session:
+            await client_session.call_tool("get_work", {"id": work["display_id"]})
+        async with httpx.AsyncClient() as client:
+            response = await client.get(f"http://127.0.0.1:{http_server.port}{METRICS_PATH}")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    assert 'devrev_mcp_tool_calls_total{tool="get_work"} 1' in response.text
+    assert 'devrev_mcp_api_requests_total{endpoint="works.get"} 1' in response.text
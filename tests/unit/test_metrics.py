@@ -0,0 +1,118 @@
+import pytest
+from devrev_mcp import metrics, server
+
+
+def test_render_histogram_and_counters():
+    """Test the Prometheus text of a tool call and an API request."""
+    recorder = metrics.Metrics()
+    recorder.observe_tool("get_work", 0.02, False, 120)
+    recorder.observe_tool("get_work", 3.0, True)
+    recorder.observe_request("works.get", 0.001, False)
+    recorder.count_cache_hit("works.get")
+
+    text = metrics.render(recorder.snapshot())
+    assert "# TYPE devrev_mcp_tool_duration_seconds histogram" in text
+    assert 'devrev_mcp_tool_calls_total{tool="get_work"} 2' in text
+    assert 'devrev_mcp_tool_errors_total{tool="get_work"} 1' in text
+    assert 'devrev_mcp_tool_response_bytes_total{tool="get_work"} 120' in text
+    assert 'devrev_mcp_tool_duration_seconds_bucket{tool="get_work",le="0.01"} 0' in text
+    assert 'devrev_mcp_tool_duration_seconds_bucket{tool="get_work",le="0.025"} 1' in text
+    assert 'devrev_mcp_tool_duration_seconds_bucket{tool="get_work",le="2.5"} 1' in text
+    assert 'devrev_mcp_tool_duration_seconds_bucket{tool="get_work",le="5.0"} 2' in text
+    assert 'devrev_mcp_tool_duration_seconds_bucket{tool="get_work",le="+Inf"} 2' in text
+    assert 'devrev_mcp_tool_duration_seconds_count{tool="get_work"} 2' in text
+    assert 'devrev_mcp_api_cache_hits_total{endpoint="works.get"} 1' in text
+    assert text.endswith("\n")
+
+
+def test_label_values_are_escaped():
+    """Test that quotes, backslashes and newlines in label values are escaped."""
+    recorder = metrics.Metrics()
+    recorder.observe_request('a"b\\c\nd', 0.1, False)
+    assert 'endpoint="a\\"b\\\\c\\nd"' in metrics.render(recorder.snapshot())
+
+
+@pytest.mark.asyncio
+async def test_tool_calls_record_metrics(fake_api):
+    """Test that tool calls record their own and their API requests' counts, sizes and cache hits."""
+    work = next(iter(fake_api.dataset.works.values()))
+    for _ in range(2):
+        await server.handle_call_tool("get_work", {"id": work["display_id"]})
+
+    snapshot = metrics.get_metrics().snapshot()
+    tool = snapshot["tools"]["get_work"]
+    assert tool["calls"] == 2
+    assert tool["errors"] == 0
+    assert tool["response_bytes"] > 0
+    assert tool["duration_seconds"]["count"] == 2
+    endpoint = snapshot["endpoints"]["works.get"]
+    assert endpoint["requests"] == 2
+    assert endpoint["cache_hits"] == 1
+    assert endpoint["errors"] == 0
+    assert endpoint["retries"] == 0
+    assert endpoint["request_bytes"] > 0
+    assert endpoint["response_bytes"] > 0
+
+
+@pytest.mark.asyncio
+async def test_failed_requests_record_errors_and_retries(fake_api, monkeypatch):
+    """Test that a request failing after retries counts its retries and an error."""
+    monkeypatch.setenv("DEVREV_RETRY_BACKOFF_BASE", "0")
+    fake_api.error_rate = 1.0
+    fake_api.error_status = 503
+    work = next(iter(fake_api.dataset.works.values()))
+    result = await server.handle_call_tool("get_work", {"id": work["display_id"]})
+
+    assert "503" in result[0].text
+    endpoint = metrics.get_metrics().snapshot()["endpoints"]["works.get"]
+    assert endpoint["requests"] == 1
+    assert endpoint["errors"] == 1
+    assert endpoint["retries"] == 2
+
+
+@pytest.mark.asyncio
+async def test_failed_tool_calls_record_errors():
+    """Test that a tool call raising an error is counted as failed."""
+    with pytest.raises(ValueError):
+        await server.handle_call_tool("get_work", {})
+    tool = metrics.get_metrics().snapshot()["tools"]["get_work"]
+    assert tool["calls"] == 1
+    assert tool["errors"] == 1
+
+
+def test_dump(tmp_path, capsys):
+    """Test that metrics are written to a file, to stderr for "-", and nowhere when unset."""
+    metrics.get_metrics().observe_tool("get_work", 0.1, False)
+    path = tmp_path / "metrics.prom"
+    metrics.dump(str(path))
+    metrics.dump("-")
+    metrics.dump(None)
+
+    assert 'devrev_mcp_tool_calls_total{tool="get_work"} 1' in path.read_text()
+    assert capsys.readouterr().err == path.read_text()
+
+
+@pytest.mark.asyncio
+async def test_server_cache_hits_are_recorded(fake_api):
+    """Test that hits on the current user memo and the stale-while-revalidate cache are counted."""
+    for _ in range(3):
+        await server.handle_call_tool("get_current_user", {})
+        await server.handle_call_tool("list_subtypes", {"leaf_type": "issue"})
+
+    endpoints = metrics.get_metrics().snapshot()["endpoints"]
+    for endpoint in ("dev-users.self", "schemas.subtypes.list"):
+        assert endpoints[endpoint]["requests"] == 3
+        assert endpoints[endpoint]["cache_hits"] == 2
+        assert fake_api.requests[endpoint] == 1
+
+
+@pytest.mark.asyncio
+async def test_stage_diagram_cache_hits_are_recorded(fake_api):
+    """Test that a cached stage diagram counts as a hit of both requests it saves."""
+    work = next(iter(fake_api.dataset.works.values()))
+    for _ in range(2):
+        await server.handle_call_tool("valid_stage_transition", {"type": work["type"], "id": work["display_id"]})
+
+    endpoints = metrics.get_metrics().snapshot()["endpoints"]
+    assert endpoints["schemas.aggregated.get"]["cache_hits"] == 1
+    assert endpoints["stage-diagrams.get"]["cache_hits"] == 1
@@ -0,0 +1,168 @@
+import time
+
+import pytest
+import requests
+from devrev_mcp import resilience
+
+
+class FakeResponse:
+    def __init__(self, status_code, retry_after=None):
+        self.status_code = status_code
+        self.headers = {"Retry-After": retry_after} if retry_after is not None else {}
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    """Record retry delays instead of sleeping."""
+    delays = []
+    monkeypatch.setattr(resilience, "_sleep", delays.append)
+    return delays
+
+
+def scripted(*outcomes):
+    """Return a send() that yields the given responses or raises the given errors in order."""
+    outcomes = list(outcomes)
+
+    def send():
+        outcome = outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+    return send
+
+
+def test_retry_policy_retries_transient_statuses(sleeps):
+    """Test that 503 and 429 responses are retried until success."""
+    policy = resilience.RetryPolicy(max_attempts=3, backoff_base=0.1, backoff_max=1)
+    response = policy.call(scripted(FakeResponse(503), FakeResponse(429), FakeResponse(200)))
+    assert response.status_code == 200
+    assert len(sleeps) == 2
+    assert 0 <= sleeps[0] <= 0.1
+    assert 0 <= sleeps[1] <= 0.2
+
+
+def test_retry_policy_returns_last_response_when_exhausted(sleeps):
+    """Test that the final failing response is returned once attempts run out."""
+    policy = resilience.RetryPolicy(max_attempts=2, backoff_base=0.1)
+    response = policy.call(scripted(FakeResponse(502), FakeResponse(504)))
+    assert response.status_code == 504
+    assert len(sleeps) == 1
+
+
+def test_retry_policy_does_not_retry_other_statuses(sleeps):
+    """Test that non-transient errors are returned immediately."""
+    policy = resilience.RetryPolicy()
+    assert policy.call(scripted(FakeResponse(500))).status_code == 500
+    assert sleeps == []
+
+
+def test_retry_policy_retries_connection_errors(sleeps):
+    """Test that connection errors are retried and re-raised when exhausted."""
+    policy = resilience.RetryPolicy(max_attempts=2, backoff_base=0.1)
+    assert policy.call(scripted(requests.ConnectionError("down"), FakeResponse(200))).status_code == 200
+    with pytest.raises(requests.Timeout):
+        policy.call(scripted(requests.Timeout("slow"), requests.Timeout("slow")))
+
+
+def test_retry_policy_honors_retry_after(sleeps):
+    """Test that Retry-After replaces the computed backoff."""
+    policy = resilience.RetryPolicy(max_attempts=2, backoff_base=0.1, backoff_max=0.2)
+    policy.call(scripted(FakeResponse(429, retry_after="3"), FakeResponse(200)))
+    assert sleeps == [3.0]
+
+
+def test_retry_policy_stops_at_deadline(sleeps):
+    """Test that no retry is made when its delay would overrun the call deadline."""
+    policy = resilience.RetryPolicy(max_attempts=5)
+    with resilience.call_deadline(1):
+        response = policy.call(scripted(FakeResponse(429, retry_after="30")))
+    assert response.status_code == 429
+    assert sleeps == []
+
+
+def test_retry_policy_from_env(monkeypatch):
+    """Test that the retry policy is configured from the environment."""
+    monkeypatch.setenv("DEVREV_RETRY_MAX_ATTEMPTS", "5")
+    monkeypatch.setenv("DEVREV_RETRY_BACKOFF_BASE", "0.25")
+    monkeypatch.setenv("DEVREV_RETRY_BACKOFF_MAX", "2")
+    policy = resilience.RetryPolicy.from_env()
+    assert (policy.max_attempts, policy.backoff_base, policy.backoff_max) == (5, 0.25, 2)
+
+
+def test_parse_retry_after():
+    """Test parsing of Retry-After in seconds and HTTP date form."""
+    assert resilience.parse_retry_after("2") == 2
+    assert resilience.parse_retry_after(None) is None
+    assert resilience.parse_retry_after("soon") is None
+    assert resilience.parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0
+
+
+def test_call_deadline_nests_to_earliest():
+    """Test that a nested deadline never extends the enclosing one."""
+    assert resilience.deadline_remaining() is None
+    with resilience.call_deadline(1):
+        with resilience.call_deadline(10):
+            assert resilience.deadline_remaining() <= 1
+        assert 0 < resilience.deadline_remaining() <= 1
+    assert resilience.deadline_remaining() is None
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_token_bucket_admits_burst_then_spaces_requests():
+    """Test that a bucket grants its burst at once and queues later requests at the refill rate."""
+    clock = FakeClock()
+    bucket = resilience.TokenBucket(rate=2, burst=2, clock=clock)
+    assert [bucket.reserve() for _ in range(4)] == [0, 0, 0.5, 1.0]
+    clock.now = 1.0
+    assert bucket.reserve() == 0.5
+
+
+def test_rate_limiter_from_env(monkeypatch):
+    """Test that global and per-endpoint limits are read from the environment."""
+    monkeypatch.setenv("DEVREV_RATE_LIMIT", "10")
+    monkeypatch.setenv("DEVREV_RATE_LIMIT_ENDPOINTS", "works.list=1, search.hybrid=2:4,bad=x")
+    limiter = resilience.RateLimiter.from_env()
+    assert limiter.reserve("works.list") == 0
+    assert limiter.reserve("works.list") > 0.9
+    assert [limiter.reserve("search.hybrid") for _ in range(4)] == [0, 0, 0, 0]
+    assert limiter.reserve("works.get") == 0
+    assert limiter.stats()["works.list"]["throttled"] == 1
+
+
+def test_rate_limiter_unlimited_by_default():
+    """Test that nothing is throttled without configuration."""
+    limiter = resilience.RateLimiter.from_env()
+    assert all(limiter.reserve("works.list") == 0 for _ in range(100))
+    assert limiter.stats() == {}
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter_acquire_waits_asynchronously():
+    """Test that throttled requests wait on the event loop without blocking it."""
+    import asyncio
+
+    limiter = resilience.RateLimiter(endpoint_rate=20, endpoint_rates={"works.list": (20, 1)})
+    ticks = 0
+
+    async def ticker():
+        nonlocal ticks
+        while True:
+            ticks += 1
+            await asyncio.sleep(0.01)
+
+    task = asyncio.create_task(ticker())
+    start = time.monotonic()
+    await asyncio.gather(*(limiter.acquire("works.list") for _ in range(5)))
+    elapsed = time.monotonic() - start
+    task.cancel()
+
+    assert elapsed >= 0.19
+    assert ticks >= 10
+    assert limiter.stats()["works.list"]["throttled"] == 4
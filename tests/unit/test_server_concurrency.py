@@ -0,0 +1,128 @@
+import asyncio
+
+import pytest
+from devrev_mcp import resilience, server, utils
+
+
+DELAY = 0.3
+CONCURRENT_CALLS = 8
+
+
+@pytest.mark.asyncio
+async def test_concurrent_get_work_calls_overlap(stub_api):
+    """Test that concurrent get_work calls do not serialize on the event loop."""
+    stub_api.delay = DELAY
+    stub_api.default = (200, {"work": {"id": "work_1"}}, {})
+
+    results = await asyncio.gather(*[
+        server.handle_call_tool(name="get_work", arguments={"id": f"work_{i}"})
+        for i in range(CONCURRENT_CALLS)
+    ])
+
+    assert all("Object information for" in result[0].text for result in results)
+    assert len(stub_api.calls("works.get")) == CONCURRENT_CALLS
+    # Serialized calls would never have more than one request in flight
+    assert stub_api.peak_in_flight > 1
+
+
+@pytest.mark.asyncio
+async def test_slow_request_does_not_block_event_loop(stub_api):
+    """Test that the event loop keeps running while a request is in flight."""
+    stub_api.delay = DELAY
+    ticks = 0
+
+    async def ticker():
+        nonlocal ticks
+        while True:
+            await asyncio.sleep(0.01)
+            ticks += 1
+
+    task = asyncio.create_task(ticker())
+    try:
+        await server.handle_call_tool(name="get_work", arguments={"id": "work_1"})
+    finally:
+        task.cancel()
+    assert ticks > 5
+
+
+@pytest.mark.asyncio
+async def test_concurrent_valid_stage_transitions_share_stage_diagram_fetch(stub_api):
+    """Test that concurrent cold lookups of one leaf type fetch its stage diagram once."""
+    stub_api.delay = 0.05
+    work = {"work": {"stage": {"stage": {"id": "stage_1"}}, "type": "issue", "subtype": "subtype_1"}}
+    stub_api.script("works.get", *[(200, work)] * CONCURRENT_CALLS)
+    stub_api.script("schemas.aggregated.get", (200, {"schema": {"stage_diagram_id": {"id": "diagram_1"}}}))
+    stub_api.script("stage-diagrams.get", (200, {"stage_diagram": {"stages": [
+        {"stage": {"id": "stage_1"}, "transitions": ["to_stage_2"]}]}}))
+
+    results = await asyncio.gather(*[
+        server.handle_call_tool(name="valid_stage_transition", arguments={"type": "issue", "id": f"work_{i}"})
+        for i in range(CONCURRENT_CALLS)
+    ])
+
+    assert all("Valid Transitions for" in result[0].text for result in results)
+    assert len(stub_api.calls("schemas.aggregated.get")) == 1
+    assert len(stub_api.calls("stage-diagrams.get")) == 1
+
+
+@pytest.mark.asyncio
+async def test_identical_concurrent_reads_are_coalesced(stub_api):
+    """Test that identical in-flight works.get requests share one upstream call."""
+    stub_api.delay = DELAY
+    before = utils.coalescing_stats()
+
+    results = await asyncio.gather(*[
+        server.handle_call_tool(name="get_work", arguments={"id": "work_1"})
+        for _ in range(CONCURRENT_CALLS)
+    ])
+
+    assert all("Object information for 'work_1'" in result[0].text for result in results)
+    assert len(stub_api.calls("works.get")) == 1
+    assert utils.coalescing_stats()["coalesced"] - before["coalesced"] == CONCURRENT_CALLS - 1
+
+
+@pytest.mark.asyncio
+async def test_concurrent_writes_are_not_coalesced(stub_api):
+    """Test that mutating requests are never coalesced."""
+    stub_api.delay = 0.05
+
+    await asyncio.gather(*[
+        utils.make_devrev_request_async("works.update", {"id": "work_1", "title": "T"})
+        for _ in range(3)
+    ])
+
+    assert len(stub_api.calls("works.update")) == 3
+
+
+@pytest.mark.asyncio
+async def test_rate_limit_spreads_batch_requests(stub_api, monkeypatch):
+    """Test that a per-endpoint rate limit smooths a get_works burst instead of failing it."""
+    monkeypatch.setenv("DEVREV_RATE_LIMIT_ENDPOINTS", "works.get=20:1")
+    stub_api.default = (200, {"work": {"id": "w"}}, {})
+
+    result = await server.handle_call_tool("get_works", {"ids": [f"work_{i}" for i in range(5)]})
+
+    assert "failed" not in result[0].text
+    assert len(stub_api.calls("works.get")) == 5
+    assert resilience.rate_limit_stats()["works.get"]["throttled"] == 4
+
+
+@pytest.mark.asyncio
+async def test_throttled_reads_do_not_hold_worker_threads(stub_api, monkeypatch):
+    """Test that reads waiting for a rate limit token leave the executor free for other requests."""
+    monkeypatch.setenv("DEVREV_HTTP_MAX_WORKERS", "1")
+    monkeypatch.setenv("DEVREV_RATE_LIMIT_ENDPOINTS", "works.get=2:1")
+    stub_api.default = (200, {"work": {"id": "w"}}, {})
+
+    async def list_later():
+        await asyncio.sleep(0.05)
+        await utils.make_devrev_request_async("works.list", {})
+
+    await asyncio.gather(
+        *[utils.make_devrev_request_async("works.get", {"id": f"work_{i}"}) for i in range(3)],
+        list_later(),
+    )
+
+    # A read sleeping in the only worker would have delayed works.list behind it
+    assert [path for path, _ in stub_api.requests] == ["works.get", "works.list", "works.get", "works.get"]
+    assert resilience.rate_limit_stats()["works.get"]["throttled"] == 2
@@ -0,0 +1,100 @@
+import asyncio
+
+import pytest
+from devrev_mcp import cache, disk_cache, server
+
+
+USER = {"dev_user": {"id": "don:identity:dvrv-us-1:devo/1:devu/7", "display_name": "me"}}
+
+
+@pytest.mark.asyncio
+async def test_get_current_user_is_memoized_per_api_key(stub_api, monkeypatch):
+    """Test that dev-users.self is requested once per API key."""
+    stub_api.default = (200, USER, {})
+
+    results = await asyncio.gather(*(server.handle_call_tool("get_current_user", {}) for _ in range(5)))
+    await server.handle_call_tool("get_current_user", {})
+    monkeypatch.setenv("DEVREV_API_KEY", "another-key")
+    await server.handle_call_tool("get_current_user", {})
+
+    assert len({result[0].text for result in results}) == 1
+    assert len(stub_api.calls("dev-users.self")) == 2
+
+
+@pytest.mark.asyncio
+async def test_current_users_are_cached_by_key_hash_in_a_bounded_cache(stub_api, monkeypatch):
+    """Test that the memo holds hashed API keys and evicts beyond the cache size."""
+    monkeypatch.setenv("DEVREV_MCP_CACHE_MAXSIZE", "2")
+    cache.reset_configuration()
+    stub_api.default = (200, USER, {})
+
+    for api_key in ("key-1", "key-2", "key-3"):
+        monkeypatch.setenv("DEVREV_API_KEY", api_key)
+        await server.handle_call_tool("get_current_user", {})
+
+    users = cache.get_cache("current_users")
+    assert disk_cache.cache_key("key-3", "dev-users.self", {}) in users
+    assert "key-3" not in users
+    assert users.stats()["size"] == 2
+    assert users.stats()["evictions"] == 1
+
+
+@pytest.mark.asyncio
+async def test_get_current_user_failure_is_not_memoized(stub_api):
+    """Test that a failed lookup is retried on the next call."""
+    stub_api.script("dev-users.self", (401, {"message": "unauthorized"}))
+    stub_api.default = (200, USER, {})
+
+    first = await server.handle_call_tool("get_current_user", {})
+    second = await server.handle_call_tool("get_current_user", {})
+
+    assert "status 401" in first[0].text
+    assert "Current DevRev user details" in second[0].text
+    assert len(stub_api.calls("dev-users.self")) == 2
+
+
+@pytest.mark.asyncio
+async def test_get_current_user_not_memoized_without_cache(stub_api):
+    """Test that disabling caching also disables the memo."""
+    cache.configure(enabled=False)
+    stub_api.default = (200, USER, {})
+
+    await server.handle_call_tool("get_current_user", {})
+    await server.handle_call_tool("get_current_user", {})
+
+    assert len(stub_api.calls("dev-users.self")) == 2
+
+
+@pytest.mark.asyncio
+async def test_me_is_resolved_locally(stub_api):
+    """Test that "me" in owned_by and created_by becomes the current user's ID."""
+    stub_api.script("dev-users.self", (200, USER))
+    stub_api.default = (200, {"works": []}, {})
+    await server.prefetch_current_user()
+
+    await server.handle_call_tool("list_works", {"type": ["issue"], "owned_by": ["me"], "created_by": ["Me", "devu/2"]})
+    await server.handle_call_tool("update_work", {"id": "ISS-1", "type": "issue", "owned_by": ["me"]})
+
+    user_id = USER["dev_user"]["id"]
+    works_list = stub_api.calls("works.list")[0]
+    assert works_list["owned_by"] == [user_id]
+    assert works_list["created_by"] == [user_id, "devu/2"]
+    assert stub_api.calls("works.update")[0]["owned_by"] == [user_id]
+    assert len(stub_api.calls("dev-users.self")) == 1
+
+
+@pytest.mark.asyncio
+async def test_me_resolution_failure_is_reported(stub_api):
+    """Test that an unresolvable "me" fails the tool call before the list request."""
+    stub_api.script("dev-users.self", (500, {"message": "down"}))
+
+    with pytest.raises(ValueError, match="Could not resolve 'me'"):
+        await server.handle_call_tool("list_parts", {"type": "enhancement", "owned_by": ["me"]})
+    assert stub_api.calls("parts.list") == []
+
+
+@pytest.mark.asyncio
+async def test_prefetch_ignores_failures(stub_api):
+    """Test that a failed prefetch does not raise."""
+    stub_api.default = (500, {}, {})
+    await server.prefetch_current_user()
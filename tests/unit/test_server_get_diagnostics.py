@@ -0,0 +1,25 @@
+import json
+
+import pytest
+from devrev_mcp import server, utils
+
+
+@pytest.mark.asyncio
+async def test_get_diagnostics_reports_open_circuit(stub_api, monkeypatch):
+    """Test that an open circuit breaker is visible and produces a clear tool error."""
+    monkeypatch.setenv("DEVREV_RETRY_MAX_ATTEMPTS", "1")
+    monkeypatch.setenv("DEVREV_CIRCUIT_MIN_CALLS", "2")
+    stub_api.default = (503, {"message": "unavailable"}, {})
+
+    for _ in range(2):
+        result = await server.handle_call_tool("get_work", {"id": "work_1"})
+        assert "status 503" in result[0].text
+    with pytest.raises(utils.CircuitOpenError, match="failing fast"):
+        await server.handle_call_tool("get_work", {"id": "work_1"})
+
+    result = await server.handle_call_tool("get_diagnostics", {})
+    assert result[0].text.startswith("Diagnostics:\n")
+    diagnostics = json.loads(result[0].text.split("\n", 1)[1])
+    assert diagnostics["circuit_breakers"]["works"]["state"] == "open"
+    assert diagnostics["circuit_breakers"]["works"]["rejected"] == 1
+    assert set(diagnostics) == {"circuit_breakers", "caches", "disk_cache", "coalescing", "retries", "rate_limits"}
@@ -85,3 +85,26 @@ async def test_get_work_missing_id():
     """Test error handling when id parameter is missing."""
     with pytest.raises(ValueError, match="Missing arguments"):
         await server.handle_call_tool(name="get_work", arguments={})
+
+
+@responses.activate
+@pytest.mark.asyncio
+async def test_get_work_with_fields(valid_work_id):
+    """Test that the fields argument projects the returned work item."""
+    responses.add(
+        responses.POST,
+        "https://api.devrev.ai/works.get",
+        json={"work": {"id": valid_work_id, "display_id": "ISS-1", "title": "Test Work",
+                       "stage": {"name": "triage", "stage": {"id": "stage_1"}}}},
+        status=200
+    )
+
+    result = await server.handle_call_tool(
+        name="get_work",
+        arguments={"id": valid_work_id, "fields": ["display_id", "stage.name"]}
+    )
+
+    assert result[0].text == (
+        f"Object information for '{valid_work_id}':\n"
+        '{"work":{"display_id":"ISS-1","stage":{"name":"triage"}}}'
+    )
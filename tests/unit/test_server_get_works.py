@@ -0,0 +1,73 @@
+import asyncio
+
+import pytest
+from devrev_mcp import server
+
+
+@pytest.mark.asyncio
+async def test_get_works_returns_results_in_input_order(stub_api):
+    """Test that get_works de-duplicates IDs and keeps their input order."""
+    stub_api.delay = 0.02
+
+    result = await server.handle_call_tool(
+        name="get_works",
+        arguments={"ids": ["work_3", "work_1", "work_3", "work_2"]}
+    )
+
+    assert [content.text.split("\n")[0] for content in result] == [
+        "Object information for 'work_3':",
+        "Object information for 'work_1':",
+        "Object information for 'work_2':",
+    ]
+    assert sorted(call["id"] for call in stub_api.calls("works.get")) == ["work_1", "work_2", "work_3"]
+
+
+@pytest.mark.asyncio
+async def test_get_works_reports_per_id_errors(stub_api):
+    """Test that a failing ID does not fail the rest of the batch."""
+    stub_api.script("works.get", (200, {"work": {"id": "work_1"}}), (404, {"error": "Not Found"}))
+
+    result = await server.handle_call_tool(
+        name="get_works",
+        arguments={"ids": ["work_1", "work_2", ""]}
+    )
+
+    assert len(result) == 3
+    assert sum("Object information for" in content.text for content in result) == 1
+    assert sum("Get object failed with status 404" in content.text for content in result) == 1
+    assert result[2].text == "Get object failed for '': Missing id parameter"
+
+
+@pytest.mark.asyncio
+async def test_get_works_bounds_concurrency(stub_api, monkeypatch):
+    """Test that at most DEVREV_MCP_BATCH_CONCURRENCY requests run at once."""
+    monkeypatch.setenv("DEVREV_MCP_BATCH_CONCURRENCY", "2")
+    in_flight = 0
+    peak = 0
+    original = server.handle_get_work
+
+    async def tracking_get_work(arguments):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        try:
+            return await original(arguments)
+        finally:
+            in_flight -= 1
+
+    monkeypatch.setattr(server, "handle_get_work", tracking_get_work)
+    result = await server.handle_call_tool(
+        name="get_works",
+        arguments={"ids": [f"work_{i}" for i in range(6)]}
+    )
+
+    assert len(result) == 6
+    assert peak == 2
+
+
+@pytest.mark.asyncio
+async def test_get_works_missing_ids():
+    """Test error handling when ids parameter is missing."""
+    with pytest.raises(ValueError, match="Missing ids parameter"):
+        await server.handle_call_tool(name="get_works", arguments={"ids": []})
@@ -78,3 +78,29 @@ async def test_list_works_missing_type():
     """Test error handling when type parameter is missing."""
     with pytest.raises(ValueError, match="Missing type parameter"):
         await server.handle_call_tool(name="list_works", arguments={})
+
+
+@responses.activate
+@pytest.mark.asyncio
+async def test_list_works_with_fields_projects_each_item():
+    """Test that the fields argument projects every listed work item and keeps the cursor."""
+    responses.add(
+        responses.POST,
+        "https://api.devrev.ai/works.list",
+        json={"works": [
+            {"display_id": "ISS-1", "title": "One", "owned_by": [{"display_name": "Jane", "id": "devu/1"}]},
+            {"display_id": "ISS-2", "title": "Two", "owned_by": []},
+        ], "next_cursor": "abc"},
+        status=200
+    )
+
+    result = await server.handle_call_tool(
+        name="list_works",
+        arguments={"type": ["issue"], "fields": ["display_id", "owned_by[].display_name"]}
+    )
+
+    assert result[0].text == (
+        'Works listed successfully: {"works":[{"display_id":"ISS-1","owned_by":[{"display_name":"Jane"}]},'
+        '{"display_id":"ISS-2","owned_by":[]}],"next_cursor":"abc"}'
+    )
+    assert "fields" not in responses.calls[0].request.body.decode()
@@ -0,0 +1,163 @@
+import json
+from types import SimpleNamespace
+
+import pytest
+from mcp.server.lowlevel.server import request_ctx
+from devrev_mcp import server
+
+
+def page(start, count, next_cursor=None):
+    body = {"works": [{"display_id": f"ISS-{i}", "title": f"Work {i}"} for i in range(start, start + count)]}
+    if next_cursor:
+        body["next_cursor"] = next_cursor
+    return (200, body)
+
+
+def parse(result):
+    prefix = "Works listed successfully: "
+    assert result[0].text.startswith(prefix)
+    return json.loads(result[0].text[len(prefix):])
+
+
+@pytest.mark.asyncio
+async def test_list_works_all_pages_follows_cursor(stub_api):
+    """Test that all_pages follows next_cursor until the last page."""
+    stub_api.script("works.list", page(0, 2, "c1"), page(2, 2, "c2"), page(4, 1))
+
+    result = await server.handle_call_tool(
+        name="list_works",
+        arguments={"type": ["issue"], "all_pages": True, "fields": ["display_id"]}
+    )
+
+    body = parse(result)
+    assert [work["display_id"] for work in body["works"]] == [f"ISS-{i}" for i in range(5)]
+    assert body["works"][0] == {"display_id": "ISS-0"}
+    assert "next_cursor" not in body
+    calls = stub_api.calls("works.list")
+    assert [call.get("cursor") for call in calls] == [None, "c1", "c2"]
+    assert all(call["mode"] == "after" for call in calls[1:])
+
+
+@pytest.mark.asyncio
+async def test_list_works_max_items_limits_pages(stub_api):
+    """Test that max_items caps the requested page sizes and returns a resumable cursor."""
+    stub_api.script("works.list", page(0, 2, "c1"), page(2, 1, "c2"))
+
+    result = await server.handle_call_tool(
+        name="list_works",
+        arguments={"type": ["issue"], "max_items": 3}
+    )
+
+    body = parse(result)
+    assert len(body["works"]) == 3
+    assert body["next_cursor"] == "c2"
+    assert [call["limit"] for call in stub_api.calls("works.list")] == [3, 1]
+
+
+@pytest.mark.asyncio
+async def test_list_works_all_pages_keeps_cursor_mode(stub_api):
+    """Test that later pages are requested in the mode of the caller's cursor."""
+    stub_api.script("works.list", page(0, 2, "c1"), page(2, 1))
+
+    await server.handle_call_tool(
+        name="list_works",
+        arguments={"type": ["issue"], "all_pages": True, "cursor": {"next_cursor": "c0", "mode": "before"}}
+    )
+
+    calls = stub_api.calls("works.list")
+    assert [call["cursor"] for call in calls] == ["c0", "c1"]
+    assert all(call["mode"] == "before" for call in calls)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("max_items", [0, -5, 2.5, True])
+async def test_list_works_rejects_invalid_max_items(stub_api, max_items):
+    """Test that max_items below 1 or not an integer is rejected without calling the API."""
+    with pytest.raises(ValueError, match="max_items"):
+        await server.handle_call_tool(name="list_works", arguments={"type": ["issue"], "max_items": max_items})
+    assert stub_api.calls("works.list") == []
+
+
+@pytest.mark.asyncio
+async def test_list_works_all_pages_stops_at_byte_budget(stub_api, monkeypatch):
+    """Test that pagination stops once the output byte budget is exceeded."""
+    monkeypatch.setenv("DEVREV_MCP_MAX_OUTPUT_BYTES", "10")
+    stub_api.script("works.list", page(0, 2, "c1"), page(2, 2, "c2"))
+
+    result = await server.handle_call_tool(
+        name="list_works",
+        arguments={"type": ["issue"], "all_pages": True}
+    )
+
+    body = parse(result)
+    assert len(body["works"]) == 2
+    assert body["next_cursor"] == "c1"
+
+
+@pytest.mark.asyncio
+async def test_list_works_all_pages_later_page_error(stub_api):
+    """Test that a failing later page returns the collected items and the error."""
+    stub_api.script("works.list", page(0, 2, "c1"), (500, {"error": "boom"}))
+
+    result = await server.handle_call_tool(
+        name="list_works",
+        arguments={"type": ["issue"], "all_pages": True}
+    )
+
+    body = parse(result)
+    assert len(body["works"]) == 2
+    assert body["next_cursor"] == "c1"
+    assert "failed with status 500" in body["error"]
+
+
+@pytest.mark.asyncio
+async def test_list_works_all_pages_first_page_error(stub_api):
+    """Test that a failing first page reports the usual error."""
+    stub_api.script("works.list", (400, {"error": "bad"}))
+
+    result = await server.handle_call_tool(
+        name="list_works",
+        arguments={"type": ["issue"], "all_pages": True}
+    )
+
+    assert "List works failed with status 400" in result[0].text
+
+
+@pytest.mark.asyncio
+async def test_list_works_all_pages_sends_progress(stub_api):
+    """Test that a progress notification is sent for every page."""
+    stub_api.script("works.list", page(0, 2, "c1"), page(2, 1))
+    notifications = []
+
+    class Session:
+        async def send_progress_notification(self, token, progress, total=None):
+            notifications.append((token, progress, total))
+
+    token = request_ctx.set(SimpleNamespace(meta=SimpleNamespace(progressToken="tok"), session=Session()))
+    try:
+        await server.handle_call_tool(
+            name="list_works",
+            arguments={"type": ["issue"], "all_pages": True}
+        )
+    finally:
+        request_ctx.reset(token)
+
+    assert notifications == [("tok", 2, 500), ("tok", 3, 500)]
+
+
+@pytest.mark.asyncio
+async def test_list_works_all_pages_stops_at_call_deadline(stub_api, monkeypatch):
+    """Test that pagination returns the pages fetched so far once the tool call's deadline runs out."""
+    monkeypatch.setenv("DEVREV_MCP_CALL_DEADLINE", "0.5")
+    stub_api.delay = 0.2
+    stub_api.script("works.list", *(page(2 * i, 2, f"c{i + 1}") for i in range(10)))
+
+    result = await server.handle_call_tool(
+        name="list_works",
+        arguments={"type": ["issue"], "all_pages": True}
+    )
+
+    body = parse(result)
+    assert body["works"]
+    assert body["next_cursor"] == f"c{len(body['works']) // 2}"
+    assert "deadline exceeded" in body["error"]
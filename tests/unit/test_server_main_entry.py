@@ -21,3 +21,14 @@ async def test_server_main_entry(monkeypatch):
     
     # Should not raise any exceptions
     await server.main()
+
+
+def test_parse_args_cache_options():
+    """Test the cache command line options of the package entry point."""
+    import devrev_mcp
+    args = devrev_mcp.parse_args(["--no-cache", "--cache-ttl", "60", "--cache-size", "10", "--cache-dir", "/tmp/c"])
+    assert args.no_cache is True
+    assert args.cache_dir == "/tmp/c"
+    assert args.cache_ttl == 60
+    assert args.cache_size == 10
+    assert devrev_mcp.parse_args([]).no_cache is False
@@ -0,0 +1,127 @@
+import asyncio
+import json
+
+import pytest
+from devrev_mcp import cache, resilience, server
+
+
+WORK = {"id": "don:core:dvrv-us-1:devo/1:issue/1", "display_id": "ISS-1", "title": "Old title"}
+UPDATED = dict(WORK, title="New title")
+
+
+def body(result):
+    return json.loads(result[0].text.split("\n", 1)[1])
+
+
+@pytest.mark.asyncio
+async def test_get_work_is_served_from_cache(stub_api):
+    """Test that repeated reads of one work item make a single works.get request."""
+    stub_api.script("works.get", (200, {"work": WORK}))
+
+    first = await server.handle_call_tool("get_work", {"id": "ISS-1"})
+    second = await server.handle_call_tool("get_work", {"id": "ISS-1"})
+    by_id = await server.handle_call_tool("get_work", {"id": WORK["id"]})
+
+    assert first[0].text == second[0].text
+    assert body(by_id) == {"work": WORK}
+    assert len(stub_api.calls("works.get")) == 1
+
+
+@pytest.mark.asyncio
+async def test_cached_and_coalesced_reads_take_no_rate_limit_token(stub_api, monkeypatch):
+    """Test that only reads sent to the API wait for the rate limiter."""
+    monkeypatch.setenv("DEVREV_RATE_LIMIT", "2")
+    monkeypatch.setenv("DEVREV_RATE_LIMIT_BURST", "1")
+    stub_api.delay = 0.1
+    stub_api.default = (200, {"work": WORK}, {})
+
+    # Concurrent reads share one request; later ones are served from the cache
+    await asyncio.gather(*[server.handle_call_tool("get_work", {"id": "ISS-1"}) for _ in range(3)])
+    for _ in range(3):
+        await server.handle_call_tool("get_work", {"id": "ISS-1"})
+
+    assert len(stub_api.calls("works.get")) == 1
+    assert resilience.rate_limit_stats() == {}
+
+
+@pytest.mark.asyncio
+async def test_update_work_refreshes_cached_work(stub_api):
+    """Test that read, update, read serves the updated work without another works.get."""
+    stub_api.script("works.get", (200, {"work": WORK}))
+    stub_api.script("works.update", (200, {"work": UPDATED}))
+
+    await server.handle_call_tool("get_work", {"id": "ISS-1"})
+    await server.handle_call_tool("update_work", {"id": WORK["id"], "type": "issue", "title": "New title"})
+    result = await server.handle_call_tool("get_work", {"id": "ISS-1"})
+
+    assert body(result) == {"work": UPDATED}
+    assert len(stub_api.calls("works.get")) == 1
+
+
+@pytest.mark.asyncio
+async def test_failed_update_invalidates_cached_work(stub_api):
+    """Test that an update without the object in its response drops the cached work."""
+    stub_api.script("works.get", (200, {"work": WORK}), (200, {"work": UPDATED}))
+    stub_api.script("works.update", (400, {"message": "bad request"}))
+
+    await server.handle_call_tool("get_work", {"id": "ISS-1"})
+    await server.handle_call_tool("update_work", {"id": "ISS-1", "type": "issue", "title": "New title"})
+    result = await server.handle_call_tool("get_work", {"id": "ISS-1"})
+
+    assert body(result) == {"work": UPDATED}
+    assert len(stub_api.calls("works.get")) == 2
+
+
+@pytest.mark.asyncio
+async def test_add_timeline_entry_invalidates_cached_work(stub_api):
+    """Test that a timeline entry on an object drops every cached copy of it."""
+    stub_api.script("works.get", (200, {"work": WORK}), (200, {"work": UPDATED}))
+    stub_api.script("timeline-entries.create", (201, {"timeline_entry": {"id": "entry_1"}}))
+
+    await server.handle_call_tool("get_work", {"id": "ISS-1"})
+    await server.handle_call_tool("add_timeline_entry", {"id": WORK["id"], "timeline_entry": "note"})
+    result = await server.handle_call_tool("get_work", {"id": "ISS-1"})
+
+    assert body(result) == {"work": UPDATED}
+    assert len(stub_api.calls("works.get")) == 2
+
+
+@pytest.mark.asyncio
+async def test_create_work_primes_cache(stub_api):
+    """Test that a created work item can be read back without a works.get request."""
+    stub_api.script("works.create", (201, {"work": WORK}))
+
+    await server.handle_call_tool(
+        "create_work", {"type": "issue", "title": "Old title", "applies_to_part": ["PROD-1"]})
+    result = await server.handle_call_tool("get_work", {"id": "ISS-1"})
+
+    assert result[0].text.startswith("Object information for 'ISS-1'")
+    assert body(result) == {"work": WORK}
+    assert stub_api.calls("works.get") == []
+
+
+@pytest.mark.asyncio
+async def test_update_part_refreshes_cached_part(stub_api):
+    """Test that update_part refreshes the cached part."""
+    part = {"id": "don:core:dvrv-us-1:devo/1:enhancement/1", "display_id": "ENH-1", "name": "Old"}
+    stub_api.script("parts.get", (200, {"part": part}))
+    stub_api.script("parts.update", (200, {"part": dict(part, name="New")}))
+
+    await server.handle_call_tool("get_part", {"id": "ENH-1"})
+    await server.handle_call_tool("update_part", {"id": "ENH-1", "type": "enhancement", "name": "New"})
+    result = await server.handle_call_tool("get_part", {"id": "ENH-1"})
+
+    assert "New" in result[0].text
+    assert len(stub_api.calls("parts.get")) == 1
+
+
+@pytest.mark.asyncio
+async def test_object_cache_respects_cache_switch(stub_api):
+    """Test that disabling the cache sends every read to the API."""
+    cache.configure(enabled=False)
+    stub_api.default = (200, {"work": WORK}, {})
+
+    await server.handle_call_tool("get_work", {"id": "ISS-1"})
+    await server.handle_call_tool("get_work", {"id": "ISS-1"})
+
+    assert len(stub_api.calls("works.get")) == 2
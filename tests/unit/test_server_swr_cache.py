@@ -0,0 +1,108 @@
+import asyncio
+
+import pytest
+from devrev_mcp import disk_cache, server
+
+
+def subtypes(*values):
+    return (200, {"subtypes": [{"value": value} for value in values]})
+
+
+async def list_subtypes():
+    result = await server.handle_call_tool("list_subtypes", {"leaf_type": "issue"})
+    return result[0].text
+
+
+async def settle():
+    """Wait for background refreshes to finish."""
+    while server._swr_fetches:
+        await asyncio.gather(*server._swr_fetches.values(), return_exceptions=True)
+
+
+@pytest.fixture
+def short_ttls(monkeypatch):
+    monkeypatch.setenv("DEVREV_MCP_SWR_SOFT_TTL", "0.1")
+    monkeypatch.setenv("DEVREV_MCP_SWR_HARD_TTL", "0.4")
+
+
+@pytest.mark.asyncio
+async def test_list_subtypes_is_cached(stub_api, short_ttls):
+    """Test that repeated and concurrent calls within the soft TTL share one request."""
+    stub_api.script("schemas.subtypes.list", subtypes("bug"))
+
+    results = await asyncio.gather(*(list_subtypes() for _ in range(3)))
+    results.append(await list_subtypes())
+
+    assert len(set(results)) == 1
+    assert len(stub_api.calls("schemas.subtypes.list")) == 1
+
+
+@pytest.mark.asyncio
+async def test_stale_response_is_served_while_refreshing(stub_api, short_ttls):
+    """Test that after the soft TTL the cached value is returned and refreshed in the background."""
+    stub_api.script("schemas.subtypes.list", subtypes("bug"), subtypes("bug", "task"))
+
+    first = await list_subtypes()
+    await asyncio.sleep(0.15)
+    stale = await list_subtypes()
+    await settle()
+    fresh = await list_subtypes()
+
+    assert stale == first
+    assert '"task"' in fresh
+    assert len(stub_api.calls("schemas.subtypes.list")) == 2
+
+
+@pytest.mark.asyncio
+async def test_failed_refresh_keeps_stale_response(stub_api, short_ttls):
+    """Test that a failing background refresh leaves the cached value in place."""
+    stub_api.script("schemas.subtypes.list", subtypes("bug"), (500, {"message": "down"}))
+
+    first = await list_subtypes()
+    await asyncio.sleep(0.15)
+    await list_subtypes()
+    await settle()
+
+    assert await list_subtypes() == first
+    # The retried refresh outlives the soft TTL, so that call starts another
+    await settle()
+
+
+@pytest.mark.asyncio
+async def test_hard_ttl_expires_response(stub_api, short_ttls):
+    """Test that after the hard TTL the next call waits for a fresh response."""
+    stub_api.script("vistas.groups.list", (200, {"vista_group": [{"id": "s1"}]}), (200, {"vista_group": [{"id": "s2"}]}))
+
+    first = await server.handle_call_tool("get_sprints", {"ancestor_part_id": "PROD-1"})
+    await asyncio.sleep(0.45)
+    second = await server.handle_call_tool("get_sprints", {"ancestor_part_id": "PROD-1"})
+
+    assert '"s1"' in first[0].text
+    assert '"s2"' in second[0].text
+    assert len(stub_api.calls("vistas.groups.list")) == 2
+
+
+@pytest.mark.asyncio
+async def test_refresh_bypasses_disk_cache(stub_api, short_ttls, tmp_path):
+    """Test that a background refresh goes to the API even when the response is on disk."""
+    disk_cache.configure(directory=str(tmp_path))
+    stub_api.script("schemas.subtypes.list", subtypes("bug"), subtypes("bug", "task"))
+
+    await list_subtypes()
+    await asyncio.sleep(0.15)
+    await list_subtypes()
+    await settle()
+
+    assert '"task"' in await list_subtypes()
+    assert len(stub_api.calls("schemas.subtypes.list")) == 2
+
+
+def test_swr_ttls(monkeypatch):
+    """Test default, global and per-endpoint TTLs."""
+    assert server._swr_ttls("schemas.subtypes.list") == (server.DEFAULT_SWR_SOFT_TTL, server.DEFAULT_SWR_HARD_TTL)
+    monkeypatch.setenv("DEVREV_MCP_SWR_SOFT_TTL", "10")
+    monkeypatch.setenv("DEVREV_MCP_SWR_HARD_TTL", "100")
+    monkeypatch.setenv("DEVREV_MCP_SWR_TTLS", "vistas.groups.list=5:50, schemas.subtypes.list=:20")
+    assert server._swr_ttls("vistas.groups.list") == (5, 50)
+    assert server._swr_ttls("schemas.subtypes.list") == (10, 20)
+    assert server._swr_ttls("other") == (10, 100)
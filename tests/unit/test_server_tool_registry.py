@@ -0,0 +1,38 @@
+import mcp.types as types
+import pytest
+from devrev_mcp import server
+
+
+@pytest.mark.asyncio
+async def test_list_tools_returns_registered_tools():
+    """Test that tools/list serves the tool list built at import time."""
+    tools = await server.handle_list_tools()
+    assert tools is server.TOOLS
+    assert [tool.name for tool in tools] == list(server.TOOL_HANDLERS)
+    assert len(tools) == 18
+
+
+@pytest.mark.asyncio
+async def test_call_unknown_tool():
+    """Test error handling when the tool is not registered."""
+    with pytest.raises(ValueError, match="Unknown tool: missing_tool"):
+        await server.handle_call_tool(name="missing_tool", arguments={})
+
+
+def test_duplicate_tool_registration():
+    """Test that a tool name cannot be registered twice."""
+    with pytest.raises(ValueError, match="Duplicate tool: get_work"):
+        server.tool(types.Tool(name="get_work", inputSchema={"type": "object"}))(lambda arguments: None)
+
+
+@pytest.mark.asyncio
+async def test_list_tools_request_is_memoized():
+    """Test that tools/list requests reuse one precomputed result."""
+    handler = server.server.request_handlers[types.ListToolsRequest]
+    request = types.ListToolsRequest(method="tools/list")
+    first = await handler(request)
+    second = await handler(request)
+    assert first is second is server.LIST_TOOLS_RESULT
+    dump = first.model_dump(by_alias=True, mode="json", exclude_none=True)
+    assert dump is second.model_dump(by_alias=True, mode="json", exclude_none=True)
+    assert [tool["name"] for tool in dump["tools"]] == [tool.name for tool in server.TOOLS]
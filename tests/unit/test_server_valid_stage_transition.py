@@ -1,6 +1,6 @@
 import pytest
 import responses
-from devrev_mcp import server
+from devrev_mcp import resilience, server
 
 
 @pytest.fixture(autouse=True)
@@ -53,3 +53,87 @@ async def test_valid_stage_transition_work_not_found():
         arguments={"type": "issue", "id": "work_1"}
     )
     assert any("Get work item failed with status 404" in c.text for c in result)
+
+
+def _add_stage_diagram_responses():
+    responses.add(
+        responses.POST,
+        "https://api.devrev.ai/schemas.aggregated.get",
+        json={"schema": {"stage_diagram_id": {"id": "diagram_1"}}},
+        status=200
+    )
+    responses.add(
+        responses.POST,
+        "https://api.devrev.ai/stage-diagrams.get",
+        json={"stage_diagram": {"stages": [{"stage": {"id": "stage_1"}, "transitions": ["to_stage_2"]}]}},
+        status=200
+    )
+
+
+@responses.activate
+@pytest.mark.asyncio
+async def test_valid_stage_transition_warm_call_only_fetches_work():
+    """Test that a warm call reuses the cached stage diagram for the same leaf type and subtype."""
+    responses.add(
+        responses.POST,
+        "https://api.devrev.ai/works.get",
+        json={"work": {"stage": {"stage": {"id": "stage_1"}}, "type": "issue", "subtype": "subtype_1"}},
+        status=200
+    )
+    _add_stage_diagram_responses()
+
+    await server.handle_call_tool(name="valid_stage_transition", arguments={"type": "issue", "id": "work_1"})
+    assert len(responses.calls) == 3
+
+    result = await server.handle_call_tool(name="valid_stage_transition", arguments={"type": "issue", "id": "work_2"})
+    assert any("Valid Transitions for 'work_2'" in c.text for c in result)
+    assert len(responses.calls) == 4
+    assert responses.calls[3].request.url == "https://api.devrev.ai/works.get"
+
+
+@responses.activate
+@pytest.mark.asyncio
+async def test_valid_stage_transition_failed_schema_is_not_cached():
+    """Test that a failed schema fetch is retried on the next call."""
+    responses.add(
+        responses.POST,
+        "https://api.devrev.ai/works.get",
+        json={"work": {"stage": {"stage": {"id": "stage_1"}}, "type": "issue", "subtype": "subtype_1"}},
+        status=200
+    )
+    responses.add(
+        responses.POST,
+        "https://api.devrev.ai/schemas.aggregated.get",
+        json={"error": "Schema Error"},
+        status=500
+    )
+    result = await server.handle_call_tool(name="valid_stage_transition", arguments={"type": "issue", "id": "work_1"})
+    assert any("Get schema failed with status 500" in c.text for c in result)
+
+    responses.replace(
+        responses.POST,
+        "https://api.devrev.ai/schemas.aggregated.get",
+        json={"schema": {"stage_diagram_id": {"id": "diagram_1"}}},
+        status=200
+    )
+    responses.add(
+        responses.POST,
+        "https://api.devrev.ai/stage-diagrams.get",
+        json={"stage_diagram": {"stages": [{"stage": {"id": "stage_1"}, "transitions": ["to_stage_2"]}]}},
+        status=200
+    )
+    result = await server.handle_call_tool(name="valid_stage_transition", arguments={"type": "issue", "id": "work_1"})
+    assert any("Valid Transitions for 'work_1'" in c.text for c in result)
+
+
+@pytest.mark.asyncio
+async def test_valid_stage_transition_shares_call_deadline(stub_api, monkeypatch):
+    """Test that the work, schema and stage diagram requests spend one deadline."""
+    monkeypatch.setenv("DEVREV_MCP_CALL_DEADLINE", "0.3")
+    stub_api.delay = 0.2
+    stub_api.script("works.get", (200, {"work": {"stage": {"stage": {"id": "stage_1"}}, "type": "issue"}}))
+
+    with pytest.raises(resilience.DeadlineExceededError):
+        await server.handle_call_tool(name="valid_stage_transition", arguments={"type": "issue", "id": "work_1"})
+
+    assert stub_api.calls("stage-diagrams.get") == []
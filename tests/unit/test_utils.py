@@ -1,8 +1,9 @@
 import os
+import time
 import responses
 import requests
 import pytest
-from devrev_mcp import utils
+from devrev_mcp import cache, resilience, utils
 
 
 @pytest.fixture
@@ -23,7 +24,7 @@ def test_make_devrev_request_malformed_response(monkeypatch):
         status_code = 200
         def json(self): raise ValueError("Malformed JSON")
         text = "not json"
-    monkeypatch.setattr(requests, "post", lambda *a, **k: DummyResponse())
+    monkeypatch.setattr(requests.Session, "post", lambda *a, **k: DummyResponse())
     monkeypatch.setenv("DEVREV_API_KEY", "dummy_key")
     resp = utils.make_devrev_request("endpoint", {})
     with pytest.raises(ValueError):
@@ -33,7 +34,7 @@ def test_make_devrev_request_malformed_response(monkeypatch):
 def test_make_devrev_request_timeout(monkeypatch):
     """Test make_devrev_request with timeout error."""
     def raise_timeout(*a, **k): raise requests.Timeout("Timeout!")
-    monkeypatch.setattr(requests, "post", raise_timeout)
+    monkeypatch.setattr(requests.Session, "post", raise_timeout)
     monkeypatch.setenv("DEVREV_API_KEY", "dummy_key")
     with pytest.raises(requests.Timeout):
         utils.make_devrev_request("endpoint", {})
@@ -104,7 +105,7 @@ def test_make_internal_devrev_request_missing_api_key(monkeypatch):
 def test_make_internal_devrev_request_connection_error(monkeypatch):
     """Test make_internal_devrev_request with connection error."""
     def raise_connection_error(*a, **k): raise requests.ConnectionError("Connection error!")
-    monkeypatch.setattr(requests, "post", raise_connection_error)
+    monkeypatch.setattr(requests.Session, "post", raise_connection_error)
     monkeypatch.setenv("DEVREV_API_KEY", "dummy_key")
     with pytest.raises(requests.ConnectionError):
         utils.make_internal_devrev_request("endpoint", {})
@@ -116,8 +117,321 @@ def test_make_internal_devrev_request_malformed_response(monkeypatch):
         status_code = 200
         def json(self): raise ValueError("Malformed JSON")
         text = "not json"
-    monkeypatch.setattr(requests, "post", lambda *a, **k: DummyResponse())
+    monkeypatch.setattr(requests.Session, "post", lambda *a, **k: DummyResponse())
     monkeypatch.setenv("DEVREV_API_KEY", "dummy_key")
     resp = utils.make_internal_devrev_request("endpoint", {})
     with pytest.raises(ValueError):
         resp.json()
+
+
+def test_get_session_is_shared_until_closed():
+    """Test that the pooled session is reused until close_session is called."""
+    utils.close_session()
+    first = utils.get_session()
+    assert utils.get_session() is first
+    utils.close_session()
+    assert utils.get_session() is not first
+    utils.close_session()
+
+
+def test_session_pool_configuration(monkeypatch):
+    """Test that pool sizing is read from the environment."""
+    monkeypatch.setenv("DEVREV_HTTP_POOL_CONNECTIONS", "2")
+    monkeypatch.setenv("DEVREV_HTTP_POOL_MAXSIZE", "8")
+    monkeypatch.setenv("DEVREV_HTTP_POOL_BLOCK", "0")
+    utils.close_session()
+    adapter = utils.get_session().get_adapter("https://api.devrev.ai/works.get")
+    assert adapter._pool_connections == 2
+    assert adapter._pool_maxsize == 8
+    assert adapter._pool_block is False
+    utils.close_session()
+
+
+def test_make_devrev_request_reuses_connection(stub_api):
+    """Test that consecutive requests share one keep-alive connection."""
+    for i in range(3):
+        assert utils.make_devrev_request("works.get", {"id": f"work_{i}"}).status_code == 200
+    assert len(stub_api.connections) == 1
+    assert len(stub_api.calls("works.get")) == 3
+
+
+@responses.activate
+def test_cacheable_endpoint_is_served_from_cache(setup_environment):
+    """Test that cacheable endpoints reuse responses for equal payloads."""
+    responses.add(
+        responses.POST,
+        "https://api.devrev.ai/schemas.aggregated.get",
+        json={"schema": {}},
+        status=200
+    )
+    utils.make_devrev_request("schemas.aggregated.get", {"leaf_type": "issue", "custom_schema_spec": {"subtype": "bug"}})
+    resp = utils.make_devrev_request("schemas.aggregated.get", {"custom_schema_spec": {"subtype": "bug"}, "leaf_type": "issue"})
+    assert resp.json() == {"schema": {}}
+    assert len(responses.calls) == 1
+    assert cache.cache_stats()["responses"]["hits"] == 1
+
+
+@responses.activate
+def test_cacheable_endpoint_error_is_not_cached(setup_environment):
+    """Test that failed responses are not stored in the cache."""
+    responses.add(responses.POST, "https://api.devrev.ai/stage-diagrams.get", json={}, status=500)
+    utils.make_devrev_request("stage-diagrams.get", {"id": "diagram_1"})
+    utils.make_devrev_request("stage-diagrams.get", {"id": "diagram_1"})
+    assert len(responses.calls) == 2
+
+
+@responses.activate
+def test_mutating_endpoint_is_never_cached(setup_environment):
+    """Test that endpoints outside the allowlist always reach the API."""
+    responses.add(responses.POST, "https://api.devrev.ai/works.update", json={}, status=200)
+    utils.make_devrev_request("works.update", {"id": "work_1"})
+    utils.make_devrev_request("works.update", {"id": "work_1"})
+    assert len(responses.calls) == 2
+
+
+@responses.activate
+def test_cache_can_be_disabled(setup_environment, monkeypatch):
+    """Test that DEVREV_MCP_CACHE=0 bypasses the response cache."""
+    monkeypatch.setenv("DEVREV_MCP_CACHE", "0")
+    cache.reset_configuration()
+    responses.add(responses.POST, "https://api.devrev.ai/stage-diagrams.get", json={}, status=200)
+    utils.make_devrev_request("stage-diagrams.get", {"id": "diagram_1"})
+    utils.make_devrev_request("stage-diagrams.get", {"id": "diagram_1"})
+    assert len(responses.calls) == 2
+
+
+def test_single_flight_shares_result_and_exception():
+    """Test that callers of an in-flight key share its result or exception."""
+    import threading
+    import time
+    flight = utils.SingleFlight()
+    release = threading.Event()
+    results = []
+
+    def slow():
+        release.wait(5)
+        return "value"
+
+    threads = [threading.Thread(target=lambda: results.append(flight.do("key", slow))) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    while flight.stats()["coalesced"] < 3:
+        time.sleep(0.001)
+    release.set()
+    for thread in threads:
+        thread.join()
+    assert results == ["value"] * 4
+    assert flight.stats() == {"calls": 1, "coalesced": 3}
+
+    def fail():
+        raise requests.ConnectionError("down")
+
+    with pytest.raises(requests.ConnectionError):
+        flight.do("key", fail)
+    assert flight.do("key", lambda: "again") == "again"
+
+
+def test_single_flight_follower_stops_waiting_at_its_deadline():
+    """Test that a coalesced caller gives up at its deadline while the shared call keeps running."""
+    import threading
+    flight = utils.SingleFlight()
+    started = threading.Event()
+    release = threading.Event()
+    result = []
+
+    def slow():
+        started.set()
+        release.wait(5)
+        return "value"
+
+    leader = threading.Thread(target=lambda: result.append(flight.do("key", slow)))
+    leader.start()
+    started.wait(5)
+    try:
+        with resilience.call_deadline(0.05):
+            with pytest.raises(resilience.DeadlineExceededError):
+                flight.do("key", lambda: "unused")
+    finally:
+        release.set()
+        leader.join()
+    assert result == ["value"]
+
+
+def test_idempotent_request_is_retried_against_stub(stub_api, monkeypatch):
+    """Test that scripted transient failures are retried for idempotent endpoints."""
+    monkeypatch.setenv("DEVREV_RETRY_BACKOFF_BASE", "0.01")
+    stub_api.script("works.get", (503, {}), (429, {}, {"Retry-After": "0"}), (200, {"work": {"id": "work_1"}}))
+
+    resp = utils.make_devrev_request("works.get", {"id": "work_1"})
+
+    assert resp.status_code == 200
+    assert len(stub_api.calls("works.get")) == 3
+
+
+def test_non_idempotent_request_is_not_retried(stub_api):
+    """Test that creating endpoints are never retried."""
+    stub_api.script("works.create", (503, {}))
+
+    resp = utils.make_devrev_request("works.create", {"title": "T"})
+
+    assert resp.status_code == 503
+    assert len(stub_api.calls("works.create")) == 1
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_circuit_breaker_opens_on_error_rate_and_recovers():
+    """Test the closed, open and half-open transitions of a circuit breaker."""
+    clock = FakeClock()
+    breaker = utils.CircuitBreaker("works", min_calls=4, error_rate=0.5, open_seconds=10, clock=clock)
+    for failed in (False, True, False):
+        breaker.before_call()
+        breaker.record(failed, 0.1)
+    assert breaker.state == "closed"
+    breaker.before_call()
+    breaker.record(True, 0.1)
+    assert breaker.state == "open"
+
+    with pytest.raises(utils.CircuitOpenError, match="circuit for 'works' endpoints is open"):
+        breaker.before_call()
+
+    clock.now = 10
+    assert breaker.state == "half_open"
+    breaker.before_call()
+    with pytest.raises(utils.CircuitOpenError):
+        breaker.before_call()
+    breaker.record(False, 0.1)
+    assert breaker.state == "closed"
+    assert breaker.stats()["trips"] == 1
+    assert breaker.stats()["rejected"] == 2
+
+
+def test_circuit_breaker_opens_on_slow_calls_and_failed_probe():
+    """Test that slow calls open the breaker and a failed probe reopens it."""
+    clock = FakeClock()
+    breaker = utils.CircuitBreaker("parts", min_calls=2, slow_call_seconds=1, slow_call_rate=1, open_seconds=5, clock=clock)
+    breaker.record(False, 2)
+    breaker.record(False, 3)
+    assert breaker.state == "open"
+    clock.now = 5
+    breaker.before_call()
+    breaker.record(True, 0.1)
+    assert breaker.state == "open"
+    assert breaker.stats()["trips"] == 2
+
+
+def test_circuit_breaker_window_forgets_old_calls():
+    """Test that failures outside the rolling window are not counted."""
+    clock = FakeClock()
+    breaker = utils.CircuitBreaker("works", window=10, min_calls=2, clock=clock)
+    breaker.record(True, 0.1)
+    clock.now = 11
+    breaker.record(False, 0.1)
+    assert breaker.state == "closed"
+    assert breaker.stats()["window_calls"] == 1
+
+
+def test_circuit_breaker_fails_fast_against_stub(stub_api, monkeypatch):
+    """Test that a failing endpoint family is short-circuited without reaching the API."""
+    monkeypatch.setenv("DEVREV_RETRY_MAX_ATTEMPTS", "1")
+    monkeypatch.setenv("DEVREV_CIRCUIT_MIN_CALLS", "3")
+    stub_api.default = (500, {"message": "down"}, {})
+
+    for _ in range(3):
+        assert utils.make_devrev_request("works.get", {"id": "work_1"}).status_code == 500
+    with pytest.raises(utils.CircuitOpenError):
+        utils.make_devrev_request("works.list", {})
+    assert len(stub_api.requests) == 3
+
+    stub_api.default = (200, {"parts": []}, {})
+    assert utils.make_devrev_request("parts.list", {}).status_code == 200
+    assert utils.circuit_breaker_stats()["works"]["state"] == "open"
+    assert utils.circuit_breaker_stats()["parts"]["state"] == "closed"
+
+
+def test_circuit_breaker_probe_is_released_when_rate_wait_fails(stub_api, monkeypatch):
+    """Test that a half-open probe cut short by the rate limiter lets the next call probe."""
+    monkeypatch.setenv("DEVREV_RETRY_MAX_ATTEMPTS", "1")
+    monkeypatch.setenv("DEVREV_RATE_LIMIT_ENDPOINTS", "works.list=1:1")
+    clock = FakeClock()
+    breaker = utils.CircuitBreaker("works", min_calls=1, open_seconds=10, clock=clock)
+    monkeypatch.setitem(utils._breakers, "works", breaker)
+    stub_api.default = (500, {}, {})
+
+    assert utils.make_devrev_request("works.list", {}).status_code == 500
+    assert breaker.state == "open"
+    clock.now += 10
+    with resilience.call_deadline(0.1):
+        with pytest.raises(resilience.DeadlineExceededError):
+            utils.make_devrev_request("works.list", {})
+
+    assert breaker.state == "half_open"
+    breaker.before_call()
+    assert len(stub_api.calls("works.list")) == 1
+
+
+def test_circuit_breaker_can_be_disabled(stub_api, monkeypatch):
+    """Test that DEVREV_CIRCUIT_BREAKER=0 never short-circuits requests."""
+    monkeypatch.setenv("DEVREV_CIRCUIT_BREAKER", "0")
+    monkeypatch.setenv("DEVREV_RETRY_MAX_ATTEMPTS", "1")
+    monkeypatch.setenv("DEVREV_CIRCUIT_MIN_CALLS", "1")
+    stub_api.default = (500, {}, {})
+
+    for _ in range(3):
+        assert utils.make_devrev_request("works.get", {"id": "work_1"}).status_code == 500
+    assert utils.circuit_breaker_stats() == {}
+
+
+def test_endpoint_family():
+    """Test grouping of API paths into endpoint families."""
+    assert utils.endpoint_family("works.get") == "works"
+    assert utils.endpoint_family("internal/vistas.get") == "vistas"
+    assert utils.endpoint_family("schemas.subtypes.list") == "schemas"
+
+
+def test_request_timeout_defaults_and_overrides(monkeypatch):
+    """Test global and per-endpoint connect and read timeouts."""
+    assert utils.request_timeout("works.get") == (utils.DEFAULT_CONNECT_TIMEOUT, utils.DEFAULT_READ_TIMEOUT)
+    monkeypatch.setenv("DEVREV_HTTP_CONNECT_TIMEOUT", "2")
+    monkeypatch.setenv("DEVREV_HTTP_READ_TIMEOUT", "10")
+    monkeypatch.setenv("DEVREV_HTTP_TIMEOUTS", "works.list=3:60, search.hybrid=:20,bad=x:y")
+    assert utils.request_timeout("works.get") == (2, 10)
+    assert utils.request_timeout("works.list") == (3, 60)
+    assert utils.request_timeout("search.hybrid") == (2, 20)
+
+
+def test_request_timeout_is_bounded_by_call_deadline():
+    """Test that timeouts never outlast the tool call's deadline."""
+    with resilience.call_deadline(1):
+        connect, read = utils.request_timeout("works.get")
+    assert 0 < connect <= 1 and 0 < read <= 1
+    with resilience.call_deadline(0):
+        with pytest.raises(resilience.DeadlineExceededError):
+            utils.request_timeout("works.get")
+
+
+def test_read_timeout_against_stub(stub_api, monkeypatch):
+    """Test that a hung upstream response is abandoned after the read timeout."""
+    monkeypatch.setenv("DEVREV_HTTP_READ_TIMEOUT", "0.1")
+    monkeypatch.setenv("DEVREV_RETRY_MAX_ATTEMPTS", "1")
+    stub_api.delay = 0.5
+
+    with pytest.raises(requests.Timeout):
+        utils.make_devrev_request("works.get", {"id": "work_1"})
+
+
+def test_deadline_cuts_request_short(stub_api):
+    """Test that a request running into the tool call's deadline raises DeadlineExceededError."""
+    stub_api.delay = 0.5
+
+    start = time.monotonic()
+    with resilience.call_deadline(0.1):
+        with pytest.raises(resilience.DeadlineExceededError, match="works.get"):
+            utils.make_devrev_request("works.get", {"id": "work_1"})
+    assert time.monotonic() - start < 0.4
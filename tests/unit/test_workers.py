@@ -0,0 +1,66 @@
+import asyncio
+import json
+import os
+
+import pytest
+from devrev_mcp import workers
+from devrev_mcp.loadgen import DEFAULT_COMMAND, HTTPClient
+
+
+def test_totals_combine_worker_snapshots():
+    """Test that counters are summed and per-process fields are dropped."""
+    snapshots = [
+        {"pid": 1, "updated": 1.0, "http": {"requests": 3, "inflight": 1}, "caches": {"ttl": 60, "hits": 2},
+         "circuit_breakers": {"works.get": "closed"}},
+        {"pid": 2, "updated": 2.0, "http": {"requests": 4, "inflight": 0}, "caches": {"ttl": 60, "hits": 5},
+         "circuit_breakers": {"works.get": "open"}},
+    ]
+    assert workers.totals(snapshots) == {
+        "http": {"requests": 7, "inflight": 1},
+        "caches": {"ttl": 120, "hits": 7},
+        "circuit_breakers": {"works.get": ["closed", "open"]},
+    }
+
+
+def test_snapshots_round_trip(tmp_path, monkeypatch):
+    """Test that snapshots are written to and read back from the state directory."""
+    monkeypatch.setenv("DEVREV_MCP_WORKER_DIR", str(tmp_path))
+    workers.write_snapshot(0, {"http": {"requests": 1}})
+    workers.write_snapshot(1, {"http": {"requests": 2}})
+    (tmp_path / "unrelated.json").write_text("{}")
+
+    assert workers.read_snapshots() == {"worker-0": {"http": {"requests": 1}}, "worker-1": {"http": {"requests": 2}}}
+
+
+def test_snapshots_outside_of_prefork_mode(monkeypatch):
+    """Test that a single process neither writes nor reads snapshots."""
+    monkeypatch.delenv("DEVREV_MCP_WORKER_DIR", raising=False)
+    workers.write_snapshot(0, {"http": {"requests": 1}})
+    assert workers.read_snapshots() == {}
+
+
+@pytest.mark.asyncio
+async def test_workers_serve_and_report_totals(fake_api):
+    """Test that pre-forked workers serve requests, report their totals and exit cleanly on SIGTERM."""
+    env = dict(os.environ, DEVREV_API_BASE_URL=fake_api.url)
+    env.pop("MCP_TEST_MODE", None)
+    client = HTTPClient(DEFAULT_COMMAND, env, workers=2)
+    await client.start()
+    try:
+        work = next(iter(fake_api.dataset.works.values()))
+        for _ in range(10):
+            result = await client.request("tools/call", {"name": "get_work", "arguments": {"id": work["display_id"]}})
+            assert not result["result"]["isError"]
+        # Workers publish their counters about once a second
+        for _ in range(50):
+            result = await client.request("tools/call", {"name": "get_diagnostics", "arguments": {}})
+            diagnostics = json.loads(result["result"]["content"][0]["text"].split("\n", 1)[1])
+            if diagnostics["workers"]["count"] == 2 and diagnostics["workers"]["total"]["http"]["requests"] >= 10:
+                break
+            await asyncio.sleep(0.1)
+    finally:
+        await client.stop()
+
+    assert diagnostics["workers"]["count"] == 2
+    assert diagnostics["workers"]["total"]["http"]["requests"] >= 10
+    assert client.proc.returncode == 0